@@ -67,3 +67,12 @@ define_swagger_auto_schema(
         200: 'File ready to be downloaded',
     }
 )
+
+define_swagger_auto_schema(
+    api_view=views.BillingItemViewSet,
+    method_name='import_billing_items',
+    request_body=serializers.ImportBillingItemsSerializer,
+    responses={
+        201: serializers.BillingItemSerializer(many=True)
+    }
+)
@@ -9,6 +9,7 @@ from .extra import (
 from .invoices import (
     BillingItemSerializer,
     BillingItemShortSerializer,
+    ImportBillingItemsSerializer,
     InvoiceClientOverviewSerializer,
     InvoiceSerializer,
     SendInvoiceSerializer,
@@ -49,6 +50,7 @@ __all__ = (
     'NoteSerializer',
     'BillingItemSerializer',
     'BillingItemShortSerializer',
+    'ImportBillingItemsSerializer',
     'UpdateNoteSerializer',
     'UpdateBillingItemSerializer',
     'LeadSerializer',
@@ -24,7 +24,7 @@ from apps.users.api.serializers import (
 )
 from apps.users.models import Attorney, Client, Enterprise, Invite, Paralegal
 
-from ... import models
+from ... import models, services
 from ...models import Invoice
 from .invoices import InvoiceClientOverviewSerializer
 from .links import ShortActivitySerializer
@@ -131,6 +131,9 @@ class LeadAndClientSerializer(serializers.Serializer):
         return obj.job if isinstance(obj, Client) else obj.role
 
     def get_type(self, obj):
+        # contacts from unified contacts queryset already have type
+        if getattr(obj, 'contact_type', None):
+            return obj.contact_type
         user = self.context['request'].user
         if user.is_attorney and obj.matters.count():
             return 'client'
@@ -147,6 +150,8 @@ class LeadAndClientSerializer(serializers.Serializer):
         return isinstance(obj, Invite)
 
     def get_matters_count(self, obj):
+        if hasattr(obj, 'contact_matters_count'):
+            return obj.contact_matters_count
         return obj.matters.count()
 
     def get_address(self, obj):
@@ -279,33 +284,29 @@ class MatterOverviewClientDashboardSerializer(BaseSerializer):
     unread_message_count = serializers.SerializerMethodField(read_only=True)
     unread_document_count = serializers.SerializerMethodField(read_only=True)
 
+    def get_counters(self, obj) -> services.MatterOverviewCounters:
+        """Get matter's counters calculated for all client's matters.
+
+        Counters can be passed in `matters_counters` context by parent
+        serializer, otherwise they are taken from client's cache.
+
+        """
+        counters = self.context.get('matters_counters')
+        if counters is None:
+            counters = services.get_client_matters_counters(obj.client_id)
+        return counters.get(obj.pk, services.EMPTY_COUNTERS)
+
     def get_due_amount(self, obj):
         """Calculates and returns due amount for a matter."""
-        invoices = obj.invoices.prefetch_related(
-            'billing_items'
-        ).exclude(
-            payment_status='paid'
-        )
-        return sum([invoice.fees_earned for invoice in invoices])
+        return self.get_counters(obj).due_amount
 
     def get_unread_message_count(self, obj):
         """Returns unread message count."""
-        posts = obj.posts.prefetch_related('comments')
-        unread_comment_count = sum(
-            [post.unread_comment_by_client_count for post in posts]
-        )
-        return unread_comment_count
+        return self.get_counters(obj).unread_message_count
 
     def get_unread_document_count(self, obj):
         """Returns unread document count."""
-        count = 0
-        for doc in obj.documents.all():
-            if not doc.seen:
-                count += 1
-        for folder in obj.folders.all():
-            if not folder.seen:
-                count += 1
-        return count
+        return self.get_counters(obj).unread_document_count
 
     def get_stage(self, obj):
         return obj.stage.title if obj.stage else None
@@ -460,36 +461,26 @@ class ClientOverviewSerializer(BaseSerializer):
 
     def get_recent_matters(self, obj):
         user = self.context['request'].user
+        matters = obj.matters.all()
         if user.is_attorney:
-            return MatterOverviewClientDashboardSerializer(
-                obj.matters.filter(attorney=user.attorney).select_related(
-                    'attorney',
-                    'attorney__user',
-                    'stage',
-                    'speciality',
-                    'fee_type',
-                ).prefetch_related(
-                    'shared_with',
-                    'documents',
-                    'folders',
-                ).order_by('-created')[:2],
-                many=True
-            ).data
-        else:
-            return MatterOverviewClientDashboardSerializer(
-                obj.matters.select_related(
-                    'attorney',
-                    'attorney__user',
-                    'stage',
-                    'speciality',
-                    'fee_type',
-                ).prefetch_related(
-                    'shared_with',
-                    'documents',
-                    'folders',
-                ).order_by('-created')[:2],
-                many=True
-            ).data
+            matters = matters.filter(attorney=user.attorney)
+        return MatterOverviewClientDashboardSerializer(
+            matters.select_related(
+                'attorney',
+                'attorney__user',
+                'stage',
+                'speciality',
+                'fee_type',
+            ).prefetch_related(
+                'shared_with',
+            ).order_by('-created')[:2],
+            many=True,
+            context={
+                'matters_counters': services.get_client_matters_counters(
+                    obj.pk
+                ),
+            },
+        ).data
 
     def get_recent_documents(self, obj):
         documents = Document.client_documents(obj).select_related(
@@ -4,6 +4,7 @@ from datetime import date
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 
 from rest_framework import serializers
@@ -143,7 +144,7 @@ class BillingItemSerializer(BaseSerializer):
 
         if attrs.get(
              'billing_type') == models.BillingItem.BILLING_TYPE_EXPENSE:
-            attachments = self.context['request'].data.get('attachments', [])
+            attachments = self.get_attachments(attrs)
             if len(attachments) == 0:
                 raise serializers.ValidationError(
                     'Attachements are required for expenses'
@@ -189,11 +190,21 @@ class BillingItemSerializer(BaseSerializer):
         data['fees'] = amount
         return data
 
+    def get_attachments(self, attrs: dict) -> list:
+        """Get files of billing item's attachments.
+
+        Files are passed in request's data along with billing item's fields.
+
+        """
+        return self.context['request'].data.get('attachments', [])
+
     def create(self, validated_data):
         """Remember current request user as `creator`."""
         validated_data['created_by'] = self.user
+        attachments = self.get_attachments(validated_data)
+        # Files aren't billing item's field, when they are passed in its data
+        validated_data.pop('attachments', None)
         billing_item = super().create(validated_data)
-        attachments = self.context['request'].data.get('attachments', [])
         attachments = [{'file': attachment} for attachment in attachments]
         serializer = AttachmentSerializer(data=attachments, many=True)
         serializer.is_valid(raise_exception=True)
@@ -216,6 +227,56 @@ class BillingItemSerializer(BaseSerializer):
         return super().update(instance, validated_data)
 
 
+class ImportedBillingItemSerializer(BillingItemSerializer):
+    """Serializer for billing item created by import.
+
+    Files of item's attachments are passed in item's data, since request's
+    data contains all imported items.
+
+    """
+    attachments = serializers.ListField(
+        child=serializers.CharField(),
+        write_only=True,
+        required=False,
+    )
+
+    class Meta(BillingItemSerializer.Meta):
+        relations = (
+            'attachments',
+        )
+
+    def get_attachments(self, attrs: dict) -> list:
+        """Get files of attachments from item's data."""
+        return attrs.get('attachments', [])
+
+
+class ImportBillingItemsSerializer(serializers.Serializer):
+    """Serializer to create many billing items at once.
+
+    Attachments of items to invoices are reconciled once for all imported
+    items after transaction commit.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Restrict items' matters and invoices to available for user ones.
+
+        Items serializer is created here, so it gets context with user.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.fields['billing_items'] = ImportedBillingItemSerializer(
+            many=True, allow_empty=False, context=self.context
+        )
+
+    def create(self, validated_data):
+        """Create billing items with deferred attachments reconciliation."""
+        billing_items = self.fields['billing_items']
+        with transaction.atomic(), \
+                services.deferred_billing_items_reconciliation():
+            return billing_items.create(validated_data['billing_items'])
+
+
 class BillingItemShortSerializer(BillingItemSerializer):
     """BillingItemShortSerializer for display"""
 
@@ -297,6 +358,9 @@ class InvoiceSerializer(BaseSerializer):
     )
     title = serializers.SerializerMethodField(read_only=True)
     billable_sum = serializers.SerializerMethodField(read_only=True)
+    total_amount = serializers.ReadOnlyField()
+    time_billed = serializers.ReadOnlyField()
+    fees_earned = serializers.ReadOnlyField()
 
     class Meta:
         model = models.Invoice
@@ -601,12 +601,11 @@ class MatterOverviewSerializer(BaseSerializer):
     )
 
     def get_due_amount(self, obj):
-        invoices = obj.invoices.prefetch_related(
-            'billing_items'
-        ).exclude(
+        return obj.invoices.exclude(
             payment_status='paid'
-        )
-        return sum([invoice.fees_earned for invoice in invoices])
+        ).aggregate(
+            due_amount=Sum('fees_earned')
+        )['due_amount'] or 0
 
     def get_due_date(self, obj):
         invoice_with_earliest_date = obj.invoices.filter(
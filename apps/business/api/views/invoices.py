@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.db.models import Q
 from django.utils import timezone
@@ -14,15 +14,19 @@ from django_fsm import TransitionNotAllowed
 from libs.django_fcm.exceptions import TransitionFailedException
 
 from ....core.api import views
-from ... import models
+from ... import models, services
 from ...services import clone_invoice
 from .. import filters, pagination, permissions, serializers
-from ..serializers.invoices import TimeEntrySerializer
 from .core import BusinessViewSetMixin
 
 logger = logging.getLogger('django')
 
 
+def format_elapsed_time(elapsed_time: timedelta) -> str:
+    """Format elapsed time of timer without microseconds."""
+    return str(elapsed_time).split('.')[0]
+
+
 class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
     """CRUD api viewset for BillingItem model."""
     queryset = models.BillingItem.objects.select_related(
@@ -50,6 +54,7 @@ class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
     )
     permissions_map = {
         'create': (BusinessViewSetMixin.support_permissions,),
+        'import_billing_items': (BusinessViewSetMixin.support_permissions,),
         'update': can_edit_permissions,
         'partial_update': can_edit_permissions,
         'destroy': can_edit_permissions,
@@ -84,6 +89,28 @@ class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
         qs = qs.filter(pk__in=empty_billing_ids)
         return qs
 
+    @action(methods=['POST'], detail=False, url_path='import')
+    def import_billing_items(self, request, *args, **kwargs):
+        """Create many billing items at once.
+
+        Attachments of items to invoices are reconciled in background after
+        all items are created.
+
+        """
+        serializer = serializers.ImportBillingItemsSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        billing_items = serializer.save()
+        return Response(
+            data=serializers.BillingItemSerializer(
+                billing_items,
+                many=True,
+                context=self.get_serializer_context(),
+            ).data,
+            status=status.HTTP_201_CREATED
+        )
+
     @action(methods=['POST'], detail=False)
     def start_timer(self, request, *args, **kwargs):
         """Starts timer for the logged in user."""
@@ -98,27 +125,15 @@ class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
             start_time = timezone.now() - timezone.timedelta(
                 hours=t.hour, minutes=t.minute, seconds=t.second
             )
-        time_entry = models.TimeEntry.get_running_time_entry(request.user)
-        if time_entry is None:
-            time_entry = TimeEntrySerializer(
-                data={
-                    'created_by': request.user.id,
-                    'start_time': start_time
-                }
-            )
-            time_entry.is_valid(raise_exception=True)
-            time_entry.save()
-        elif time_entry and start_time_str:
-            time_entry.start_time = start_time
-            time_entry.save()
-
-        elapsed_time, _ = models.TimeEntry.elapsed_time_without_microseconds(
-            request.user
-        )
+        state = services.get_timer_state(request.user.pk)
+        if start_time_str or state.started_at is None:
+            services.start_timer(request.user, start_time)
+
+        elapsed_time, _ = services.get_elapsed_time(request.user)
 
         return Response(
             {
-                'elapsed_time': elapsed_time
+                'elapsed_time': format_elapsed_time(elapsed_time)
             },
             status=status.HTTP_201_CREATED
         )
@@ -126,21 +141,17 @@ class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
     @action(methods=['POST'], detail=False)
     def stop_timer(self, request, *args, **kwargs):
         """Stops timer for the logged in user."""
-        time_entry = models.TimeEntry.get_running_time_entry(request.user)
+        time_entry = services.stop_timer(request.user)
         if time_entry is None:
             return Response(
                 {"error": "Timer needs to be started before stopping."},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        time_entry.end_time = timezone.now()
-        time_entry.save()
-        elapsed_time, _ = models.TimeEntry.elapsed_time_without_microseconds(
-            request.user
-        )
+        elapsed_time, _ = services.get_elapsed_time(request.user)
 
         return Response(
             {
-                'elapsed_time': elapsed_time
+                'elapsed_time': format_elapsed_time(elapsed_time)
             },
             status=status.HTTP_202_ACCEPTED
         )
@@ -155,15 +166,11 @@ class BillingItemViewSet(BusinessViewSetMixin, views.CRUDViewSet):
     @action(methods=['GET'], detail=False)
     def get_current_elapsed_time(self, request, *args, **kwargs):
         """Returns elapsed time at the moment."""
-        elapsed_time, is_running = (
-                models.TimeEntry.elapsed_time_without_microseconds(
-                   request.user
-                )
-        )
+        elapsed_time, is_running = services.get_elapsed_time(request.user)
 
         return Response(
             {
-                'elapsed_time': elapsed_time,
+                'elapsed_time': format_elapsed_time(elapsed_time),
                 'status': 'running' if is_running else 'stopped'
             },
             status=status.HTTP_200_OK
@@ -188,7 +195,7 @@ class InvoiceViewSet(BusinessViewSetMixin, views.CRUDViewSet):
         'billing_items__billed_by',
         'activities',
         'logs',
-    ).with_fees_earned().with_time_billed()
+    )
 
     can_edit_permissions = (
         BusinessViewSetMixin.attorney_support_permissions,
@@ -227,34 +234,9 @@ class InvoiceViewSet(BusinessViewSetMixin, views.CRUDViewSet):
         'due_date',
         'matter__title',
         'matter__client__organization_name',
+        'total_amount',
     )
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-        else:
-            serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        fields = request.query_params.getlist('ordering', [])
-        for field in fields:
-            if 'total_amount' in field:
-                reverse = False
-                if field.startswith('-'):
-                    reverse = True
-                    field = field[1:]
-                data = sorted(
-                    data,
-                    key=lambda k: (k[field] is not None, k[field]),
-                    reverse=reverse
-                )
-        if page is not None:
-            return self.get_paginated_response(data)
-        else:
-            return Response(data)
-
     def create(self, request, *args, **kwargs):
         try:
             serializer = serializers.InvoiceSerializer(
@@ -127,7 +127,6 @@ class MatterViewSet(BusinessViewSetMixin, views.CRUDViewSet):
         'posts',
         'posts__participants',
         'invoices',
-        'invoices__billing_items',
     )
     serializer_class = serializers.MatterSerializer
     transition_result_serializer_class = serializers.MatterSerializer
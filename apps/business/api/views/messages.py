@@ -4,7 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from ....core.api import views
-from ... import models
+from ... import models, services
 from .. import filters, serializers
 from .core import BusinessViewSetMixin
 
@@ -64,6 +64,8 @@ class MatterPostViewSet(
                 seen_by_client=True
             )
             post.comments.update(seen_by_client=True)
+            if post.matter_id:
+                services.invalidate_client_overview(post.matter.client_id)
         elif request.user.is_attorney:
             models.MatterPost.objects.filter(pk=post.pk).update(seen=True)
             post.comments.update(seen=True)
@@ -78,6 +80,8 @@ class MatterPostViewSet(
                 seen_by_client=False
             )
             post.comments.update(seen_by_client=False)
+            if post.matter_id:
+                services.invalidate_client_overview(post.matter.client_id)
         elif request.user.is_attorney:
             models.MatterPost.objects.filter(pk=post.pk).update(seen=False)
             post.comments.update(seen=False)
@@ -141,9 +145,11 @@ class MatterCommentViewSet(
     def list(self, request, *args, **kwargs):
         post_id = request.query_params.get('post')
         if request.user.is_client:
-            models.MatterPost.objects.filter(id=post_id).update(
+            updated = models.MatterPost.objects.filter(id=post_id).update(
                 seen_by_client=True,
             )
+            if updated:
+                services.invalidate_posts_clients_overview(post_id)
         elif request.user.is_attorney:
             models.MatterPost.objects.filter(id=post_id).update(
                 seen=True,
@@ -169,6 +175,7 @@ class MatterCommentViewSet(
             models.MatterComment.objects.filter(pk=comment.pk).update(
                 seen_by_client=True
             )
+            services.invalidate_posts_clients_overview(comment.post_id)
         elif request.user.is_attorney:
             models.MatterComment.objects.filter(pk=comment.pk).update(
                 seen=True
@@ -186,6 +193,7 @@ class MatterCommentViewSet(
             models.MatterPost.objects.filter(pk=comment.post.pk).update(
                 seen_by_client=False,
             )
+            services.invalidate_posts_clients_overview(comment.post_id)
         elif request.user.is_attorney:
             models.MatterComment.objects.filter(pk=comment.pk).update(
                 seen=False
@@ -0,0 +1,80 @@
+import datetime
+
+from django.db import migrations, models
+from django.db.models import (
+    Case,
+    DecimalField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Func,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Extract
+
+
+def fill_invoices_totals(apps, schema_editor):
+    """Calculate totals of existing invoices from their billing items."""
+    Invoice = apps.get_model('business', 'Invoice')
+    BillingItem = apps.get_model('business', 'BillingItem')
+    billing_items = BillingItem.objects.filter(
+        billing_items_invoices=OuterRef('pk')
+    ).order_by()
+    time_fee = ExpressionWrapper(
+        F('hourly_rate') * Extract('time_spent', 'epoch') / 3600,
+        output_field=FloatField()
+    )
+    fee = Coalesce(
+        Case(
+            When(billing_type='time', then=time_fee),
+            default=F('total_amount'),
+            output_field=FloatField()
+        ),
+        Value(0),
+        output_field=FloatField()
+    )
+    fees = Subquery(
+        billing_items.values(total=Func(fee, function='SUM')),
+        output_field=DecimalField()
+    )
+    time_spent = Subquery(
+        billing_items.values(total=Func(F('time_spent'), function='SUM')),
+        output_field=DurationField()
+    )
+    Invoice.objects.update(
+        total_amount=Coalesce(fees, 0),
+        fees_earned=Coalesce(fees, 0),
+        time_billed=Coalesce(time_spent, datetime.timedelta()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('business', '0089_auto_20220428_0611'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invoice',
+            name='fees_earned',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, help_text='Sum of fees of billing items', max_digits=10, verbose_name='Fees earned'),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='time_billed',
+            field=models.DurationField(default=datetime.timedelta, editable=False, help_text='Sum of spent time of billing items', verbose_name='Time billed'),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, help_text='Sum of fees of billing items', max_digits=10, verbose_name='Total amount'),
+        ),
+        migrations.RunPython(
+            fill_invoices_totals, migrations.RunPython.noop
+        ),
+    ]
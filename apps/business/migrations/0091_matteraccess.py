@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_matters_access(apps, schema_editor):
+    """Build access index of existing matters."""
+    Matter = apps.get_model('business', 'Matter')
+    MatterSharedWith = apps.get_model('business', 'MatterSharedWith')
+    MatterAccess = apps.get_model('business', 'MatterAccess')
+    sources = (
+        ('attorney', Matter.objects.filter(attorney__isnull=False)
+         .values_list('pk', 'attorney_id')),
+        ('client', Matter.objects.filter(client__isnull=False)
+         .values_list('pk', 'client_id')),
+        ('referral', Matter.objects.filter(referral__isnull=False)
+         .values_list('pk', 'referral__attorney_id')),
+        ('shared', MatterSharedWith.objects.values_list('matter_id', 'user_id')),
+    )
+    for kind, rows in sources:
+        MatterAccess.objects.bulk_create(
+            (
+                MatterAccess(matter_id=matter_id, user_id=user_id, kind=kind)
+                for matter_id, user_id in rows.iterator()
+            ),
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('business', '0090_invoice_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatterAccess',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('attorney', 'Attorney'), ('client', 'Client'), ('referral', 'Referral'), ('shared', 'Shared')], max_length=10, verbose_name='Kind')),
+                ('matter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access', to='business.Matter', verbose_name='Matter')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matters_access', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Matter Access',
+                'verbose_name_plural': 'Matters Access',
+                'unique_together': {('user', 'matter', 'kind')},
+            },
+        ),
+        migrations.RunPython(
+            fill_matters_access, reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -11,6 +11,7 @@ from .links import (
     Activity,
     InvoiceActivity,
     InvoiceLog,
+    MatterAccess,
     MatterSharedWith,
     Note,
     VoiceConsent,
@@ -42,5 +43,6 @@ __all__ = (
     'MatterComment',
     'VideoCall',
     'MatterSharedWith',
+    'MatterAccess',
     'PaymentMethods'
 )
@@ -2,11 +2,12 @@ import datetime
 import logging
 import traceback
 from datetime import timedelta
-from decimal import Decimal
 
 from django.core import validators
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Count, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -239,19 +240,23 @@ class TimeEntry(BaseModel):
 
     @classmethod
     def calculate_elapsed_time(cls, created_by):
-        time_entries = cls.objects.filter(
+        """Calculate elapsed time of user's not billed entries by one query.
+
+        Running entries are counted till current moment.
+
+        """
+        result = cls.objects.filter(
             created_by=created_by,
             billing_item__isnull=True
+        ).aggregate(
+            time_elapsed=Sum(ExpressionWrapper(
+                Coalesce('end_time', Now()) - F('start_time'),
+                output_field=models.DurationField()
+            )),
+            running_count=Count('pk', filter=Q(end_time__isnull=True)),
         )
-        is_running = False
-        time_elapsed = timedelta()
-        for time_entry in time_entries:
-            start = time_entry.start_time
-            end = time_entry.end_time or timezone.now()
-            time_elapsed += end - start
-            if time_entry.end_time is None:
-                is_running = True
-        return time_elapsed, is_running
+        time_elapsed = result['time_elapsed'] or timedelta()
+        return time_elapsed, result['running_count'] > 0
 
     @classmethod
     def elapsed_time_without_microseconds(cls, created_by):
@@ -380,6 +385,9 @@ class Invoice(AbstractPaidObject, DirtyFieldsMixin, BaseModel):
         finalized (datetime): timestamp when instance was finalized
         activities (InvoiceActivity): activities of invoice
         logs (InvoiceLog): logs of invoice
+        total_amount (decimal): sum of fees of billing items
+        time_billed (timedelta): sum of spent time of billing items
+        fees_earned (decimal): sum of fees of billing items
     """
     number = models.CharField(
         verbose_name=_('Invoice Number'),
@@ -524,6 +532,31 @@ class Invoice(AbstractPaidObject, DirtyFieldsMixin, BaseModel):
         default=None
     )
 
+    # totals of billing items, kept in sync by signals (see
+    # `InvoiceQuerySet.update_totals`)
+    total_amount = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        verbose_name=_('Total amount'),
+        help_text=_('Sum of fees of billing items')
+    )
+    time_billed = models.DurationField(
+        default=timedelta,
+        editable=False,
+        verbose_name=_('Time billed'),
+        help_text=_('Sum of spent time of billing items')
+    )
+    fees_earned = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        verbose_name=_('Fees earned'),
+        help_text=_('Sum of fees of billing items')
+    )
+
     objects = InvoiceQuerySet.as_manager()
 
     class Meta:
@@ -533,28 +566,6 @@ class Invoice(AbstractPaidObject, DirtyFieldsMixin, BaseModel):
     def __str__(self):
         return self.title
 
-    @property
-    def total_amount(self) -> Decimal:
-        amount = 0
-        for item in self.billing_items.all():
-            amount += float(item.fee)
-        return amount
-
-    @property
-    def time_billed(self) -> timedelta:
-        """Returns sum of jobs spent times."""
-        time_billed = timedelta()
-        for obj in self.billing_items.all():
-            if obj.time_spent:
-                time_billed += obj.time_spent
-        return time_billed
-
-    @property
-    def fees_earned(self) -> float:
-        """Returns sum of jobs fees."""
-        fees = sum([obj.fee for obj in self.billing_items.all()])
-        return fees
-
     @property
     def can_be_paid(self) -> bool:
         """Check if it's possible to pay for invoice."""
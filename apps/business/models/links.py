@@ -13,7 +13,8 @@ __all__ = (
     'Activity',
     'Note',
     'VoiceConsent',
-    'MatterSharedWith'
+    'MatterSharedWith',
+    'MatterAccess',
 )
 
 
@@ -246,6 +247,61 @@ class MatterSharedWith(BaseModel):
         return f'Shared with ({self.pk}) @ {self.matter}'
 
 
+class MatterAccess(models.Model):
+    """MatterAccess model.
+
+    Index of users' access to matters, it's denormalized from matter's
+    `attorney`, `client`, `referral` and `shared_with` fields and is kept in
+    sync by signals (see `apps.business.signals.access`). It's used to
+    filter matters available for user by one indexed lookup instead of ORed
+    filters over all of these fields.
+
+    Attributes:
+        user (AppUser): Link to user, which has access to matter
+        matter (Matter): Link to matter, which is accessible by user
+        kind (str): Reason of access - user is matter's attorney, client,
+            referred attorney or matter is shared with user
+
+    """
+    KIND_ATTORNEY = 'attorney'
+    KIND_CLIENT = 'client'
+    KIND_REFERRAL = 'referral'
+    KIND_SHARED = 'shared'
+
+    KIND_CHOICES = (
+        (KIND_ATTORNEY, _('Attorney')),
+        (KIND_CLIENT, _('Client')),
+        (KIND_REFERRAL, _('Referral')),
+        (KIND_SHARED, _('Shared')),
+    )
+
+    user = models.ForeignKey(
+        to='users.AppUser',
+        on_delete=models.CASCADE,
+        related_name='matters_access',
+        verbose_name=_('User'),
+    )
+    matter = models.ForeignKey(
+        to='Matter',
+        on_delete=models.CASCADE,
+        related_name='access',
+        verbose_name=_('Matter'),
+    )
+    kind = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        verbose_name=_('Kind'),
+    )
+
+    class Meta:
+        verbose_name = _('Matter Access')
+        verbose_name_plural = _('Matters Access')
+        unique_together = ('user', 'matter', 'kind')
+
+    def __str__(self):
+        return f'{self.kind} access of {self.user_id} @ {self.matter_id}'
+
+
 class InvoiceActivity(BaseModel):
     """Invoice Activity model
 
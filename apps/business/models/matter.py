@@ -251,6 +251,9 @@ class Matter(BaseModel):
         STATUS_CLOSE: 'close',
     }
 
+    # Id of `hourly` fee kind
+    FEE_TYPE_HOURLY_ID = 3
+
     lead = models.ForeignKey(
         'business.Lead',
         # matter can exist without a lead, so it can be easily deleted
@@ -607,7 +610,7 @@ class Matter(BaseModel):
     @property
     def is_hourly_rated(self) -> bool:
         """Returns flag if matter has `hourly` `rate_type`."""
-        return self.fee_type is not None and self.fee_type.id == 3
+        return self.fee_type_id == self.FEE_TYPE_HOURLY_ID
 
     def save(self, **kwargs):
         """Save code as upper case."""
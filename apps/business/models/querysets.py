@@ -6,17 +6,27 @@ from django.db.models import (
     Case,
     Count,
     DecimalField,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
     F,
+    FloatField,
+    Func,
+    OuterRef,
     Q,
+    Subquery,
     Sum,
+    Value,
     When,
 )
+from django.db.models.functions import Coalesce, Extract
 from django.db.models.query import QuerySet
 
 from ...finance.models.payments.querysets import AbstractPaidObjectQuerySet
 from ...users import models as user_models
 
 __all__ = (
+    'get_available_matters_filter',
     'UserRelatedQuerySet',
     'MatterRelatedQuerySet',
     'LeadQuerySet',
@@ -32,6 +42,39 @@ __all__ = (
 )
 
 
+def get_available_matters_filter(
+    user: user_models.AppUser, matter_field: str = 'pk'
+) -> Exists:
+    """Get filter of instances related to matters available for user.
+
+    Matters available for user are the ones where user is attorney(client
+    for not attorneys), referred attorney or with which matter is shared.
+    They are looked up in `MatterAccess` index by `(user, matter, kind)`, so
+    db uses semi-join by index instead of ORed filters and subqueries.
+
+    Arguments:
+        user: user, for which instances are filtered
+        matter_field: field of filtered model, which refers to matter
+
+    """
+    from . import MatterAccess
+    owner_kind = (
+        MatterAccess.KIND_ATTORNEY if user.is_attorney
+        else MatterAccess.KIND_CLIENT
+    )
+    return Exists(
+        MatterAccess.objects.filter(
+            user_id=user.pk,
+            matter_id=OuterRef(matter_field),
+            kind__in=(
+                owner_kind,
+                MatterAccess.KIND_REFERRAL,
+                MatterAccess.KIND_SHARED,
+            ),
+        )
+    )
+
+
 class UserRelatedQuerySet(QuerySet):
     """Queryset class which provides `available_for_user` filtration.
 
@@ -54,23 +97,8 @@ class UserRelatedQuerySet(QuerySet):
             client.
 
         """
-        # Fix for swagger spec
-        # if user.user_type == user_models.AppUser.USER_TYPE_STAFF:
-        #     return self
         lookup = 'attorney' if user.is_attorney else 'client'
-        try:
-            return self.filter(
-                Q(**{lookup: user.pk}) |
-                Q(**{'referral__attorney': user.pk}) |
-                Q(**{'shared_with__in': [user]})
-            )
-        except Exception:
-            try:
-                return self.filter(
-                    Q(**{lookup: user.pk}) | Q(**{'shared_with__in': [user]})
-                )
-            except Exception:
-                return self.filter(**{lookup: user.pk})
+        return self.filter(**{lookup: user.pk})
 
 
 class MatterRelatedQuerySet(QuerySet):
@@ -94,9 +122,7 @@ class MatterRelatedQuerySet(QuerySet):
             matters where user is client.
 
         """
-        from . import Matter
-        available_matters = Matter.objects.all().available_for_user(user)
-        return self.filter(matter__in=available_matters)
+        return self.filter(get_available_matters_filter(user, 'matter'))
 
 
 class OpportunityQuerySet(UserRelatedQuerySet):
@@ -127,24 +153,13 @@ class MatterQuerySet(UserRelatedQuerySet):
 
         Cases:
             1. Request user is attorney - filter only instances where user is
-            attorney or matters shared with user (except matters in `pending`
-            or `draft` states cause they can't be shared).
+            attorney or referred attorney or matters shared with user.
 
             2. Request user is client - filter only instances where user is
-            client.
+            client or matters shared with user.
 
         """
-        from ..models import Matter
-        qs = super().available_for_user(user)
-        if user.is_staff:
-            return qs
-
-        shared_matters = user.shared_matters.exclude(
-            status__in=[Matter.STATUS_OPEN]
-        )
-        return self.filter(
-            Q(id__in=qs.values('id')) | Q(id__in=shared_matters)
-        )
+        return self.filter(get_available_matters_filter(user))
 
     def open(self):
         """Shortcut to get only `open` matters."""
@@ -156,7 +171,7 @@ class MatterQuerySet(UserRelatedQuerySet):
         """Shortcut to get only `hourly` rated matters."""
         # import here because of cyclic dependency
         from . import Matter
-        return self.filter(rate_type=Matter.RATE_TYPE_HOURLY)
+        return self.filter(fee_type_id=Matter.FEE_TYPE_HOURLY_ID)
 
     def with_invoices_num(self):
         """Annotate each Matter with invoices count."""
@@ -294,6 +309,33 @@ class BillingItemQuerySet(MatterRelatedQuerySet):
 
         return str(time_spent)
 
+    def with_fee(self):
+        """Add annotation with fee of billing item.
+
+        Fee is calculated the same way as in `BillingItem.fee`: by hourly rate
+        and spent time for time entries and by total amount for others.
+
+        """
+        from . import BillingItem
+        time_fee = ExpressionWrapper(
+            F('hourly_rate') * Extract('time_spent', 'epoch') / 3600,
+            output_field=FloatField()
+        )
+        return self.annotate(
+            _fee=Coalesce(
+                Case(
+                    When(
+                        billing_type=BillingItem.BILLING_TYPE_TIME,
+                        then=time_fee,
+                    ),
+                    default=F('total_amount'),
+                    output_field=FloatField()
+                ),
+                Value(0),
+                output_field=FloatField()
+            )
+        )
+
     def available_for_editing(self):
         """Filter tb that can be edited.
 
@@ -380,6 +422,37 @@ class InvoiceQuerySet(AbstractPaidObjectQuerySet, MatterRelatedQuerySet):
             payment_status__in=Invoice.AVAILABLE_FOR_EDITING_STATUSES
         )
 
+    def update_totals(self) -> int:
+        """Recalculate stored totals of invoices from their billing items.
+
+        Totals of all invoices in qs are updated with single UPDATE query.
+
+        Returns:
+            number of updated invoices
+
+        """
+        from . import BillingItem
+        billing_items = BillingItem.objects.filter(
+            billing_items_invoices=OuterRef('pk')
+        ).order_by()
+        fees = Subquery(
+            billing_items.with_fee().values(
+                total=Func(F('_fee'), function='SUM')
+            ),
+            output_field=DecimalField()
+        )
+        time_spent = Subquery(
+            billing_items.values(
+                total=Func(F('time_spent'), function='SUM')
+            ),
+            output_field=DurationField()
+        )
+        return self.order_by().update(
+            total_amount=Coalesce(fees, 0),
+            fees_earned=Coalesce(fees, 0),
+            time_billed=Coalesce(time_spent, timedelta()),
+        )
+
     def with_fees_earned(self):
         """Calculate earned fees for invoices."""
         return self.annotate(
@@ -405,9 +478,7 @@ class MatterCommentQuerySet(MatterRelatedQuerySet):
 
     def available_for_user(self, user: user_models.AppUser):
         """Filter comments according to available matters to user."""
-        from . import Matter
-        available_matters = Matter.objects.all().available_for_user(user)
-        return self.filter(post__matter__in=available_matters)
+        return self.filter(get_available_matters_filter(user, 'post__matter'))
 
 
 class NoteQuerySet(MatterRelatedQuerySet):
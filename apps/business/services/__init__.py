@@ -1,13 +1,17 @@
+from .access import update_matters_access
 from .invoices import (
     clone_invoice,
     create_draft_invoice,
     create_invoice_item,
+    create_matters_invoices,
+    generate_period_invoices,
     get_invoice_for_matter,
     get_invoice_period_ranges,
     get_invoice_period_str_representation,
     get_or_create_invoice_payment,
     pay_invoice,
     prepare_invoice_for_payment,
+    reconcile_invoices_totals,
     send_invoice,
     send_invoice_to_recipients,
 )
@@ -21,6 +25,13 @@ from .messages import (
     set_matter_post_comment_count,
     set_matter_post_last_comment,
 )
+from .overview import (
+    EMPTY_COUNTERS,
+    MatterOverviewCounters,
+    get_client_matters_counters,
+    invalidate_client_overview,
+    invalidate_posts_clients_overview,
+)
 from .statistics import (
     get_attorney_period_statistic,
     get_attorney_statistics,
@@ -28,10 +39,24 @@ from .statistics import (
 )
 from .time_billings import (
     attach_time_billings_to_invoice,
+    deferred_billing_items_reconciliation,
     get_time_billing_for_time_period,
+    mark_billing_item_dirty,
+    reconcile_billing_items_attachments,
+)
+from .timers import (
+    TimerState,
+    drop_timer_state,
+    get_elapsed_time,
+    get_timer_state,
+    reconcile_timers_states,
+    start_timer,
+    stop_timer,
 )
 
 __all__ = (
+    'EMPTY_COUNTERS',
+    'MatterOverviewCounters',
     'get_matter_shared_folder',
     'get_invoice_for_matter',
     'get_invoice_period_ranges',
@@ -53,5 +78,22 @@ __all__ = (
     'create_draft_invoice',
     'send_invoice',
     'pay_invoice',
-    'clone_invoice'
+    'clone_invoice',
+    'reconcile_invoices_totals',
+    'update_matters_access',
+    'get_client_matters_counters',
+    'invalidate_client_overview',
+    'invalidate_posts_clients_overview',
+    'generate_period_invoices',
+    'create_matters_invoices',
+    'deferred_billing_items_reconciliation',
+    'mark_billing_item_dirty',
+    'reconcile_billing_items_attachments',
+    'TimerState',
+    'get_timer_state',
+    'get_elapsed_time',
+    'start_timer',
+    'stop_timer',
+    'drop_timer_state',
+    'reconcile_timers_states',
 )
@@ -0,0 +1,59 @@
+import typing
+
+from django.db import transaction
+
+from ...business import models
+
+__all__ = (
+    'update_matters_access',
+)
+
+
+def update_matters_access(matters_ids: typing.Iterable[int]):
+    """Rebuild `MatterAccess` rows of matters from their current state.
+
+    Access rows of all matters are replaced at once: old rows are deleted by
+    one query and new ones are inserted by one bulk insert, so this can be
+    used for single matter as well as for many of them.
+
+    """
+    matters_ids = set(matters_ids)
+    if not matters_ids:
+        return
+
+    matters = models.Matter.objects.filter(pk__in=matters_ids).values_list(
+        'pk', 'attorney_id', 'client_id', 'referral__attorney_id',
+    )
+    shared_links = models.MatterSharedWith.objects.filter(
+        matter_id__in=matters_ids
+    ).values_list('matter_id', 'user_id')
+
+    access = []
+    for matter_id, attorney_id, client_id, referral_id in matters:
+        access.extend(
+            models.MatterAccess(
+                matter_id=matter_id, user_id=user_id, kind=kind
+            )
+            for kind, user_id in (
+                (models.MatterAccess.KIND_ATTORNEY, attorney_id),
+                (models.MatterAccess.KIND_CLIENT, client_id),
+                (models.MatterAccess.KIND_REFERRAL, referral_id),
+            )
+            if user_id is not None
+        )
+    access.extend(
+        models.MatterAccess(
+            matter_id=matter_id,
+            user_id=user_id,
+            kind=models.MatterAccess.KIND_SHARED,
+        )
+        for matter_id, user_id in shared_links
+    )
+
+    with transaction.atomic():
+        models.MatterAccess.objects.filter(
+            matter_id__in=matters_ids
+        ).delete()
+        models.MatterAccess.objects.bulk_create(
+            access, ignore_conflicts=True
+        )
@@ -2,13 +2,18 @@ import typing
 from collections import namedtuple
 from datetime import date as dt_date
 
+from django.db import transaction
+
 import arrow
 
+from libs.utils import chunked
+
 from ...finance.models import Payment
 from ...finance.services import create_payment
 from ...users.models import AppUser
 from .. import models
 from ..notifications import InvoiceEmailNotification
+from .overview import invalidate_client_overview
 
 InvoicePeriod = namedtuple('InvoicePeriod', ['period_start', 'period_end'])
 
@@ -19,6 +24,9 @@ __all__ = (
     'send_invoice_to_recipients',
     'prepare_invoice_for_payment',
     'get_or_create_invoice_payment',
+    'reconcile_invoices_totals',
+    'generate_period_invoices',
+    'create_matters_invoices',
 )
 
 
@@ -312,3 +320,131 @@ def clone_invoice(obj, attrs={}):
                 for child in children:
                     clone_invoice(child, attrs)
     return clone
+
+
+def reconcile_invoices_totals(chunk_size: int = 500) -> int:
+    """Recalculate stored totals of all invoices.
+
+    Totals are kept in sync by signals, but may drift on changes which skip
+    signals (like qs `update` or raw sql). Invoices are updated by chunks, one
+    UPDATE query per chunk.
+
+    Returns:
+        number of updated invoices
+
+    """
+    invoices_ids = models.Invoice.objects.order_by('pk').values_list(
+        'pk', flat=True
+    )
+    updated = 0
+    for chunk in chunked(invoices_ids.iterator(), chunk_size):
+        updated += models.Invoice.objects.filter(pk__in=chunk).update_totals()
+    return updated
+
+
+def generate_period_invoices(
+    period_start: dt_date,
+    period_end: dt_date,
+    after_matter_id: int = 0,
+    batch_size: int = 500,
+) -> typing.Optional[int]:
+    """Generate invoices of period for next batch of matters.
+
+    Batch consists of open hourly rated matters with billing items in period,
+    they are found by one grouped query in order of ids starting after
+    `after_matter_id`. Missing invoices of batch are created by one bulk
+    insert and billing items of period are attached to them by another one.
+    Batch is processed in transaction and matters which already have
+    invoice for period are skipped, so retries don't create duplicates.
+
+    Returns:
+        id of last matter of batch to continue from or None if there are no
+        more matters
+
+    """
+    billing_items = models.BillingItem.objects.match_period(
+        period_start=period_start, period_end=period_end,
+    ).filter(
+        matter__status=models.Matter.STATUS_OPEN,
+        matter__fee_type_id=models.Matter.FEE_TYPE_HOURLY_ID,
+    )
+    matters_ids = list(
+        billing_items.filter(matter_id__gt=after_matter_id).order_by(
+            'matter_id'
+        ).values_list('matter_id', flat=True).distinct()[:batch_size]
+    )
+    if not matters_ids:
+        return None
+
+    with transaction.atomic():
+        # lock batch's matters, so concurrent runs don't duplicate invoices
+        list(models.Matter.objects.filter(
+            pk__in=matters_ids
+        ).select_for_update().values_list('pk', flat=True))
+        missing = models.Matter.objects.filter(pk__in=matters_ids).exclude(
+            pk__in=models.Invoice.objects.filter(
+                matter_id__in=matters_ids,
+                period_start=period_start,
+                period_end=period_end,
+            ).values('matter_id')
+        ).values_list('pk', flat=True)
+        invoices = create_matters_invoices(
+            (matter_id, period_start, period_end) for matter_id in missing
+        )
+        invoices_by_matter = {
+            invoice.matter_id: invoice.pk for invoice in invoices
+        }
+        items = billing_items.filter(
+            matter_id__in=invoices_by_matter
+        ).available_for_editing().values_list('pk', 'matter_id').distinct()
+        models.BillingItemAttachment.objects.bulk_create(
+            models.BillingItemAttachment(
+                time_billing_id=item_id,
+                invoice_id=invoices_by_matter[matter_id],
+            )
+            for item_id, matter_id in items
+        )
+    return matters_ids[-1]
+
+
+def create_matters_invoices(
+    matters_periods: typing.Iterable[typing.Tuple[int, dt_date, dt_date]],
+) -> typing.List[models.Invoice]:
+    """Create invoices of matters for periods by one bulk insert.
+
+    Invoices are created the same way as in `get_invoice_for_matter`, but
+    `bulk_create` doesn't send `post_save`, so billing items aren't attached
+    to them and effects of invoices creation (`invoice_is_created` signal
+    and client overview invalidation) are triggered on commit.
+
+    Arguments:
+        matters_periods: (matter id, period start, period end) of invoices
+
+    """
+    from ...business.signals import invoice_is_created
+
+    matters_periods = list(matters_periods)
+    matters = models.Matter.objects.in_bulk(
+        [matter_id for matter_id, _, _ in matters_periods]
+    )
+    invoices = models.Invoice.objects.bulk_create(
+        models.Invoice(
+            matter_id=matter_id,
+            created_by_id=matters[matter_id].attorney_id,
+            period_start=period_start,
+            period_end=period_end,
+            title=f'{matters[matter_id].title} Invoice',
+        )
+        for matter_id, period_start, period_end in matters_periods
+    )
+
+    def send_invoices_created():
+        invalidate_client_overview(*(
+            matter.client_id for matter in matters.values()
+        ))
+        for invoice in invoices:
+            invoice_is_created.send(sender=models.Invoice, instance=invoice)
+
+    if invoices:
+        transaction.on_commit(send_invoices_created)
+    return invoices
@@ -7,6 +7,7 @@ from ...business import models
 from ...documents.models import Folder
 from ...users.models import AppUser, Invite
 from ...users.utils import send_invitation
+from .access import update_matters_access
 
 
 def get_matter_shared_folder(matter: models.Matter) -> Folder:
@@ -130,6 +131,8 @@ def share_matter_with_users(
         models.MatterSharedWith(matter=matter, user_id=user_id)
         for user_id in to_create
     )
+    # `bulk_create` doesn't send `post_save`, so access index is updated here
+    update_matters_access([matter.pk])
     for matter_shared in matters_shared:
         # Notify attorneys and supports that user shared matter with them
         new_matter_shared.send(
@@ -0,0 +1,126 @@
+import typing
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from ...business import models
+from ...documents.models import Document, Folder
+
+__all__ = (
+    'EMPTY_COUNTERS',
+    'MatterOverviewCounters',
+    'get_client_matters_counters',
+    'invalidate_client_overview',
+    'invalidate_posts_clients_overview',
+)
+
+MatterOverviewCounters = namedtuple(
+    'MatterOverviewCounters',
+    ['due_amount', 'unread_message_count', 'unread_document_count'],
+)
+# Counters of matters without unread or due items(or created after caching)
+EMPTY_COUNTERS = MatterOverviewCounters(0, 0, 0)
+
+CACHE_KEY = 'client_overview:{client_id}'
+
+
+def _group_by_matter(queryset, matter_field: str, aggregate) -> dict:
+    """Get map of matter id to aggregate of queryset by single query."""
+    return dict(
+        queryset.order_by().values(matter_field).annotate(
+            value=aggregate
+        ).values_list(matter_field, 'value')
+    )
+
+
+def calculate_matters_counters(
+    matters_ids: typing.Sequence[int],
+) -> typing.Dict[int, MatterOverviewCounters]:
+    """Calculate overview counters of matters.
+
+    Each counter is calculated for all matters by one grouped query:
+
+        * `due_amount` - sum of earned fees of not paid invoices
+        * `unread_message_count` - count of comments not seen by client
+        * `unread_document_count` - count of not seen documents and folders
+
+    """
+    due_amounts = _group_by_matter(
+        models.Invoice.objects.filter(matter_id__in=matters_ids).exclude(
+            payment_status=models.Invoice.PAYMENT_STATUS_PAID
+        ),
+        'matter_id',
+        Sum('fees_earned'),
+    )
+    unread_messages = _group_by_matter(
+        models.MatterComment.objects.filter(
+            post__matter_id__in=matters_ids, seen_by_client=False
+        ),
+        'post__matter_id',
+        Count('pk'),
+    )
+    unread_documents = _group_by_matter(
+        Document.objects.filter(matter_id__in=matters_ids, seen=False),
+        'matter_id',
+        Count('pk'),
+    )
+    unread_folders = _group_by_matter(
+        Folder.objects.filter(matter_id__in=matters_ids, seen=False),
+        'matter_id',
+        Count('pk'),
+    )
+    return {
+        matter_id: MatterOverviewCounters(
+            due_amount=due_amounts.get(matter_id) or 0,
+            unread_message_count=unread_messages.get(matter_id, 0),
+            unread_document_count=(
+                unread_documents.get(matter_id, 0) +
+                unread_folders.get(matter_id, 0)
+            ),
+        )
+        for matter_id in matters_ids
+    }
+
+
+def get_client_matters_counters(
+    client_id: int,
+) -> typing.Dict[int, MatterOverviewCounters]:
+    """Get overview counters of all client's matters.
+
+    Counters are cached per client for `CLIENT_OVERVIEW_CACHE_TIMEOUT`
+    seconds and are dropped earlier by `invalidate_client_overview` on new
+    comments, documents and payments.
+
+    """
+    key = CACHE_KEY.format(client_id=client_id)
+    counters = cache.get(key)
+    if counters is None:
+        counters = calculate_matters_counters(list(
+            models.Matter.objects.filter(
+                client_id=client_id
+            ).values_list('pk', flat=True)
+        ))
+        cache.set(key, counters, settings.CLIENT_OVERVIEW_CACHE_TIMEOUT)
+    return counters
+
+
+def invalidate_client_overview(*clients_ids: int):
+    """Drop cached overview counters of clients."""
+    cache.delete_many([
+        CACHE_KEY.format(client_id=client_id)
+        for client_id in set(clients_ids) if client_id is not None
+    ])
+
+
+def invalidate_posts_clients_overview(*posts_ids: int):
+    """Drop cached overview counters of clients of posts' matters.
+
+    It's used after bulk updates of posts and comments, which don't send
+    signals.
+
+    """
+    invalidate_client_overview(*models.Matter.objects.filter(
+        posts__in=posts_ids
+    ).values_list('client_id', flat=True))
@@ -1,48 +1,73 @@
+import operator
+import threading
+import typing
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import reduce
+
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
 
 import arrow
 
+from libs.time_series import get_cached_time_series, get_time_series
+
 from apps.users.models import AppUser
 
 from .. import models
+from .invoices import create_matters_invoices, get_invoice_period_ranges
 
 __all__ = (
     'get_time_billing_for_time_period',
     'attach_time_billings_to_invoice',
+    'deferred_billing_items_reconciliation',
+    'mark_billing_item_dirty',
+    'reconcile_billing_items_attachments',
 )
 
+# Dirty (matter, month) periods collected in deferred reconciliation block
+_deferred = threading.local()
+
 
 def get_time_billing_for_time_period(
     user: AppUser, start: datetime, end: datetime, time_frame: str = 'month'
 ) -> dict:
-    """Calculate sum of time billed for time period divided by time frame."""
-    stats = []
-    total_sum = 0
-    start = arrow.get(start)
-    end = arrow.get(end)
-    for range_date in list(arrow.Arrow.range(time_frame, start, end)):
-        # Calculate time billed for time frame
-        time_billing = models.BillingItem.objects \
-            .calculate_time_billing_for_period(
-                user=user,
-                start_date=range_date.floor(time_frame).datetime,
-                end_date=range_date.ceil(time_frame).datetime,
-            )
-        # If there no time billed, set it to timedelta
-        if not time_billing:
-            time_billing = timedelta()
-        total_sum += time_billing.total_seconds() // 60
-        stats.append(
-            {
-                'date': range_date.datetime,
-                'count': time_billing.total_seconds() // 60
-            },
+    """Calculate sum of time billed for time period divided by time frame.
+
+    Time billed (in minutes) of all time frames is calculated by single query
+    and cached.
+
+    """
+    def calculate():
+        time_series = get_time_series(
+            queryset=models.BillingItem.objects.available_for_user(user),
+            date_field='date',
+            aggregate=Sum('time_spent'),
+            start=start,
+            end=end,
+            time_frame=time_frame,
+            default=timedelta(),
         )
+        stats = [
+            {
+                'date': point.date,
+                'count': point.value.total_seconds() // 60,
+            } for point in time_series
+        ]
+        return {
+            'total_sum': sum(stat['count'] for stat in stats),
+            'stats': stats,
+        }
 
-    return {
-        'total_sum': total_sum,
-        'stats': stats,
-    }
+    return get_cached_time_series(
+        name='time_billed',
+        user_id=user.pk,
+        start=start,
+        end=end,
+        time_frame=time_frame,
+        calculate=calculate,
+    )
 
 
 def attach_time_billings_to_invoice(
@@ -77,3 +102,178 @@ def attach_time_billings_to_invoice(
             else 'invoice__id__in': to_delete
         }
     ).delete()
+
+
+def reconcile_billing_items_attachments(
+    periods: typing.Iterable[typing.Tuple[int, str]],
+):
+    """Reconcile attachments of billing items to invoices for matters' months.
+
+    For each (matter id, month) period editable billing items of hourly
+    rated matter are attached to all editable invoices of matter, which
+    periods contain items' dates, and detached from the others. If there is
+    no such invoice for item of past month, invoice for its month is
+    created(if matter has no invoice with the same period), items of current
+    month wait for monthly invoices generation.
+
+    All periods are reconciled by constant number of queries and one bulk
+    insert and delete of attachments.
+
+    Arguments:
+        periods: pairs of matter id and any date(or iso date) of month
+
+    """
+    months = {}
+    for matter_id, date in periods:
+        period = get_invoice_period_ranges(arrow.get(date).date())
+        months[(matter_id, period.period_start.date())] = (
+            period.period_end.date()
+        )
+    hourly_matters = set(models.Matter.objects.filter(
+        pk__in={matter_id for matter_id, _ in months},
+        fee_type_id=models.Matter.FEE_TYPE_HOURLY_ID,
+    ).values_list('pk', flat=True))
+    months = {
+        (matter_id, start): end for (matter_id, start), end in months.items()
+        if matter_id in hourly_matters
+    }
+    if not months:
+        return
+
+    in_months = reduce(operator.or_, (
+        Q(matter_id=matter_id, date__gte=start, date__lte=end)
+        for (matter_id, start), end in months.items()
+    ))
+    overlap_months = reduce(operator.or_, (
+        Q(matter_id=matter_id, period_start__lte=end, period_end__gte=start)
+        for (matter_id, start), end in months.items()
+    ))
+    current_month = get_invoice_period_ranges(timezone.now().date())
+
+    with transaction.atomic():
+        items = set(
+            models.BillingItem.objects.filter(in_months).available_for_editing(
+            ).values_list('pk', 'matter_id', 'date').distinct()
+        )
+        invoices = list(
+            models.Invoice.objects.filter(overlap_months).values_list(
+                'pk', 'matter_id', 'period_start', 'period_end',
+                'payment_status',
+            )
+        )
+        editable = [
+            (pk, matter_id, start, end)
+            for pk, matter_id, start, end, status in invoices
+            if status in models.Invoice.AVAILABLE_FOR_EDITING_STATUSES
+        ]
+
+        editable_by_matter = {}
+        for pk, matter_id, start, end in editable:
+            editable_by_matter.setdefault(matter_id, []).append(
+                (pk, start, end)
+            )
+
+        def get_matched(matter_id, date):
+            return [
+                pk for pk, start, end in editable_by_matter.get(matter_id, ())
+                if start <= date <= end
+            ]
+
+        # create missing invoices for past months
+        existing_periods = {
+            (matter_id, start, end)
+            for _, matter_id, start, end, _ in invoices
+        }
+        missing_periods = set()
+        for _, matter_id, date in items:
+            if get_matched(matter_id, date):
+                continue
+            period = get_invoice_period_ranges(date)
+            if period.period_start == current_month.period_start:
+                continue
+            invoice_period = (
+                matter_id,
+                period.period_start.date(),
+                period.period_end.date(),
+            )
+            if invoice_period not in existing_periods:
+                missing_periods.add(invoice_period)
+        for invoice in create_matters_invoices(missing_periods):
+            editable_by_matter.setdefault(invoice.matter_id, []).append(
+                (invoice.pk, invoice.period_start, invoice.period_end)
+            )
+
+        expected = {
+            (item_id, invoice_id)
+            for item_id, matter_id, date in items
+            for invoice_id in get_matched(matter_id, date)
+        }
+        existing = set(
+            models.BillingItemAttachment.objects.filter(
+                time_billing_id__in=[item_id for item_id, _, _ in items],
+                invoice__payment_status__in=(
+                    models.Invoice.AVAILABLE_FOR_EDITING_STATUSES
+                ),
+            ).values_list('time_billing_id', 'invoice_id')
+        )
+        to_delete = existing - expected
+        if to_delete:
+            models.BillingItemAttachment.objects.filter(reduce(
+                operator.or_, (
+                    Q(time_billing_id=item_id, invoice_id=invoice_id)
+                    for item_id, invoice_id in to_delete
+                )
+            )).delete()
+        models.BillingItemAttachment.objects.bulk_create(
+            models.BillingItemAttachment(
+                time_billing_id=item_id, invoice_id=invoice_id
+            )
+            for item_id, invoice_id in expected - existing
+        )
+
+
+def mark_billing_item_dirty(billing_item: models.BillingItem):
+    """Mark (matter, month) period of billing item for reconciliation.
+
+    Out of `deferred_billing_items_reconciliation` block period is
+    reconciled right away, inside of it periods are collected and reconciled
+    once after block.
+
+    """
+    period = (
+        billing_item.matter_id,
+        arrow.get(billing_item.date).date().isoformat(),
+    )
+    periods = getattr(_deferred, 'periods', None)
+    if periods is None:
+        reconcile_billing_items_attachments([period])
+    else:
+        periods.add(period)
+
+
+@contextmanager
+def deferred_billing_items_reconciliation():
+    """Defer reconciliation of billing items attachments saved in block.
+
+    Saved billing items only mark their (matter, month) periods as dirty,
+    all of them are reconciled by one background task after commit of
+    transaction. It's used for bulk changes of billing items, like imports.
+
+    """
+    if getattr(_deferred, 'periods', None) is not None:
+        # nested block, periods are reconciled by outer one
+        yield
+        return
+
+    from .. import tasks
+
+    _deferred.periods = set()
+    try:
+        yield
+        periods = sorted(_deferred.periods)
+    finally:
+        _deferred.periods = None
+    if periods:
+        transaction.on_commit(
+            lambda: tasks.reconcile_billing_items_attachments.delay(periods)
+        )
@@ -0,0 +1,180 @@
+import typing
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import DurationField, ExpressionWrapper, F, Max, Q, Sum
+from django.utils import timezone
+
+import arrow
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from ...business import models
+from ...users.models import AppUser
+
+__all__ = (
+    'TimerState',
+    'get_timer_state',
+    'get_elapsed_time',
+    'start_timer',
+    'stop_timer',
+    'drop_timer_state',
+    'reconcile_timers_states',
+)
+
+# State of user's timer: total duration of finished not billed time entries
+# and start of running entry(None if timer is stopped)
+TimerState = namedtuple('TimerState', ['accumulated', 'started_at'])
+
+TIMER_KEY = 'timer:{user_id}'
+
+
+def get_redis():
+    """Get redis connection used for timers' states."""
+    return get_redis_connection(settings.TIMERS_REDIS_ALIAS)
+
+
+def calculate_timer_state(user_id: int) -> TimerState:
+    """Calculate user's timer state from time entries by one aggregate."""
+    result = models.TimeEntry.objects.filter(
+        created_by_id=user_id, billing_item__isnull=True,
+    ).aggregate(
+        accumulated=Sum(
+            ExpressionWrapper(
+                F('end_time') - F('start_time'), output_field=DurationField()
+            ),
+            filter=Q(end_time__isnull=False),
+        ),
+        started_at=Max('start_time', filter=Q(end_time__isnull=True)),
+    )
+    return TimerState(
+        accumulated=result['accumulated'] or timedelta(),
+        started_at=result['started_at'],
+    )
+
+
+def save_timer_state(user_id: int, state: TimerState):
+    """Save user's timer state to redis(skipped if redis isn't available)."""
+    key = TIMER_KEY.format(user_id=user_id)
+    started_at = state.started_at.isoformat() if state.started_at else ''
+    try:
+        pipe = get_redis().pipeline()
+        pipe.hset(key, mapping={
+            'accumulated': state.accumulated.total_seconds(),
+            'started_at': started_at,
+        })
+        pipe.expire(key, settings.TIMERS_STATE_TIMEOUT)
+        pipe.execute()
+    except RedisError:
+        pass
+
+
+def get_timer_state(user_id: int) -> TimerState:
+    """Get user's timer state.
+
+    State is read from redis by one lookup, if there is no state(or redis is
+    not available) it's calculated from time entries and saved to redis.
+
+    """
+    try:
+        data = get_redis().hgetall(TIMER_KEY.format(user_id=user_id))
+    except RedisError:
+        return calculate_timer_state(user_id)
+    if data:
+        started_at = data[b'started_at'].decode()
+        return TimerState(
+            accumulated=timedelta(seconds=float(data[b'accumulated'])),
+            started_at=arrow.get(started_at).datetime if started_at else None,
+        )
+
+    state = calculate_timer_state(user_id)
+    save_timer_state(user_id, state)
+    return state
+
+
+def get_elapsed_time(user: AppUser) -> typing.Tuple[timedelta, bool]:
+    """Get elapsed time of user's timer and whether it's running."""
+    state = get_timer_state(user.pk)
+    if state.started_at is None:
+        return state.accumulated, False
+    return state.accumulated + (timezone.now() - state.started_at), True
+
+
+def start_timer(user: AppUser, start_time: datetime) -> models.TimeEntry:
+    """Start user's timer or move start of running one.
+
+    Time entry is saved to db, and then timer's state in redis is updated.
+
+    """
+    state = get_timer_state(user.pk)
+    time_entry = models.TimeEntry.get_running_time_entry(user)
+    if time_entry is None:
+        time_entry = models.TimeEntry.objects.create(
+            created_by=user, start_time=start_time,
+        )
+    else:
+        time_entry.start_time = start_time
+        time_entry.save()
+    save_timer_state(user.pk, state._replace(started_at=start_time))
+    return time_entry
+
+
+def stop_timer(user: AppUser) -> typing.Optional[models.TimeEntry]:
+    """Stop user's running timer.
+
+    Time entry is saved to db, and then its duration is added to timer's
+    accumulated duration in redis.
+
+    Returns:
+        stopped time entry or None if timer isn't running
+
+    """
+    time_entry = models.TimeEntry.get_running_time_entry(user)
+    if time_entry is None:
+        return None
+    state = get_timer_state(user.pk)
+    time_entry.end_time = timezone.now()
+    time_entry.save()
+    save_timer_state(user.pk, TimerState(
+        accumulated=(
+            state.accumulated + time_entry.end_time - time_entry.start_time
+        ),
+        started_at=None,
+    ))
+    return time_entry
+
+
+def drop_timer_state(*users_ids: int):
+    """Drop timer states of users, they are recalculated on next read.
+
+    It's used when time entries are changed not by `start_timer` or
+    `stop_timer`.
+
+    """
+    users_ids = {user_id for user_id in users_ids if user_id is not None}
+    if not users_ids:
+        return
+    try:
+        get_redis().delete(*(
+            TIMER_KEY.format(user_id=user_id) for user_id in users_ids
+        ))
+    except RedisError:
+        pass
+
+
+def reconcile_timers_states() -> int:
+    """Drop all saved timer states, so they are recalculated from db.
+
+    It's run on worker restart to fix states, which could miss changes
+    of time entries while redis or workers were unavailable.
+
+    Returns:
+        number of dropped states
+
+    """
+    redis = get_redis()
+    keys = list(redis.scan_iter(TIMER_KEY.format(user_id='*')))
+    if keys:
+        redis.delete(*keys)
+    return len(keys)
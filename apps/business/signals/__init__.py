@@ -1,3 +1,10 @@
+from .access import (
+    remove_referral_access,
+    update_matter_access,
+    update_referral_access,
+    update_shared_matter_access,
+    update_shared_with_access,
+)
 from .extra import (
     new_matter_referred,
     new_referral_accepted,
@@ -6,6 +13,7 @@ from .extra import (
 )
 from .invoices import (
     billing_item_is_created,
+    drop_time_entry_timer_state,
     invoice_is_created,
     invoice_is_sent,
     process_invoice_create_update,
@@ -27,6 +35,11 @@ from .matters import (
     send_shared_matter_notification,
 )
 from .messages import new_matter_message, new_message, update_topic_statistic
+from .overview import (
+    invalidate_comment_client_overview,
+    invalidate_invoice_client_overview,
+    invalidate_resource_client_overview,
+)
 from .posted_matters import (
     new_proposal,
     post_inactivated,
@@ -36,7 +49,16 @@ from .posted_matters import (
 )
 
 __all__ = (
+    'remove_referral_access',
+    'update_matter_access',
+    'update_referral_access',
+    'update_shared_matter_access',
+    'update_shared_with_access',
+    'invalidate_comment_client_overview',
+    'invalidate_invoice_client_overview',
+    'invalidate_resource_client_overview',
     'billing_item_is_created',
+    'drop_time_entry_timer_state',
     'new_video_call',
     'invoice_is_sent',
     'invoice_is_created',
@@ -0,0 +1,75 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from ..models import Matter, MatterAccess, MatterSharedWith, Referral
+from ..services import update_matters_access
+
+__all__ = (
+    'update_matter_access',
+    'update_shared_matter_access',
+    'update_shared_with_access',
+    'update_referral_access',
+    'remove_referral_access',
+)
+
+# Matter's fields, which define who has access to it
+MATTER_ACCESS_FIELDS = frozenset(('attorney', 'client', 'referral'))
+
+
+@receiver(signals.post_save, sender=Matter)
+def update_matter_access(instance: Matter, update_fields=None, **kwargs):
+    """Update access index when matter's participants could change."""
+    if update_fields and not MATTER_ACCESS_FIELDS.intersection(update_fields):
+        return
+    update_matters_access([instance.pk])
+
+
+@receiver(signals.post_save, sender=MatterSharedWith)
+@receiver(signals.post_delete, sender=MatterSharedWith)
+def update_shared_matter_access(instance: MatterSharedWith, **kwargs):
+    """Update access index of matter when it's shared or unshared."""
+    update_matters_access([instance.matter_id])
+
+
+@receiver(signals.m2m_changed, sender=Matter.shared_with.through)
+def update_shared_with_access(
+    instance, action: str, reverse: bool, pk_set: set, **kwargs
+):
+    """Update access index on changes through `Matter.shared_with`.
+
+    When links are changed from user's side (`user.shared_matters`),
+    `pk_set` contains matters ids, on its clearing all user's shared access
+    is removed.
+
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        update_matters_access([instance.pk])
+    elif action == 'post_clear':
+        MatterAccess.objects.filter(
+            user_id=instance.pk, kind=MatterAccess.KIND_SHARED
+        ).delete()
+    else:
+        update_matters_access(pk_set)
+
+
+@receiver(signals.post_save, sender=Referral)
+def update_referral_access(instance: Referral, created: bool, **kwargs):
+    """Update access index of referred matters when attorney is changed."""
+    if created:
+        return
+    update_matters_access(instance.matters.values_list('pk', flat=True))
+
+
+@receiver(signals.post_delete, sender=Referral)
+def remove_referral_access(instance: Referral, **kwargs):
+    """Update access index of matters, which lost deleted referral.
+
+    Matters' `referral` is already set to null, so all matters, to which
+    referred attorney had access as referral, are rebuilt.
+
+    """
+    update_matters_access(MatterAccess.objects.filter(
+        user_id=instance.attorney_id, kind=MatterAccess.KIND_REFERRAL
+    ).values_list('matter_id', flat=True))
@@ -1,13 +1,14 @@
 from django.db.models import signals
 from django.dispatch import Signal, receiver
-from django.utils import timezone
+
+from libs.time_series import invalidate_cached_time_series
 
 from .. import models
-from ..models import BillingItem, Invoice
+from ..models import BillingItem, Invoice, TimeEntry
 from ..services import (
     attach_time_billings_to_invoice,
-    get_invoice_for_matter,
-    get_invoice_period_ranges,
+    drop_timer_state,
+    mark_billing_item_dirty,
 )
 
 invoice_is_sent = Signal(providing_args=('instance', 'user'))
@@ -30,6 +31,20 @@ def update_time_entries(sender, instance, **kwargs):
         created_by=instance.created_by,
         billing_item__isnull=True
     ).update(billing_item=instance)
+    drop_timer_state(instance.created_by_id)
+
+
+@receiver(signals.post_save, sender=TimeEntry)
+@receiver(signals.post_delete, sender=TimeEntry)
+def drop_time_entry_timer_state(instance: TimeEntry, **kwargs):
+    """Drop timer state of user, whose time entry is changed.
+
+    Timers' services save new state right after changing of time entries, so
+    this only makes changes from other places (admin, cancelling of timer)
+    to be recalculated on next read.
+
+    """
+    drop_timer_state(instance.created_by_id)
 
 
 @receiver(signals.post_save, sender=Invoice)
@@ -87,24 +102,24 @@ def process_time_billing_create_update(sender, instance, created, **kwargs):
     """Attach time billing to invoice.
 
     Whenever new time billing is created or its date is updated - it is needed
-    to make TB and Invoice reattachments.
+    to make TB and Invoice reattachments. Time billing's (matter, month) is
+    marked as dirty and reconciled by `reconcile_billing_items_attachments`
+    (right away or once for all items saved in
+    `deferred_billing_items_reconciliation` block):
 
-    Steps:
-
-        1. Try to find matching to time billing `date` invoices within a matter
+        1. Time billing is attached to matching to its `date` invoices within
+        a matter and detached from not matching ones anymore
 
         2. If no matching invoices exists and date is for a current month of a
-        current year -> do nothing and wait until celery task will generate it
-        automatically
+        current year -> nothing is attached until celery task will generate
+        invoice automatically
 
         3. If no matching invoices exists and date is for a `past` period ->
-        generate new invoice and attach time billing to it.
-
-        4. If there are existing matching invoices -> attach current time
-        billing to matching invoices and detach from not matching ones anymore
+        new invoice is generated and time billing is attached to it.
 
-    Do nothing if time billing's matter is not `hourly` rated or not `date`
-    field is updated or if time billing's invoice is not available for editing.
+    Do nothing if not `date` field is updated. Time billings of not `hourly`
+    rated matters or of invoices not available for editing are skipped by
+    reconciliation.
 
     """
     if instance.matter:
@@ -112,47 +127,12 @@ def process_time_billing_create_update(sender, instance, created, **kwargs):
             sender=models.BillingItem,
             instance=instance
         )
-    # do nothing if instance matter is not hourly rated
-    if not instance.matter.is_hourly_rated:
-        return
-
-    # do nothing if time_billing is not available for editing
-    if not instance.available_for_editing:
-        return
 
     # do nothing if not instance `date` field is updated
     if not created and 'date' not in instance.get_dirty_fields():
         return
 
-    # find invoices with matching period
-    date = instance.date
-    matched = instance.matter.invoices.available_for_editing().match_date(
-        date=date
-    ).values_list('id', flat=True)
-
-    # if there are no matching invoices and current datetime month and year are
-    # the same as time billing `date`month and year -> do nothing cause
-    # invoice will be auto generated at the 1st day of a next month by app
-    now = timezone.now().date()
-    is_actual_date = now.month == date.month and now.year == date.year
-    if not matched.exists() and is_actual_date:
-        # delete current TB attachments to not matching anymore invoices
-        instance.attached_invoice.all().delete()
-        return
-    # if no related invoice exists for a past date - generate a new one
-    # according to time billing date (get first day of a `date` month and last
-    # day of `date` month)
-    elif not matched.exists() and not is_actual_date:
-        period_start, period_end = get_invoice_period_ranges(date)
-        # delete current TB attachments to not matching anymore invoices
-        instance.attached_invoice.all().delete()
-        # during invoice creation time billing will be attached
-        get_invoice_for_matter(instance.matter, period_start, period_end)
-        return
-
-    # otherwise - we assume that time billing should be attached to invoices
-    existing = instance.invoices.values_list('id', flat=True)
-    attach_time_billings_to_invoice(matched, existing, instance)
+    mark_billing_item_dirty(instance)
 
 
 @receiver(signals.pre_save, sender=BillingItem)
@@ -163,3 +143,69 @@ def set_created_by(instance: BillingItem, **kwargs):
         return
 
     instance.created_by = instance.matter.attorney.user
+
+
+@receiver(signals.m2m_changed, sender=Invoice.billing_items.through)
+def update_totals_on_billing_items_change(
+    instance, action: str, reverse: bool, pk_set: set, **kwargs
+):
+    """Recalculate invoice totals when its billing items are changed.
+
+    When billing items are cleared from billing item's side, ids of its
+    invoices are remembered before clearing, cause they're unknown after.
+
+    """
+    if reverse and action == 'pre_clear':
+        instance._cleared_invoices_ids = list(
+            instance.billing_items_invoices.values_list('id', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        invoices_ids = [instance.pk]
+    elif action == 'post_clear':
+        invoices_ids = getattr(instance, '_cleared_invoices_ids', [])
+    else:
+        invoices_ids = pk_set
+    Invoice.objects.filter(pk__in=invoices_ids).update_totals()
+
+
+@receiver(signals.post_save, sender=BillingItem)
+def update_totals_on_billing_item_update(
+    instance: BillingItem, created: bool, **kwargs
+):
+    """Recalculate totals of invoices which contain updated billing item."""
+    # new billing item is not in invoices yet
+    if created:
+        return
+    Invoice.objects.filter(billing_items=instance).update_totals()
+
+
+@receiver(signals.pre_delete, sender=BillingItem)
+def remember_billing_item_invoices(instance: BillingItem, **kwargs):
+    """Remember invoices of billing item before its deletion."""
+    instance._invoices_ids = list(
+        instance.billing_items_invoices.values_list('id', flat=True)
+    )
+
+
+@receiver(signals.post_delete, sender=BillingItem)
+def update_totals_on_billing_item_delete(instance: BillingItem, **kwargs):
+    """Recalculate totals of invoices which contained deleted billing item."""
+    invoices_ids = getattr(instance, '_invoices_ids', None)
+    if invoices_ids:
+        Invoice.objects.filter(pk__in=invoices_ids).update_totals()
+
+
+@receiver(signals.post_save, sender=BillingItem)
+@receiver(signals.post_delete, sender=BillingItem)
+def invalidate_time_billed_statistics(instance: BillingItem, **kwargs):
+    """Drop cached time billed statistics of matter's attorney.
+
+    Statistics of users with which matter is shared expire by timeout.
+
+    """
+    if instance.matter_id:
+        invalidate_cached_time_series(instance.matter.attorney_id)
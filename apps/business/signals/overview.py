@@ -0,0 +1,51 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from ...documents.models import Document, Folder
+from ..models import BillingItem, Invoice, Matter, MatterComment
+from ..services import invalidate_client_overview
+
+__all__ = (
+    'invalidate_comment_client_overview',
+    'invalidate_resource_client_overview',
+    'invalidate_invoice_client_overview',
+)
+
+
+def invalidate_matters_clients_overview(**matters_filter):
+    """Drop cached overview of clients of filtered matters."""
+    invalidate_client_overview(*Matter.objects.filter(
+        **matters_filter
+    ).values_list('client_id', flat=True))
+
+
+@receiver(signals.post_save, sender=MatterComment)
+@receiver(signals.post_delete, sender=MatterComment)
+def invalidate_comment_client_overview(instance: MatterComment, **kwargs):
+    """Drop cached client's unread messages count on comments changes."""
+    invalidate_matters_clients_overview(posts=instance.post_id)
+
+
+@receiver(signals.post_save, sender=Document)
+@receiver(signals.post_delete, sender=Document)
+@receiver(signals.post_save, sender=Folder)
+@receiver(signals.post_delete, sender=Folder)
+def invalidate_resource_client_overview(instance, **kwargs):
+    """Drop cached client's unread documents count on resources changes."""
+    if instance.matter_id:
+        invalidate_matters_clients_overview(pk=instance.matter_id)
+
+
+@receiver(signals.post_save, sender=Invoice)
+@receiver(signals.post_delete, sender=Invoice)
+@receiver(signals.post_save, sender=BillingItem)
+@receiver(signals.post_delete, sender=BillingItem)
+def invalidate_invoice_client_overview(instance, **kwargs):
+    """Drop cached client's due amount on invoices and payments changes.
+
+    Changes of billing items are handled too, because they update invoices'
+    totals without saving invoices.
+
+    """
+    if instance.matter_id:
+        invalidate_matters_clients_overview(pk=instance.matter_id)
@@ -1,4 +1,7 @@
+from django.conf import settings
+
 import arrow
+from celery.signals import worker_ready
 
 from config.celery import app
 
@@ -8,32 +11,71 @@ from . import models, services, signals
 
 
 @app.task()
-def generate_invoices():
+def generate_invoices(
+    period_start: str = None,
+    period_end: str = None,
+    after_matter_id: int = 0,
+):
     """Celery task to generate Invoice.
 
     At the 1st day of each new month new `Invoice` is generated for a previous
     month and the task adds all time billings in Invoice period and connects it
     with invoice.
 
-    Invoices are generated only for `hourly` rate typed `active` matters.
+    Invoices are generated only for `hourly` rate typed `active` matters with
+    time billings in period. Matters are processed by batches, after each
+    batch task is restarted for the next one with the same period, so
+    failed task is retried from its batch only.
 
     """
-    # calculate invoice period
-    now = arrow.utcnow().shift(days=-1)
-    period_start, period_end = services.get_invoice_period_ranges(now)
-
-    # generate invoices only if there are related time billings
-    time_billings = models.BillingItem.objects.all().match_period(
-        period_start=period_start,
-        period_end=period_end,
+    if period_start is None:
+        # calculate invoice period
+        now = arrow.utcnow().shift(days=-1)
+        period_start, period_end = services.get_invoice_period_ranges(now)
+        period_start = period_start.date().isoformat()
+        period_end = period_end.date().isoformat()
+
+    last_matter_id = services.generate_period_invoices(
+        period_start=arrow.get(period_start).date(),
+        period_end=arrow.get(period_end).date(),
+        after_matter_id=after_matter_id,
+        batch_size=settings.INVOICES_GENERATION_BATCH_SIZE,
     )
-    if not time_billings.exists():
-        return
+    if last_matter_id is not None:
+        generate_invoices.delay(
+            period_start=period_start,
+            period_end=period_end,
+            after_matter_id=last_matter_id,
+        )
+
+
+@app.task()
+def reconcile_billing_items_attachments(periods: list):
+    """Celery task to reconcile billing items attachments of dirty periods.
+
+    Periods are (matter id, iso date of month) pairs marked by billing items
+    saved in `deferred_billing_items_reconciliation` block.
+
+    """
+    services.reconcile_billing_items_attachments(periods)
+
+
+@app.task()
+def reconcile_invoices_totals():
+    """Celery task to fix drift of stored invoices totals."""
+    services.reconcile_invoices_totals()
+
+
+@app.task()
+def reconcile_timers_states():
+    """Celery task to recalculate timers' states from time entries."""
+    services.reconcile_timers_states()
+
 
-    # generate invoices
-    matters = models.Matter.objects.open().hourly_rated()
-    for matter in matters:
-        services.get_invoice_for_matter(matter, period_start, period_end)
+@worker_ready.connect
+def reconcile_timers_states_on_worker_ready(**kwargs):
+    """Reconcile timers' states when worker is (re)started."""
+    reconcile_timers_states.delay()
 
 
 @app.task()
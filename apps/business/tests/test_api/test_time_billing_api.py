@@ -15,7 +15,7 @@ from libs.testing.constants import (
     OK,
 )
 
-from ....users.models import AppUser
+from ....users.models import AppUser, Attorney
 from ... import models
 from ...api import serializers
 from ...factories import InvoiceFactory
@@ -26,6 +26,11 @@ def get_list_url():
     return reverse_lazy('v1:time-billing-list')
 
 
+def get_import_url():
+    """Get url for import of many time billings at once."""
+    return reverse_lazy('v1:time-billing-import-billing-items')
+
+
 def get_detail_url(time_billing: models.BillingItem):
     """Get url for time-billing editing and retrieval."""
     return reverse_lazy(
@@ -379,3 +384,70 @@ class TestAuthUserAPI:
         api_client.force_authenticate(user=user)
         response = api_client.delete(url)
         assert response.status_code == status_code
+
+    def test_import_time_billings_with_attachments(
+        self,
+        auth_attorney_api: APIClient,
+        attorney: Attorney,
+        matter: models.Matter,
+    ):
+        """Test that attachments are taken from each imported item."""
+        matter.status = models.Matter.STATUS_OPEN
+        matter.save()
+        file = f'http://localhost{attorney.user.avatar.path}'
+        expense_type = models.BillingItem.BILLING_TYPE_EXPENSE
+        date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        response = auth_attorney_api.post(
+            get_import_url(),
+            {
+                'billing_items': [
+                    {
+                        'matter': matter.pk,
+                        'description': 'Expense',
+                        'billing_type': expense_type,
+                        'total_amount': '10.00',
+                        'date': date,
+                        'attachments': [file],
+                    },
+                    {
+                        'matter': matter.pk,
+                        'description': 'Time',
+                        'time_spent': '00:25:00',
+                        'hourly_rate': '100.00',
+                        'date': date,
+                    },
+                ],
+            },
+            format='json',
+        )
+        assert response.status_code == CREATED
+
+        expense, time = models.BillingItem.objects.filter(
+            pk__in=[item['id'] for item in response.data]
+        ).order_by('pk')
+        assert expense.attachments.count() == 1
+        assert not time.attachments.exists()
+
+    def test_import_expense_without_attachments(
+        self,
+        auth_attorney_api: APIClient,
+        matter: models.Matter,
+    ):
+        """Test that imported expenses require their own attachments."""
+        matter.status = models.Matter.STATUS_OPEN
+        matter.save()
+        response = auth_attorney_api.post(
+            get_import_url(),
+            {
+                'billing_items': [{
+                    'matter': matter.pk,
+                    'description': 'Expense',
+                    'billing_type': models.BillingItem.BILLING_TYPE_EXPENSE,
+                    'total_amount': '10.00',
+                    'date': datetime.now().strftime('%Y-%m-%d'),
+                }],
+                'attachments': ['http://localhost/file.pdf'],
+            },
+            format='json',
+        )
+        assert response.status_code == BAD_REQUEST
@@ -246,3 +246,45 @@ def test_get_or_create_invoice_payment(matter: models.Matter):
         invoice.fees_earned * config.APPLICATION_FEE / 100
     )
     assert payment.application_fee_amount == application_fee_amount
+
+
+def test_reconcile_invoices_totals(matter: models.Matter):
+    """Check that drifted invoice totals are recalculated."""
+    invoice = factories.InvoiceFactory(matter=matter)
+    billing_item = factories.BillingItemFactory(
+        matter=matter,
+        billing_type=models.BillingItem.BILLING_TYPE_EXPENSE,
+        total_amount=10,
+    )
+    invoice.billing_items.add(billing_item)
+    models.Invoice.objects.filter(pk=invoice.pk).update(total_amount=0)
+
+    services.reconcile_invoices_totals()
+
+    invoice.refresh_from_db()
+    assert invoice.total_amount == 10
+
+
+def test_generate_period_invoices():
+    """Check that invoices are generated once with attached billing items."""
+    matter = factories.MatterFactory(
+        status=models.Matter.STATUS_OPEN,
+        fee_type_id=models.Matter.FEE_TYPE_HOURLY_ID,
+    )
+    period_start, period_end = services.get_invoice_period_ranges(
+        arrow.utcnow().shift(months=-2)
+    )
+    period_start, period_end = period_start.date(), period_end.date()
+    billing_item = factories.BillingItemFactory(
+        matter=matter, date=period_start
+    )
+    models.Invoice.objects.filter(matter=matter).delete()
+
+    assert services.generate_period_invoices(period_start, period_end)
+    # retry of the same batch doesn't create duplicates
+    services.generate_period_invoices(period_start, period_end)
+
+    invoice = models.Invoice.objects.get(
+        matter=matter, period_start=period_start, period_end=period_end
+    )
+    assert invoice.attached_time_billing.get().time_billing == billing_item
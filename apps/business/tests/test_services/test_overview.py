@@ -0,0 +1,59 @@
+from django.urls import reverse_lazy
+
+from rest_framework.test import APIClient
+
+from libs.testing.constants import NO_CONTENT
+
+from apps.documents.factories import FolderFactory
+
+from ....users.models import Client
+from ... import factories, models, services
+from ...services.overview import calculate_matters_counters
+
+
+def test_calculate_matters_counters():
+    """Test that matters without unread or due items get empty counters."""
+    matter = factories.MatterFactory()
+    matter.folders.update(seen=True)
+
+    assert calculate_matters_counters([matter.pk]) == {
+        matter.pk: services.EMPTY_COUNTERS,
+    }
+
+
+def test_client_overview_is_invalidated():
+    """Test that cached counters are dropped when new folder is added."""
+    matter = factories.MatterFactory()
+    counters = services.get_client_matters_counters(matter.client_id)
+
+    FolderFactory(matter=matter, seen=False)
+
+    new_counters = services.get_client_matters_counters(matter.client_id)
+    assert (
+        new_counters[matter.pk].unread_document_count >
+        counters[matter.pk].unread_document_count
+    )
+
+
+def test_client_overview_is_invalidated_on_mark_read(
+    auth_client_api: APIClient, matter: models.Matter, client: Client,
+):
+    """Test that cached counters are dropped when client reads comment."""
+    post = models.MatterPost.objects.create(matter=matter, title='Post')
+    post.participants.add(client.user)
+    comment = models.MatterComment.objects.create(
+        post=post, author=matter.attorney.user, text='Comment',
+    )
+    comment.participants.add(client.user)
+    counters = services.get_client_matters_counters(matter.client_id)
+
+    response = auth_client_api.post(reverse_lazy(
+        'v1:matter-comment-mark-read', kwargs={'pk': comment.pk}
+    ))
+    assert response.status_code == NO_CONTENT
+
+    new_counters = services.get_client_matters_counters(matter.client_id)
+    assert (
+        new_counters[matter.pk].unread_message_count ==
+        counters[matter.pk].unread_message_count - 1
+    )
@@ -0,0 +1,29 @@
+import arrow
+
+from ... import factories, models, services
+
+
+def test_deferred_billing_items_reconciliation():
+    """Check that items saved in deferred block are reconciled at once."""
+    matter = factories.MatterFactory(
+        fee_type_id=models.Matter.FEE_TYPE_HOURLY_ID
+    )
+    date = arrow.utcnow().shift(months=-2).date()
+    invoice = factories.InvoiceFactory(
+        matter=matter, period_start=date, period_end=date
+    )
+
+    with services.deferred_billing_items_reconciliation():
+        billing_items = [
+            factories.BillingItemFactory(matter=matter, date=date)
+            for _ in range(2)
+        ]
+    assert not invoice.attached_time_billing.exists()
+
+    services.reconcile_billing_items_attachments([
+        (matter.pk, date.isoformat())
+    ])
+
+    assert set(
+        invoice.attached_time_billing.values_list('time_billing', flat=True)
+    ) == {billing_item.pk for billing_item in billing_items}
@@ -0,0 +1,44 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from redis.exceptions import RedisError
+
+from ... import factories, models, services
+
+
+@patch('apps.business.services.timers.get_redis', side_effect=RedisError)
+def test_get_timer_state_without_redis(get_redis_mock):
+    """Check that timer's state is calculated from time entries."""
+    user = factories.AttorneyFactory().user
+    now = timezone.now()
+    models.TimeEntry.objects.create(
+        created_by=user,
+        start_time=now - timedelta(hours=3),
+        end_time=now - timedelta(hours=2),
+    )
+    models.TimeEntry.objects.create(
+        created_by=user,
+        start_time=now - timedelta(minutes=30),
+        end_time=now - timedelta(minutes=20),
+    )
+    models.TimeEntry.objects.create(
+        created_by=user, start_time=now - timedelta(minutes=5),
+    )
+
+    state = services.get_timer_state(user.pk)
+
+    assert state == services.TimerState(
+        accumulated=timedelta(hours=1, minutes=10),
+        started_at=now - timedelta(minutes=5),
+    )
+    elapsed_time, is_running = services.get_elapsed_time(user)
+    assert is_running
+    assert elapsed_time >= timedelta(hours=1, minutes=15)
+
+    db_elapsed_time, db_is_running = models.TimeEntry.calculate_elapsed_time(
+        user
+    )
+    assert db_is_running
+    assert abs(db_elapsed_time - elapsed_time) < timedelta(minutes=1)
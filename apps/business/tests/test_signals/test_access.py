@@ -0,0 +1,53 @@
+from ....users.factories import AttorneyFactory
+from ... import factories, models
+
+
+def get_access(matter: models.Matter) -> set:
+    """Get matter's access index as set of (user id, kind)."""
+    return set(matter.access.values_list('user_id', 'kind'))
+
+
+def test_matter_access_is_updated():
+    """Test that access index follows matter's participants."""
+    matter = factories.MatterFactory()
+    assert get_access(matter) == {
+        (matter.attorney_id, models.MatterAccess.KIND_ATTORNEY),
+        (matter.client_id, models.MatterAccess.KIND_CLIENT),
+    }
+
+    new_attorney = AttorneyFactory()
+    matter.attorney = new_attorney
+    matter.save()
+    assert (
+        new_attorney.pk, models.MatterAccess.KIND_ATTORNEY
+    ) in get_access(matter)
+    assert models.Matter.objects.available_for_user(
+        new_attorney.user
+    ).filter(pk=matter.pk).exists()
+
+
+def test_shared_matter_access_is_updated():
+    """Test that access index follows matter's sharing."""
+    shared = factories.MatterSharedWithFactory()
+    shared_access = (shared.user_id, models.MatterAccess.KIND_SHARED)
+    assert shared_access in get_access(shared.matter)
+
+    shared.delete()
+    assert shared_access not in get_access(shared.matter)
+
+    shared.matter.shared_with.add(shared.user)
+    assert shared_access in get_access(shared.matter)
+
+
+def test_referral_access_is_updated():
+    """Test that referred attorney gets access and loses it with referral."""
+    referred_attorney = AttorneyFactory()
+    referral = models.Referral.objects.create(attorney=referred_attorney)
+    matter = factories.MatterFactory(referral=referral)
+    referral_access = (
+        referred_attorney.pk, models.MatterAccess.KIND_REFERRAL
+    )
+    assert referral_access in get_access(matter)
+
+    referral.delete()
+    assert referral_access not in get_access(matter)
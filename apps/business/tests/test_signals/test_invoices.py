@@ -379,3 +379,38 @@ def test_attach_invoice_to_paid_or_to_be_paid_tb(matter: models.Matter):
         assert time_billing not in new_invoice.time_billing.all()
     for time_billing in to_be_paid_invoice.time_billing.all():
         assert time_billing not in new_invoice.time_billing.all()
+
+
+def test_invoice_totals_are_synced(matter: models.Matter):
+    """Check that stored invoice totals follow its billing items changes."""
+    invoice = factories.InvoiceFactory(matter=matter)
+    first, second = (
+        factories.BillingItemFactory(
+            matter=matter,
+            billing_type=models.BillingItem.BILLING_TYPE_EXPENSE,
+            total_amount=amount,
+            time_spent=timedelta(minutes=30),
+        )
+        for amount in (10, 5)
+    )
+
+    invoice.billing_items.add(first, second)
+    invoice.refresh_from_db()
+    assert invoice.total_amount == 15
+    assert invoice.fees_earned == 15
+    assert invoice.time_billed == timedelta(hours=1)
+
+    first.total_amount = 20
+    first.save()
+    invoice.refresh_from_db()
+    assert invoice.total_amount == 25
+
+    second.delete()
+    invoice.refresh_from_db()
+    assert invoice.total_amount == 20
+    assert invoice.time_billed == timedelta(minutes=30)
+
+    first.billing_items_invoices.clear()
+    invoice.refresh_from_db()
+    assert invoice.total_amount == 0
+    assert invoice.time_billed == timedelta()
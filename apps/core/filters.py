@@ -1,11 +1,11 @@
 from django.db.models.sql.constants import ORDER_PATTERN
 
-from rest_framework.filters import OrderingFilter
-
 import inflection
 from admin_auto_filters.filters import \
     AutocompleteFilter as BaseAutocompleteFilter
 
+from libs.api.filters import AnnotatedOrderingFilter
+
 
 def autocomplete_filter_class(field_name: str):
     """Create autocomplete filter for admin"""
@@ -21,7 +21,7 @@ def autocomplete_filter_class(field_name: str):
     return AutocompleteFilter
 
 
-class CustomOrderingFilter(OrderingFilter):
+class CustomOrderingFilter(AnnotatedOrderingFilter):
 
     def remove_invalid_fields(self, queryset, fields, view, request):
         """
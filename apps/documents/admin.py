@@ -192,3 +192,35 @@ class FolderAdmin(ResourceAdminMixin, BaseAdmin):
         if not obj:
             return has_permission
         return has_permission and not obj.is_root_global_template
+
+
+@admin.register(models.ContractRecord)
+class ContractRecordAdmin(BaseAdmin):
+    """Admin panel for `ContractRecord` model."""
+    list_display = (
+        'document',
+        'kind',
+        'status',
+        'attempts',
+        'next_attempt',
+        'transaction_id',
+        'created',
+    )
+    list_filter = (
+        'status',
+        'kind',
+    )
+    search_fields = ('transaction_id',)
+    ordering = (
+        '-created',
+    )
+    readonly_fields = (
+        'document',
+        'kind',
+        'attempts',
+        'transaction_id',
+        'error',
+    )
+    list_select_related = (
+        'document',
+    )
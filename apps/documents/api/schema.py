@@ -24,3 +24,20 @@ define_swagger_auto_schema(
         201: serializers.FolderSerializer
     }
 )
+
+define_swagger_auto_schema(
+    api_view=views.FolderViewSet,
+    method_name='copy_progress',
+    responses={
+        200: serializers.CopyProgressSerializer
+    }
+)
+
+define_swagger_auto_schema(
+    api_view=views.ResourcesView,
+    method_name='share',
+    request_body=serializers.ShareResourcesSerializer,
+    responses={
+        200: serializers.ShareResourcesSerializer
+    }
+)
@@ -8,7 +8,7 @@ from apps.business.models import Matter
 from apps.core.api.serializers import BaseSerializer
 from apps.users.api.serializers import AppUserShortSerializer
 
-from ...documents import models, utils
+from ...documents import models, services
 from ...users.api.serializers import AppUserWithoutTypeSerializer
 from ...users.models import AppUser
 
@@ -148,14 +148,70 @@ class DuplicateFolderSerializer(DuplicateResourceSerializer):
         model = models.Folder
 
     def update(self, instance, validated_data):
-        """Save copy of folder."""
-        subfolders = instance.folders.all()
-        documents = instance.documents.all()
+        """Save copy of folder with its subfolders and documents.
+
+        Resources of big folders are copied in background.
+
+        """
+        source = models.Folder(pk=instance.pk, path=instance.path)
         instance = super().update(instance, validated_data)
-        utils.copy_folder_resources(instance, subfolders, documents)
+        services.duplicate_folder_resources(source, instance)
         return instance
 
 
+class CopyProgressSerializer(serializers.Serializer):
+    """Serializer for progress of copying resources to folder."""
+    status = serializers.CharField(read_only=True)
+    copied = serializers.IntegerField(read_only=True, allow_null=True)
+    total = serializers.IntegerField(read_only=True, allow_null=True)
+
+
+class ShareResourcesSerializer(serializers.Serializer):
+    """Serializer for batch sharing of folders and documents.
+
+    Resources are limited to ones available for user.
+
+    """
+    folders = serializers.PrimaryKeyRelatedField(
+        queryset=models.Folder.objects.all(), many=True, required=False
+    )
+    documents = serializers.PrimaryKeyRelatedField(
+        queryset=models.Document.objects.all(), many=True, required=False
+    )
+    add = serializers.PrimaryKeyRelatedField(
+        queryset=AppUser.objects.all(), many=True, required=False
+    )
+    remove = serializers.PrimaryKeyRelatedField(
+        queryset=AppUser.objects.all(), many=True, required=False
+    )
+    cascade = serializers.BooleanField(default=False)
+    shared = serializers.IntegerField(read_only=True)
+    unshared = serializers.IntegerField(read_only=True)
+
+    def get_fields(self):
+        """Limit resources."""
+        fields = super().get_fields()
+        user = self.context['request'].user
+        fields['folders'].child_relation.queryset = (
+            models.Folder.objects.available_for_user(user)
+        )
+        fields['documents'].child_relation.queryset = (
+            models.Document.objects.available_for_user(user)
+        )
+        return fields
+
+    def create(self, validated_data):
+        """Apply sharing diff to resources."""
+        return services.share_resources(
+            user=self.context['request'].user,
+            folders=validated_data.get('folders', ()),
+            documents=validated_data.get('documents', ()),
+            add_users=validated_data.get('add', ()),
+            remove_users=validated_data.get('remove', ()),
+            cascade=validated_data['cascade'],
+        )
+
+
 class DuplicateDocumentSerializer(DuplicateResourceSerializer):
     """Serializer for duplicating `Document` model."""
 
@@ -1,137 +1,112 @@
-from collections import OrderedDict
-
 from django.db.utils import IntegrityError
 
 from rest_framework import mixins, status
 from rest_framework.decorators import action
+from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from drf_multiple_model.pagination import MultipleModelLimitOffsetPagination
-from drf_multiple_model.viewsets import FlatMultipleModelAPIViewSet
+from django_filters.rest_framework import DjangoFilterBackend
+
+from libs.api.pagination import UnionKeysetPagination
 
 from apps.core.api.views import BaseViewSet
+from apps.users.models import AppUser
 
-from ...documents import models
+from ...documents import models, services
 from . import filters, serializers
 from .serializers import DownloadFolderSerializer
 
 
-class LimitPagination(MultipleModelLimitOffsetPagination):
+class ResourcesPagination(UnionKeysetPagination):
     default_limit = 5
-    page_count = 0
-
-    def paginate_queryset(self, queryset, request, view=None):
-        result = super().paginate_queryset(queryset, request, view)
-        self.page_count += len(result)
-        return result
 
-    def format_response(self, data):
-        self.count = self.max_count
 
-        return OrderedDict([
-            ('highest_count', self.max_count),
-            ('overall_total', self.total),
-            ('page_count', self.page_count),
-            ('next', self.get_next_link()),
-            ('previous', self.get_previous_link()),
-            ('results', data)
-        ])
+class ResourcesView(BaseViewSet):
+    """View for available to user resources.
 
+    Folders and documents are listed as one SQL UNION of rows with common
+    columns, so filtering, search, ordering and keyset pagination are done
+    by db in one query.
 
-class ResourcesView(FlatMultipleModelAPIViewSet, BaseViewSet):
-    """View for available to user resources."""
-    pagination_class = LimitPagination
+    """
+    pagination_class = ResourcesPagination
     filterset_class = filters.ResourceFilter
     search_fields = (
         'title',
     )
-    ordering_fields = (
-        'id',
-        'title',
-        'created',
-        'modified',
-        'owner',
-        'matter',
+    resources_filter_backends = (
+        DjangoFilterBackend,
+        SearchFilter,
     )
+    serializers_by_type = {
+        models.Folder.__name__: serializers.FolderSerializer,
+        models.Document.__name__: serializers.DocumentSerializer,
+    }
 
-    def get_querylist(self):
-        """Set up queryset and serializer class for each resource model."""
+    def get_resources_querysets(self):
+        """Get filtered querysets of available folders and documents."""
         qp = self.request.query_params
         client_id = qp.get('client', None)
-        folders = models.Folder.objects.available_for_user(
-            self.request.user
-        ).select_related(
-            'matter',
-            'client',
-            'owner',
-        ).prefetch_related(
-            'shared_with',
-            'shared_with__attorney',
-            'shared_with__paralegal',
-            'shared_with__client',
-        )
-        documents = models.Document.objects.available_for_user(
-            self.request.user
-        ).select_related(
-            'matter',
-            'client',
-            'owner',
-            'created_by',
-        ).prefetch_related(
-            'shared_with',
-            'shared_with__attorney',
-            'shared_with__paralegal',
-            'shared_with__client',
-        )
         is_parent = qp.get('is_parent', None)
-        try:
-            if client_id is not None:
-                folders = folders.filter(matter__client__pk=client_id)
-                documents = documents.filter(matter__client__pk=client_id)
-            if is_parent == 'true':
-                folders = folders.filter(parent__isnull=True)
-                documents = documents.filter(parent__isnull=True)
-        except ValueError:
-            folders = models.Folder.objects.none()
-            documents = models.Document.objects.none()
-
-        querylist = (
-            {
-                'queryset': folders,
-                'serializer_class': serializers.FolderSerializer,
-            },
-            {
-                'queryset': documents,
-                'serializer_class': serializers.DocumentSerializer,
-            },
-        )
+        querysets = []
+        for model in (models.Folder, models.Document):
+            queryset = model.objects.available_for_user(self.request.user)
+            try:
+                if client_id is not None:
+                    queryset = queryset.filter(matter__client__pk=client_id)
+                if is_parent == 'true':
+                    queryset = queryset.filter(parent__isnull=True)
+            except ValueError:
+                queryset = model.objects.none()
+            for backend in self.resources_filter_backends:
+                queryset = backend().filter_queryset(
+                    self.request, queryset, self
+                )
+            querysets.append(services.annotate_resources(queryset))
+        return querysets
+
+    def get_ordering(self):
+        """Get ordering of resources from `ordering` params."""
+        ordering = []
+        for param in self.request.query_params.getlist('ordering', []):
+            ordering.extend(
+                field.strip() for field in param.split(',') if field.strip()
+            )
+        return services.get_resources_ordering(ordering)
 
-        return querylist
+    def list(self, request, *args, **kwargs):
+        """Return page of folders and documents."""
+        rows = self.paginator.paginate_union(
+            self.get_resources_querysets(), self.get_ordering(), request
+        )
+        context = self.get_serializer_context()
+        data = []
+        for instance in services.get_resources_instances(rows):
+            resource_type = type(instance).__name__
+            serializer_class = self.serializers_by_type[resource_type]
+            item = serializer_class(instance, context=context).data
+            item['type'] = resource_type
+            data.append(item)
+        return self.paginator.get_paginated_response(data)
+
+    @action(methods=['post'], detail=False)
+    def share(self, request, *args, **kwargs):
+        """Share and unshare batch of folders and documents.
+
+        Users from `add` get access to all resources, users from `remove`
+        lose it. If `cascade` is set, subfolders and documents of folders
+        are shared too.
 
-    def format_results(self, results, request):
-        """
-        Prepares sorting parameters, and sorts results, if(as) necessary
         """
-        self.prepare_sorting_fields()
-        if self._sorting_fields:
-            results = self.sort_results(results)
-
-        if request.accepted_renderer.format == 'html':
-            results = {'data': results}
-
-        fields = request.query_params.getlist('ordering', [])
-        for field in fields:
-            reverse = False
-            if field.startswith('-'):
-                reverse = True
-                field = field[1:]
-            results = sorted(
-                results,
-                key=lambda k: (k[field] is not None, k[field]),
-                reverse=reverse
-            )
-        return results
+        serializer = serializers.ShareResourcesSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save()
+        return Response(
+            data=result._asdict(), status=status.HTTP_200_OK
+        )
 
 
 class BaseResourceViewSet(
@@ -183,45 +158,38 @@ class BaseResourceViewSet(
 
     @action(methods=['post'], detail=True)
     def add_shared_with(self, request, *args, **kwargs):
-        shared_with = request.data.get('shared_with')
-        resource = self.get_object()
-        for user in shared_with:
-            resource.shared_with.add(user)
-        resource.save()
-        if isinstance(resource, models.Folder):
-            data = serializers.FolderSerializer(instance=resource).data
-        else:
-            data = serializers.DocumentSerializer(instance=resource).data
-        try:
-            return Response(
-                status=status.HTTP_200_OK,
-                data=data
-            )
-        except Exception:
-            return Response(
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        """Share resource with users."""
+        return self.update_shared_with(request, 'add_users')
 
     @action(methods=['post'], detail=True)
     def remove_shared_with(self, request, *args, **kwargs):
-        shared_with = request.data.get('shared_with')
+        """Unshare resource from users."""
+        return self.update_shared_with(request, 'remove_users')
+
+    def update_shared_with(self, request, users_argument: str):
+        """Apply `shared_with` users of request to resource.
+
+        Users are added or removed(depending on `users_argument`) by
+        `share_resources` with one query.
+
+        """
+        resource = self.get_object()
+        users = AppUser.objects.filter(
+            pk__in=request.data.get('shared_with') or []
+        )
+        resources_argument = (
+            'folders' if isinstance(resource, models.Folder) else 'documents'
+        )
+        services.share_resources(
+            user=request.user,
+            **{resources_argument: [resource], users_argument: users},
+        )
         resource = self.get_object()
-        for user in shared_with:
-            resource.shared_with.remove(user)
-        resource.save()
         if isinstance(resource, models.Folder):
             data = serializers.FolderSerializer(instance=resource).data
         else:
             data = serializers.DocumentSerializer(instance=resource).data
-        try:
-            return Response(
-                status=status.HTTP_200_OK,
-                data=data
-            )
-        except Exception:
-            return Response(
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        return Response(status=status.HTTP_200_OK, data=data)
 
 
 class FolderViewSet(BaseResourceViewSet):
@@ -256,6 +224,14 @@ class FolderViewSet(BaseResourceViewSet):
         'destroy': folder_permissions,
     }
 
+    @action(methods=['get'], detail=True)
+    def copy_progress(self, request, *args, **kwargs):
+        """Return progress of copying resources to duplicated folder."""
+        folder = self.get_object()
+        progress = services.get_copy_progress(folder.pk)
+        serializer = serializers.CopyProgressSerializer(progress._asdict())
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
     @action(methods=['get'], detail=True)
     def download(self, request, *args, **kwargs):
         """Returns list of documents in the folder."""
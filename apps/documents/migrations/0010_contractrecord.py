@@ -0,0 +1,40 @@
+# Generated by Django 3.0.9 on 2026-10-17 10:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0009_auto_20211023_1409'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContractRecord',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('kind', models.PositiveSmallIntegerField(choices=[(0, 'Document')], verbose_name='Kind')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of attempts to send record', verbose_name='Attempts')),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now, help_text='Time after which record can be sent', verbose_name='Next attempt')),
+                ('transaction_id', models.CharField(blank=True, max_length=128, null=True, verbose_name='Transaction ID')),
+                ('error', models.TextField(blank=True, help_text='Error of last failed attempt', verbose_name='Error')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contract_records', to='documents.Document', verbose_name='Document')),
+            ],
+            options={
+                'verbose_name': 'Contract record',
+                'verbose_name_plural': 'Contract records',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contractrecord',
+            index=models.Index(condition=models.Q(status='pending'), fields=['next_attempt'], name='pending_contract_records'),
+        ),
+    ]
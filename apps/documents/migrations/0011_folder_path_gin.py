@@ -0,0 +1,18 @@
+# Generated by Django 3.0.9 on 2026-10-17 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0010_contractrecord'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='folder',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['path'], name='folder_path_gin'),
+        ),
+    ]
@@ -1,6 +1,8 @@
+from .records import ContractRecord
 from .resources import Document, Folder, Resource
 
 __all__ = (
+    'ContractRecord',
     'Document',
     'Folder',
     'Resource',
@@ -1,4 +1,6 @@
 from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 
 from apps.users.models import AppUser
 
@@ -12,30 +14,18 @@ class ResourceQuerySet(QuerySet):
 
     def available_for_user(self, user: AppUser):
         """Get resources, which user owns."""
-        from apps.business.models import Matter
-
-        available_matters = Matter.objects.all().available_for_user(user) \
-            .values('id')
-        if user.is_attorney:
-            qs = self.filter(
-                Q(owner=user) |
-                Q(matter_id__in=available_matters) |
-                Q(is_template=True, owner=None)
-            )
-        elif user.is_client:
-            qs = self.filter(
-                Q(owner=user) |
-                Q(matter_id__in=available_matters)
-            )
-        else:
-            qs = self.filter(
-                Q(owner=user) |
-                Q(matter_id__in=available_matters) |
-                Q(is_template=True, owner=None)
-            )
-        # matter__shared_links Creates duplicates
-        # It generates `right join`
-        return qs.distinct()
+        from apps.business.models.querysets import (
+            get_available_matters_filter,
+        )
+
+        available = (
+            Q(owner=user) |
+            Q(get_available_matters_filter(user, 'matter'))
+        )
+        if not user.is_client or user.is_attorney:
+            available |= Q(is_template=True, owner=None)
+        # filters applied later(like by `shared_with`) may create duplicates
+        return self.filter(available).distinct()
 
     def private_resources(self, user: AppUser):
         """Get user's private resources.
@@ -64,6 +54,36 @@ class FolderQuerySet(ResourceQuerySet):
         # Show for client only shared folders
         return qs
 
+    def descendants(self, folder):
+        """Get subfolders of folder on all levels.
+
+        Folder's id is present only in paths of its subtree, so lookup
+        `path @> ARRAY[id]` is used (it's served by GIN index on path).
+
+        """
+        return self.filter(path__contains=[folder.pk]).exclude(pk=folder.pk)
+
+    def update_descendants_paths(self, folder) -> int:
+        """Rewrite paths of folder's descendants by folder's path.
+
+        Part of descendant's path up to folder's id is replaced with
+        folder's current path by single UPDATE
+        (`path = folder_path || path[position of folder + 1:]`), paths which
+        already start with folder's path aren't touched.
+
+        Returns:
+            Number of updated folders
+
+        """
+        new_path = RawSQL(
+            '%s::integer[] || '
+            'path[array_position(path, %s) + 1:array_length(path, 1)]',
+            (folder.path, folder.pk),
+        )
+        return self.descendants(folder).exclude(**{
+            f'path__0_{len(folder.path)}': folder.path
+        }).update(path=new_path)
+
     def root_admin_template_folder(self):
         """Get root admin template folder."""
         return self.get(
@@ -79,3 +99,14 @@ class DocumentQuerySet(ResourceQuerySet):
         qs = super().available_for_user(user)
         # Show for client only documents in shared folders
         return qs
+
+
+class ContractRecordQuerySet(QuerySet):
+    """QuerySet for `ContractRecord` model."""
+
+    def due(self):
+        """Get pending records, which should be sent now."""
+        return self.filter(
+            status=self.model.STATUS_PENDING,
+            next_attempt__lte=timezone.now(),
+        )
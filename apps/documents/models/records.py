@@ -0,0 +1,139 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from config.enums import RecordContractKind
+
+from apps.core.models import BaseModel
+
+from . import querysets
+
+__all__ = (
+    'ContractRecord',
+)
+
+
+class ContractRecord(BaseModel):
+    """Outbox of records, which should be written to record contract.
+
+    Record is created in the same transaction as recorded document, so
+    uploads don't wait for ethereum node and records aren't lost when node is
+    unavailable. Records are sent by `send_contract_records` task, failed ones
+    are retried with exponential backoff.
+
+    Attributes:
+        document (Document): Recorded document
+        kind (int): Kind of record in contract
+        status (str): Status of record
+            pending - record waits to be sent
+            sent - record's transaction is sent
+            failed - all attempts to send record failed
+        attempts (int): Number of attempts to send record
+        next_attempt (datetime): Time after which record can be sent
+        transaction_id (str): Hash of record's transaction
+        error (str): Error of last failed attempt
+
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _('Pending')),
+        (STATUS_SENT, _('Sent')),
+        (STATUS_FAILED, _('Failed')),
+    )
+
+    KIND_CHOICES = [
+        (kind.value, kind.name.title()) for kind in RecordContractKind
+    ]
+
+    document = models.ForeignKey(
+        'documents.Document',
+        on_delete=models.CASCADE,
+        related_name='contract_records',
+        verbose_name=_('Document'),
+    )
+
+    kind = models.PositiveSmallIntegerField(
+        choices=KIND_CHOICES,
+        verbose_name=_('Kind'),
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name=_('Status'),
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Attempts'),
+        help_text=_('Number of attempts to send record'),
+    )
+
+    next_attempt = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_('Next attempt'),
+        help_text=_('Time after which record can be sent'),
+    )
+
+    transaction_id = models.CharField(
+        max_length=128,
+        blank=True,
+        null=True,
+        verbose_name=_('Transaction ID'),
+    )
+
+    error = models.TextField(
+        blank=True,
+        verbose_name=_('Error'),
+        help_text=_('Error of last failed attempt'),
+    )
+
+    objects = querysets.ContractRecordQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _('Contract record')
+        verbose_name_plural = _('Contract records')
+        indexes = [
+            models.Index(
+                fields=['next_attempt'],
+                condition=models.Q(status='pending'),
+                name='pending_contract_records',
+            ),
+        ]
+
+    def __str__(self):
+        return f'Contract record of document #{self.document_id}'
+
+    def mark_sent(self, transaction_id: str):
+        """Mark record as sent by transaction."""
+        self.status = self.STATUS_SENT
+        self.attempts += 1
+        self.transaction_id = transaction_id
+        self.error = ''
+        self.save()
+
+    def mark_failed(self, error: Exception):
+        """Schedule next attempt to send record after failed one.
+
+        Delay between attempts is doubled after each of them (up to
+        `ETH_RECORDS_MAX_RETRY_DELAY`), after `ETH_RECORDS_MAX_ATTEMPTS`
+        record is marked as failed.
+
+        """
+        self.attempts += 1
+        self.error = repr(error)
+        if self.attempts >= settings.ETH_RECORDS_MAX_ATTEMPTS:
+            self.status = self.STATUS_FAILED
+        delay = min(
+            settings.ETH_RECORDS_RETRY_DELAY * 2 ** (self.attempts - 1),
+            settings.ETH_RECORDS_MAX_RETRY_DELAY,
+        )
+        self.next_attempt = timezone.now() + timedelta(seconds=delay)
+        self.save()
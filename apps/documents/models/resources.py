@@ -2,6 +2,7 @@ import mimetypes
 import uuid
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -262,6 +263,9 @@ class Folder(Resource):
         abstract = False
         verbose_name = _('Folder')
         verbose_name_plural = _('Folders')
+        indexes = [
+            GinIndex(fields=['path'], name='folder_path_gin'),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['title', 'parent'],
@@ -350,20 +354,35 @@ class Folder(Resource):
                 )
 
     def update_path(self):
-        """Update path field for self and children."""
+        """Update path field of folder by its parent."""
         if not self.parent_id:
             self.path = [self.pk]
         else:
             self.path = self.parent.path + [self.pk]
 
     def save(self, **kwargs):
-        """Update path field for folder and it's subfolders."""
-        super().save(**kwargs)
+        """Update path field for folder and it's subfolders.
+
+        New folder gets path after insert(its id is needed for it), paths of
+        subfolders are updated by single query.
+
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            if 'parent' not in update_fields:
+                super().save(**kwargs)
+                return
+            kwargs['update_fields'] = {*update_fields, 'path'}
+
+        if self.pk is None:
+            super().save(**kwargs)
+            self.update_path()
+            Folder.objects.filter(pk=self.pk).update(path=self.path)
+            return
+
         self.update_path()
-        super().save()
-        # TODO find a better solution to update subfolders paths
-        for folder in self.folders.all():
-            folder.save()
+        super().save(**kwargs)
+        Folder.objects.update_descendants_paths(self)
 
 
 class Document(Resource):
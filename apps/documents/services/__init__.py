@@ -1,5 +1,30 @@
+from .copying import (
+    CopyProgress,
+    copy_folder_resources_with_progress,
+    duplicate_folder_resources,
+    get_copy_progress,
+)
+from .listing import (
+    RESOURCES_ORDERING_FIELDS,
+    annotate_resources,
+    get_resources_instances,
+    get_resources_ordering,
+)
+from .records import send_contract_records
+from .sharing import SharingResult, share_resources
 from .statistics import get_attorney_statistics
 
 __all__ = (
+    'RESOURCES_ORDERING_FIELDS',
+    'CopyProgress',
+    'SharingResult',
+    'annotate_resources',
+    'copy_folder_resources_with_progress',
+    'duplicate_folder_resources',
     'get_attorney_statistics',
+    'get_copy_progress',
+    'get_resources_instances',
+    'get_resources_ordering',
+    'send_contract_records',
+    'share_resources',
 )
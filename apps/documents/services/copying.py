@@ -0,0 +1,107 @@
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .. import models, utils
+
+__all__ = (
+    'CopyProgress',
+    'duplicate_folder_resources',
+    'copy_folder_resources_with_progress',
+    'get_copy_progress',
+)
+
+CopyProgress = namedtuple('CopyProgress', ['status', 'copied', 'total'])
+
+COPY_STATUS_PENDING = 'pending'
+COPY_STATUS_IN_PROGRESS = 'in_progress'
+COPY_STATUS_COMPLETED = 'completed'
+COPY_STATUS_FAILED = 'failed'
+
+COPY_PROGRESS_KEY = 'documents:copy_progress:{folder_id}'
+
+
+def get_copy_progress(folder_id: int) -> CopyProgress:
+    """Get progress of copying resources to folder.
+
+    Folders without copying job (or which job's progress is expired) are
+    considered as completed ones.
+
+    """
+    progress = cache.get(COPY_PROGRESS_KEY.format(folder_id=folder_id))
+    if progress is None:
+        return CopyProgress(COPY_STATUS_COMPLETED, None, None)
+    return CopyProgress(*progress)
+
+
+def set_copy_progress(folder_id: int, progress: CopyProgress):
+    """Store progress of copying resources to folder."""
+    cache.set(
+        COPY_PROGRESS_KEY.format(folder_id=folder_id),
+        tuple(progress),
+        settings.DOCUMENTS_COPY_PROGRESS_TIMEOUT,
+    )
+
+
+def get_subtree_size(source: models.Folder) -> int:
+    """Get number of folders and documents in subtree of folder."""
+    subfolders = models.Folder.objects.descendants(source)
+    folders_ids = [source.pk, *subfolders.values_list('pk', flat=True)]
+    documents = models.Document.objects.filter(parent_id__in=folders_ids)
+    return len(folders_ids) - 1 + documents.count()
+
+
+def duplicate_folder_resources(
+    source: models.Folder, folder: models.Folder
+) -> bool:
+    """Copy resources of source folder to its copy.
+
+    Subtrees bigger than `DOCUMENTS_COPY_SYNC_LIMIT` resources are copied by
+    `copy_folder_resources` celery task, its progress can be checked by
+    `get_copy_progress`.
+
+    Returns:
+        True if resources will be copied in background
+
+    """
+    total = get_subtree_size(source)
+    if total <= settings.DOCUMENTS_COPY_SYNC_LIMIT:
+        utils.copy_folder_resources(source, folder)
+        return False
+
+    from .. import tasks
+
+    set_copy_progress(
+        folder.pk, CopyProgress(COPY_STATUS_PENDING, 0, total)
+    )
+    transaction.on_commit(
+        lambda: tasks.copy_folder_resources.delay(source.pk, folder.pk)
+    )
+    return True
+
+
+def copy_folder_resources_with_progress(
+    source: models.Folder, folder: models.Folder
+):
+    """Copy resources of source folder and report progress of copying."""
+    total = get_subtree_size(source)
+
+    def report(copied: int):
+        set_copy_progress(
+            folder.pk, CopyProgress(COPY_STATUS_IN_PROGRESS, copied, total)
+        )
+
+    report(0)
+    try:
+        with transaction.atomic():
+            utils.copy_folder_resources(source, folder, on_progress=report)
+    except Exception:
+        set_copy_progress(
+            folder.pk, CopyProgress(COPY_STATUS_FAILED, 0, total)
+        )
+        raise
+    set_copy_progress(
+        folder.pk, CopyProgress(COPY_STATUS_COMPLETED, total, total)
+    )
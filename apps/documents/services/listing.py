@@ -0,0 +1,123 @@
+import typing
+
+from django.db.models import CharField, F, QuerySet, Value
+from django.db.models.functions import Coalesce
+
+from .. import models
+
+__all__ = (
+    'RESOURCES_ORDERING_FIELDS',
+    'annotate_resources',
+    'get_resources_ordering',
+    'get_resources_instances',
+)
+
+# Columns of unified resources rows. Folders and documents are annotated
+# with them in the same order, so their union's columns match
+RESOURCE_COLUMNS = (
+    'resource_type',
+    'resource_id',
+    'resource_title',
+    'resource_created',
+    'resource_modified',
+    'resource_owner',
+    'resource_matter',
+)
+
+# Map of `ordering` param values to resources columns
+RESOURCES_ORDERING_FIELDS = {
+    'type': 'resource_type',
+    'id': 'resource_id',
+    'title': 'resource_title',
+    'created': 'resource_created',
+    'modified': 'resource_modified',
+    'owner': 'resource_owner',
+    'matter': 'resource_matter',
+}
+
+# Columns, which identify resource row, they end any ordering
+RESOURCE_KEY_COLUMNS = ('resource_type', 'resource_id')
+
+RESOURCES_MODELS = {
+    models.Folder.__name__: models.Folder,
+    models.Document.__name__: models.Document,
+}
+
+
+def annotate_resources(queryset: QuerySet) -> QuerySet:
+    """Get resources rows with `RESOURCE_COLUMNS` from folders or documents.
+
+    Owner and matter of resources without them are set to 0, so columns
+    aren't nullable and can be used in keyset pagination.
+
+    """
+    return queryset.annotate(
+        resource_type=Value(
+            queryset.model.__name__, output_field=CharField()
+        ),
+        resource_id=F('pk'),
+        resource_title=F('title'),
+        resource_created=F('created'),
+        resource_modified=F('modified'),
+        resource_owner=Coalesce('owner_id', 0),
+        resource_matter=Coalesce('matter_id', 0),
+    ).values(*RESOURCE_COLUMNS)
+
+
+def get_resources_ordering(
+    ordering: typing.Sequence[str]
+) -> typing.List[typing.Tuple[str, bool]]:
+    """Convert `ordering` params to pairs of (column, is descending).
+
+    Unknown fields are ignored, ordering always ends with resource's type
+    and id, so it identifies row.
+
+    """
+    columns = []
+    for field in ordering:
+        column = RESOURCES_ORDERING_FIELDS.get(field.lstrip('-'))
+        if column and column not in dict(columns):
+            columns.append((column, field.startswith('-')))
+    for column in RESOURCE_KEY_COLUMNS:
+        if column not in dict(columns):
+            columns.append((column, False))
+    return columns
+
+
+def get_resources_instances(rows: typing.Iterable[dict]) -> list:
+    """Get `Folder` and `Document` instances for resources rows.
+
+    Instances are returned in the same order as rows, each model is fetched
+    by one query(plus prefetching of users with which it's shared).
+
+    """
+    rows = list(rows)
+    instances = {}
+    for resource_type, model in RESOURCES_MODELS.items():
+        ids = [
+            row['resource_id'] for row in rows
+            if row['resource_type'] == resource_type
+        ]
+        if not ids:
+            continue
+        queryset = model.objects.filter(pk__in=ids).select_related(
+            'matter',
+            'client',
+            'owner',
+        ).prefetch_related(
+            'shared_with',
+            'shared_with__attorney',
+            'shared_with__paralegal',
+            'shared_with__client',
+        )
+        if model is models.Document:
+            queryset = queryset.select_related('created_by')
+        instances.update(
+            ((resource_type, instance.pk), instance) for instance in queryset
+        )
+    return [
+        instances[key] for key in (
+            (row['resource_type'], row['resource_id']) for row in rows
+        )
+        if key in instances
+    ]
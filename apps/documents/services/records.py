@@ -0,0 +1,54 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from ...utils import eth
+from .. import models
+
+__all__ = (
+    'send_contract_records',
+)
+
+logger = logging.getLogger('django')
+
+
+def send_contract_records() -> int:
+    """Send due records of outbox to record contract.
+
+    Records are locked with `SKIP LOCKED`, so concurrent runs don't send the
+    same record twice. Sent record's transaction id is copied to its
+    document, failed ones are scheduled for retry.
+
+    Returns:
+        Number of sent records
+
+    """
+    writer = eth.get_record_writer()
+    sent_count = 0
+    while True:
+        with transaction.atomic():
+            records = list(
+                models.ContractRecord.objects.due().select_for_update(
+                    skip_locked=True
+                ).order_by('next_attempt')[:settings.ETH_RECORDS_BATCH_SIZE]
+            )
+            if not records:
+                return sent_count
+            for record in records:
+                try:
+                    transaction_id = writer.write(
+                        record.document_id, record.kind
+                    )
+                except Exception as error:
+                    logger.warning(
+                        f'Failed to send contract record #{record.pk}: '
+                        f'{error!r}'
+                    )
+                    record.mark_failed(error)
+                    continue
+                record.mark_sent(transaction_id)
+                models.Document.objects.filter(
+                    pk=record.document_id
+                ).update(transaction_id=transaction_id)
+                sent_count += 1
@@ -0,0 +1,141 @@
+import typing
+from collections import namedtuple
+
+from django.db import models as db_models
+from django.db import transaction
+
+from ...users.models import AppUser
+from .. import models, signals
+
+__all__ = (
+    'SharingResult',
+    'share_resources',
+)
+
+SharingResult = namedtuple('SharingResult', ['shared', 'unshared'])
+
+
+def share_resources(
+    user: AppUser,
+    folders: typing.Iterable[models.Folder] = (),
+    documents: typing.Iterable[models.Document] = (),
+    add_users: typing.Iterable[AppUser] = (),
+    remove_users: typing.Iterable[AppUser] = (),
+    cascade: bool = False,
+) -> SharingResult:
+    """Share resources with users and unshare them from others.
+
+    Diff is applied with one DELETE and one bulk INSERT per through table of
+    `shared_with`. If `cascade` is set, folders' subfolders (found by path)
+    and documents of all these folders are shared too. Users, which got
+    access to new resources, are notified by one `resources_shared` signal.
+
+    Arguments:
+        user: user who shares resources
+        folders: shared folders
+        documents: shared documents
+        add_users: users to share resources with
+        remove_users: users to unshare resources from
+        cascade: share subtrees of folders too
+
+    Returns:
+        Number of created and deleted shares
+
+    """
+    folders_ids = {folder.pk for folder in folders}
+    documents_ids = {document.pk for document in documents}
+    add_ids = {added_user.pk for added_user in add_users}
+    remove_ids = {removed_user.pk for removed_user in remove_users} - add_ids
+
+    if cascade and folders_ids:
+        folders_ids.update(
+            models.Folder.objects.filter(
+                path__overlap=list(folders_ids)
+            ).values_list('pk', flat=True)
+        )
+        documents_ids.update(
+            models.Document.objects.filter(
+                parent_id__in=folders_ids
+            ).values_list('pk', flat=True)
+        )
+
+    shared = unshared = 0
+    receivers_ids = set()
+    with transaction.atomic():
+        for model, ids in ((models.Folder, folders_ids),
+                           (models.Document, documents_ids)):
+            if not ids:
+                continue
+            unshared += _unshare(model, ids, remove_ids)
+            created = _share(model, ids, add_ids)
+            shared += len(created)
+            receivers_ids.update(user_id for _, user_id in created)
+
+    if receivers_ids:
+        signals.resources_shared.send(
+            sender=AppUser,
+            instance=user,
+            receiver_pks=receivers_ids,
+            resources_count=shared,
+        )
+    return SharingResult(shared=shared, unshared=unshared)
+
+
+def _get_through_fields(
+    model: typing.Type[db_models.Model]
+) -> typing.Tuple[typing.Type[db_models.Model], str, str]:
+    """Get through model of `shared_with` and names of its columns."""
+    field = model._meta.get_field('shared_with')
+    return (
+        field.remote_field.through,
+        f'{field.m2m_field_name()}_id',
+        f'{field.m2m_reverse_field_name()}_id',
+    )
+
+
+def _unshare(
+    model: typing.Type[db_models.Model], ids: set, users_ids: set
+) -> int:
+    """Delete shares of resources with users by one query."""
+    if not users_ids:
+        return 0
+    through, resource_column, user_column = _get_through_fields(model)
+    deleted, _ = through.objects.filter(**{
+        f'{resource_column}__in': ids,
+        f'{user_column}__in': users_ids,
+    }).delete()
+    return deleted
+
+
+def _share(
+    model: typing.Type[db_models.Model], ids: set, users_ids: set
+) -> typing.List[typing.Tuple[int, int]]:
+    """Create missing shares of resources with users by one bulk INSERT.
+
+    Returns:
+        Created pairs of (resource id, user id)
+
+    """
+    if not users_ids:
+        return []
+    through, resource_column, user_column = _get_through_fields(model)
+    existing = set(
+        through.objects.filter(**{
+            f'{resource_column}__in': ids,
+            f'{user_column}__in': users_ids,
+        }).values_list(resource_column, user_column)
+    )
+    created = [
+        (resource_id, user_id)
+        for resource_id in ids
+        for user_id in users_ids
+        if (resource_id, user_id) not in existing
+    ]
+    through.objects.bulk_create(
+        (
+            through(**{resource_column: resource_id, user_column: user_id})
+            for resource_id, user_id in created
+        ),
+        ignore_conflicts=True,
+    )
+    return created
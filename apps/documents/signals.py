@@ -1,12 +1,12 @@
 import mimetypes
 
+from django.db import transaction
 from django.db.models import signals
 from django.dispatch import Signal, receiver
 
 from config.enums import RecordContractKind
 
-from ..utils import eth
-from . import models
+from . import models, tasks
 
 document_shared_by_attorney = Signal(providing_args=('instance',))
 document_shared_by_attorney.__doc__ = (
@@ -21,6 +21,13 @@ document_uploaded_to_matter = Signal(providing_args=('instance',))
 document_uploaded_to_matter.__doc__ = (
     'Signal that indicates that document/folder was in the matter.'
 )
+resources_shared = Signal(
+    providing_args=('instance', 'receiver_pks', 'resources_count')
+)
+resources_shared.__doc__ = (
+    'Signal that indicates that user(instance) shared batch of resources '
+    'with users'
+)
 
 # @receiver(signals.pre_save, sender=models.Folder)
 # @receiver(signals.pre_save, sender=models.Document)
@@ -100,12 +107,17 @@ def new_shared_file(
 def save_to_contract(
     instance: models.Document, created: bool, **kwargs
 ):
-    if not created:
-        return
+    """Put record of new document to outbox of record contract.
 
-    transaction_id = eth.create_new_record(
-        instance.id, RecordContractKind.DOCUMENT)
+    Record is created in the same transaction as document and it's sent by
+    `send_contract_records` task after commit, so upload doesn't wait for
+    ethereum node.
 
-    instance.transaction_id = transaction_id
+    """
+    if not created:
+        return
 
-    instance.save()
+    models.ContractRecord.objects.create(
+        document=instance, kind=RecordContractKind.DOCUMENT
+    )
+    transaction.on_commit(tasks.send_contract_records.delay)
@@ -0,0 +1,27 @@
+from config.celery import app
+
+from . import models, services
+
+
+@app.task()
+def send_contract_records():
+    """Send due records of documents to record contract.
+
+    Task is routed to `blockchain` queue, which is consumed by single
+    process worker, it's started after each uploaded document and by beat
+    to retry failed records.
+
+    """
+    services.send_contract_records()
+
+
+@app.task()
+def copy_folder_resources(source_id: int, folder_id: int):
+    """Copy resources of big folder to its copy in background.
+
+    Progress of copying is available by `services.get_copy_progress`.
+
+    """
+    source = models.Folder.objects.get(pk=source_id)
+    folder = models.Folder.objects.get(pk=folder_id)
+    services.copy_folder_resources_with_progress(source, folder)
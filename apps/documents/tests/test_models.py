@@ -120,6 +120,25 @@ class TestFolderModel:
         with pytest.raises(IntegrityError):
             other_folder.save()
 
+    def test_path_of_subtree_on_move(self, attorney: Attorney):
+        """Check that paths of moved folder's subtree are updated."""
+        folder = factories.FolderFactory(owner_id=attorney.pk)
+        child_folder = factories.FolderFactory(parent=folder)
+        grandchild_folder = factories.FolderFactory(parent=child_folder)
+        new_parent = factories.FolderFactory(owner_id=attorney.pk)
+
+        folder.parent = new_parent
+        folder.save()
+
+        grandchild_folder.refresh_from_db()
+        assert folder.path == [new_parent.pk, folder.pk]
+        assert grandchild_folder.path == [
+            new_parent.pk, folder.pk, child_folder.pk, grandchild_folder.pk
+        ]
+        assert set(models.Folder.objects.descendants(new_parent)) == {
+            folder, child_folder, grandchild_folder
+        }
+
     def test_create_subfolder_for_shared_folder(self, attorney: Attorney):
         """Check we can't create subfolders for shared folder."""
         matter: Matter = MatterFactory(attorney=attorney)
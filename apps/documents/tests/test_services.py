@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+
+from ...users.models import Attorney, Client
+from .. import factories, models, services
+from ..factories import DocumentFactory
+
+
+def test_send_contract_records(private_attorney_folder: models.Folder):
+    """Test that due records are sent and documents get transaction id."""
+    document = DocumentFactory(parent=private_attorney_folder)
+
+    assert services.send_contract_records() == 1
+
+    record = document.contract_records.get()
+    document.refresh_from_db()
+    assert record.status == models.ContractRecord.STATUS_SENT
+    assert record.transaction_id
+    assert document.transaction_id == record.transaction_id
+
+
+@patch('apps.utils.eth.RecordWriter.write')
+def test_send_contract_records_failed(
+    write_mock: MagicMock, private_attorney_folder: models.Folder
+):
+    """Test that failed records are retried later."""
+    write_mock.side_effect = ConnectionError
+    document = DocumentFactory(parent=private_attorney_folder)
+
+    assert services.send_contract_records() == 0
+
+    record = document.contract_records.get()
+    assert record.status == models.ContractRecord.STATUS_PENDING
+    assert record.attempts == 1
+    assert record.next_attempt > timezone.now()
+    assert not models.ContractRecord.objects.filter(pk=record.pk).due()
+
+
+def test_copy_folder_resources_in_background(settings, attorney: Attorney):
+    """Test that big folders are copied with progress reporting."""
+    settings.DOCUMENTS_COPY_SYNC_LIMIT = 0
+    source = factories.FolderFactory(owner_id=attorney.pk)
+    DocumentFactory(parent=source)
+    folder = factories.FolderFactory(owner_id=attorney.pk)
+
+    assert services.duplicate_folder_resources(source, folder)
+    assert services.get_copy_progress(folder.pk) == (
+        services.CopyProgress('pending', 0, 1)
+    )
+
+    services.copy_folder_resources_with_progress(source, folder)
+
+    assert services.get_copy_progress(folder.pk) == (
+        services.CopyProgress('completed', 1, 1)
+    )
+    assert folder.documents.count() == 1
+
+
+@patch('apps.documents.signals.resources_shared.send')
+def test_share_resources(
+    send_mock: MagicMock, attorney: Attorney, client: Client
+):
+    """Test that sharing cascades to subtree and sends single signal."""
+    folder = factories.FolderFactory(owner_id=attorney.pk)
+    subfolder = factories.FolderFactory(parent=folder)
+    document = DocumentFactory(parent=subfolder)
+
+    result = services.share_resources(
+        user=attorney.user,
+        folders=[folder],
+        add_users=[client.user],
+        cascade=True,
+    )
+
+    assert result == services.SharingResult(shared=3, unshared=0)
+    assert client.user in subfolder.shared_with.all()
+    assert client.user in document.shared_with.all()
+    send_mock.assert_called_once()
+
+    result = services.share_resources(
+        user=attorney.user,
+        documents=[document],
+        remove_users=[client.user],
+    )
+
+    assert result == services.SharingResult(shared=0, unshared=1)
+    assert not document.shared_with.exists()
+
+
+def test_get_resources_ordering():
+    """Test that ordering always ends with columns identifying resource."""
+    assert services.get_resources_ordering(['-title', 'unknown', 'id']) == [
+        ('resource_title', True),
+        ('resource_id', False),
+        ('resource_type', False),
+    ]
+
+
+def test_get_resources_instances(attorney: Attorney):
+    """Test that instances of union rows are returned in rows order."""
+    folder = factories.FolderFactory(owner_id=attorney.pk)
+    document = DocumentFactory(parent=folder)
+    rows = [
+        *services.annotate_resources(
+            models.Document.objects.filter(pk=document.pk)
+        ),
+        *services.annotate_resources(
+            models.Folder.objects.filter(pk=folder.pk)
+        ),
+    ]
+
+    assert services.get_resources_instances(rows) == [document, folder]
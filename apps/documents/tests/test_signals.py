@@ -51,3 +51,12 @@ def test_signal_setters(
     """
     resource = model_factory(parent=folder)
     assert getattr(folder, attr_to_check) == getattr(resource, attr_to_check)
+
+
+def test_save_to_contract(private_attorney_folder: models.Folder):
+    """Test that record of new document is put to outbox."""
+    document = DocumentFactory(parent=private_attorney_folder)
+
+    record = document.contract_records.get()
+    assert record.status == models.ContractRecord.STATUS_PENDING
+    assert document.transaction_id is None
@@ -0,0 +1,24 @@
+from ...users.models import Attorney
+from .. import factories, models, utils
+
+
+def test_copy_folder_resources(attorney: Attorney):
+    """Test that whole subtree of folder is copied with correct paths."""
+    source = factories.FolderFactory(owner_id=attorney.pk)
+    subfolder = factories.FolderFactory(parent=source)
+    nested_subfolder = factories.FolderFactory(parent=subfolder)
+    factories.DocumentFactory(parent=source)
+    factories.DocumentFactory(parent=nested_subfolder)
+    folder = factories.FolderFactory(owner_id=attorney.pk)
+
+    utils.copy_folder_resources(source, folder)
+
+    subfolder_copy = folder.folders.get()
+    nested_subfolder_copy = subfolder_copy.folders.get()
+    assert subfolder_copy.title == subfolder.title
+    assert nested_subfolder_copy.path == [
+        folder.pk, subfolder_copy.pk, nested_subfolder_copy.pk
+    ]
+    assert folder.documents.count() == 1
+    assert nested_subfolder_copy.documents.count() == 1
+    assert models.Folder.objects.descendants(source).count() == 2
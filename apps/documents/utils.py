@@ -1,3 +1,10 @@
+import typing
+
+from django.conf import settings
+from django.db import connection, models
+
+from libs.utils import chunked
+
 from apps.users.models import AppUser
 
 from .models import Document, Folder, Resource
@@ -12,37 +19,90 @@ def is_resource_available_for_user(resource: Resource, user: AppUser) -> bool:
     return resource.matter.client.pk == user.pk
 
 
-def copy_folder_resources(folder: Folder, subfolders, documents):
-    """Copy folders and documents to a new folder.
+def reserve_ids(model: typing.Type[models.Model], count: int) -> list:
+    """Get `count` ids for new instances of model from its pk sequence."""
+    if not count:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+            "FROM generate_series(1, %s)",
+            [model._meta.db_table, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def copy_folder_resources(
+    source: Folder,
+    folder: Folder,
+    on_progress: typing.Callable[[int], None] = None,
+):
+    """Copy subfolders(on all levels) and documents of source to a folder.
 
-    TODO: Needs improvements
-        Problem: folders on each level are copied one by one. And on every step
-        they do query to get subfolder and documents. It potentially can lead
-        to performance issues.
+    Whole subtree is loaded by one query(by `path`), ids of folders' copies
+    are reserved in advance, so parents and paths of copies are remapped in
+    memory and copies are created by single `bulk_create`. Documents are
+    copied in batches of `DOCUMENTS_COPY_BATCH_SIZE`.
+
+    Arguments:
+        source: folder which resources are copied
+        folder: folder where copies are created
+        on_progress: callback, which is called with number of copied
+            resources after each batch
 
     """
+    # copy can be created inside of source, it shouldn't be copied itself
+    subfolders = list(
+        Folder.objects.descendants(source).exclude(pk=folder.pk)
+    )
+    copies_ids = {source.pk: folder.pk}
+    copies_ids.update(zip(
+        (subfolder.pk for subfolder in subfolders),
+        reserve_ids(Folder, len(subfolders)),
+    ))
+
+    folders_copies = []
     for subfolder in subfolders:
-        sub_subfolders = subfolder.folders.all()
-        sub_documents = subfolder.documents.all()
-        subfolder = create_folder_copy(subfolder, folder)
-        subfolder.save()
-        copy_folder_resources(subfolder, sub_subfolders, sub_documents)
-
-    Document.objects.bulk_create(
-        create_document_copy(document, folder)
-        for document in documents
+        relative_path = subfolder.path[subfolder.path.index(source.pk) + 1:]
+        subfolder_copy = create_folder_copy(
+            subfolder, parent_id=copies_ids[subfolder.parent_id]
+        )
+        subfolder_copy.pk = copies_ids[subfolder.pk]
+        subfolder_copy.path = folder.path + [
+            copies_ids[folder_id] for folder_id in relative_path
+        ]
+        folders_copies.append(subfolder_copy)
+    Folder.objects.bulk_create(
+        folders_copies, batch_size=settings.DOCUMENTS_COPY_BATCH_SIZE
     )
+    copied = len(folders_copies)
+    if on_progress:
+        on_progress(copied)
+
+    documents = Document.objects.filter(
+        parent_id__in=copies_ids
+    ).order_by('pk').iterator(chunk_size=settings.DOCUMENTS_COPY_BATCH_SIZE)
+    for batch in chunked(documents, settings.DOCUMENTS_COPY_BATCH_SIZE):
+        Document.objects.bulk_create(
+            create_document_copy(
+                document, parent_id=copies_ids[document.parent_id]
+            )
+            for document in batch
+        )
+        copied += len(batch)
+        if on_progress:
+            on_progress(copied)
 
 
-def create_folder_copy(folder: Folder, parent: Folder) -> Folder:
+def create_folder_copy(folder: Folder, parent_id: int) -> Folder:
     """Create folder copy."""
     folder.pk = None
-    folder.parent = parent
+    folder.parent_id = parent_id
     return folder
 
 
-def create_document_copy(document: Document, folder: Folder) -> Document:
+def create_document_copy(document: Document, parent_id: int) -> Document:
     """Create document copy."""
     document.pk = None
-    document.parent = folder
+    document.parent_id = parent_id
     return document
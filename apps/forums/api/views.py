@@ -139,7 +139,7 @@ class PostViewSet(mixins.ListModelMixin,
     def opportunities(self, request, *args, **kwargs):
         """Get attorney's opportunities."""
         queryset = self.filter_queryset(
-            self.get_queryset().opportunities(request.user)
+            self.get_queryset().matched_opportunities(request.user)
         )
 
         page = self.paginate_queryset(queryset)
@@ -178,17 +178,21 @@ class CommentViewSet(mixins.ListModelMixin,
     author of the post.
 
     """
-    queryset = models.Comment.objects.all().with_position().select_related(
+    queryset = models.Comment.objects.all().select_related(
         'author',
         'author__forum_stats',
         'author__attorney',
         'author__client',
     ).prefetch_related(
         'author__specialities',
-    )
+    ).order_by('position')
     serializer_class = serializers.CommentSerializer
-    filterset_fields = ('post', 'author',)
-    ordering_fields = ('title', 'created',)
+    filterset_fields = {
+        'post': ['exact'],
+        'author': ['exact'],
+        'position': ['gte', 'lt'],
+    }
+    ordering_fields = ('title', 'created', 'position',)
     search_fields = ('title',)
     permission_classes = (AllowAny,)
     permissions_map = {
@@ -203,6 +207,23 @@ class CommentViewSet(mixins.ListModelMixin,
         )
     }
 
+    @action(methods=['GET'], detail=True)
+    def page(self, request, *args, **kwargs):
+        """Get page of post's comments, which holds the comment.
+
+        Response contains `offset` of the page, so next pages can be loaded
+        by list endpoint (or by `position__gte` filter).
+
+        """
+        comment = self.get_object()
+        page_size = self.paginator.get_limit(request)
+        queryset = self.get_queryset().on_page_of(comment, page_size)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response({
+            'offset': comment.position // page_size * page_size,
+            'results': serializer.data,
+        })
+
 
 class FollowedPostViewSet(mixins.ListModelMixin,
                           mixins.RetrieveModelMixin,
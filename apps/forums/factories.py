@@ -1,31 +1,37 @@
 import factory
 
-from apps.users.factories import (
-    AppUserFactory,
-    ClientFactory,
-    SpecialityFactory,
-)
+from apps.users.factories import AppUserFactory, ClientFactory
 
 from . import models
 
 
-class CategoryFactory(factory.DjangoModelFactory):
-    """Factory for Category model."""
-    speciality = factory.SubFactory(SpecialityFactory)
+class ForumPracticeAreasFactory(factory.DjangoModelFactory):
+    """Factory for ForumPracticeAreas model."""
+    title = factory.Faker('ean13')
+    description = factory.Faker('paragraph')
+
+    class Meta:
+        model = models.ForumPracticeAreas
+
+
+class TopicFactory(factory.DjangoModelFactory):
+    """Factory for Topic model
+    """
+    practice_area = factory.SubFactory(ForumPracticeAreasFactory)
     title = factory.Faker('catch_phrase')
     description = factory.Faker('paragraph')
-    icon = factory.django.ImageField(color='magenta')
 
     class Meta:
-        model = models.Category
+        model = models.Topic
 
 
 class PostFactory(factory.DjangoModelFactory):
     """Factory for Post model
     """
 
-    topic = factory.SubFactory('apps.forums.factories.TopicFactory')
-    text = factory.Faker('paragraph')
+    topic = factory.SubFactory(TopicFactory)
+    title = factory.Faker('catch_phrase')
+    description = factory.Faker('paragraph')
 
     class Meta:
         model = models.Post
@@ -35,23 +41,36 @@ class PostFactory(factory.DjangoModelFactory):
         return ClientFactory().user
 
 
-class TopicFactory(factory.DjangoModelFactory):
-    """Factory for Topic model
-    """
-    category = factory.SubFactory(CategoryFactory)
-    title = factory.Faker('catch_phrase')
+class CommentFactory(factory.DjangoModelFactory):
+    """Factory for Comment model."""
+    post = factory.SubFactory(PostFactory)
+    text = factory.Faker('paragraph')
 
     class Meta:
-        model = models.Topic
+        model = models.Comment
+
+    @factory.lazy_attribute
+    def author(self):
+        return ClientFactory().user
 
 
 class FollowedTopicFactory(factory.DjangoModelFactory):
-    """Factory for FollowedTopic model."""
+    """Factory for relation between topic and its follower."""
     follower = factory.SubFactory(AppUserFactory)
     topic = factory.SubFactory(TopicFactory)
 
     class Meta:
-        model = models.FollowedTopic
+        model = models.Topic.followers.through
+        rename = {'follower': 'appuser'}
+
+
+class FollowedPostFactory(factory.DjangoModelFactory):
+    """Factory for FollowedPost model."""
+    follower = factory.SubFactory(AppUserFactory)
+    post = factory.SubFactory(PostFactory)
+
+    class Meta:
+        model = models.FollowedPost
 
 
 class UserStatsFactory(factory.DjangoModelFactory):
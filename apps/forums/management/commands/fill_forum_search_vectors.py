@@ -0,0 +1,24 @@
+from logging import getLogger
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from apps.forums.models import Post, Topic
+from apps.forums.services import fill_search_vectors
+
+logger = getLogger('django')
+
+
+class Command(BaseCommand):
+    """Fill stored full-text search vectors of forum posts and topics."""
+
+    def handle(self, *args, **options):
+        """Fill search vectors by batches."""
+        for model in (Topic, Post):
+            updated = fill_search_vectors(
+                model, batch_size=settings.FORUMS_SEARCH_VECTORS_BATCH_SIZE
+            )
+            logger.info(
+                f'Filled search vectors of {updated} '
+                f'{model._meta.verbose_name_plural}'
+            )
@@ -0,0 +1,24 @@
+from logging import getLogger
+
+from django.core.management import BaseCommand
+
+from apps.forums.services import rematch_attorney_opportunities
+from apps.users.models import AppUser
+
+logger = getLogger('django')
+
+
+class Command(BaseCommand):
+    """Rebuild stored opportunities matches of all attorneys.
+
+    Should be run after `fill_forum_search_vectors`, since keywords are
+    matched with stored search vectors.
+
+    """
+
+    def handle(self, *args, **options):
+        """Rebuild matches attorney by attorney."""
+        users = AppUser.objects.filter(attorney__isnull=False).order_by('pk')
+        for user in users.iterator():
+            matched = rematch_attorney_opportunities(user)
+            logger.info(f'Matched {matched} opportunities for {user.pk}')
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+FILL_POSITIONS_SQL = """
+UPDATE forums_comment
+SET position = numbered.position
+FROM (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY created, id) - 1
+            AS position
+    FROM forums_comment
+) AS numbered
+WHERE forums_comment.id = numbered.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forums', '0009_opportunitymatch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='position',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Position in post'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'position'], name='comment_post_position_idx'),
+        ),
+        migrations.RunSQL(FILL_POSITIONS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Max
 from django.utils.translation import gettext_lazy as _
 
 from libs import utils
@@ -13,6 +16,7 @@ __all__ = (
     'Post',
     'FollowedPost',
     'UserStats',
+    'OpportunityMatch',
 )
 
 
@@ -132,16 +136,32 @@ class Topic(BaseModel):
         _('Show on main page.'),
         default=True,
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_('Search vector of title and description'),
+    )
 
     objects = querysets.TopicQuerySet.as_manager()
 
     class Meta:
         verbose_name = _('Topic')
         verbose_name_plural = _('Topics')
+        indexes = [
+            GinIndex(fields=['search_vector'], name='topic_search_vector_gin'),
+        ]
 
     def __str__(self):
         return f'{self.id}. {self.title}'
 
+    def delete(self, *args, **kwargs):
+        """Update statistics of topic's deleted comments at once."""
+        # Prevent import error
+        from .services.forum_update import batched_stats_update
+
+        with batched_stats_update():
+            return super().delete(*args, **kwargs)
+
     @property
     def followers_count(self):
         return self.followers.count()
@@ -217,6 +237,11 @@ class Post(BaseModel):
     description = models.TextField(
         verbose_name=_('Description')
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_('Search vector of title and first comment'),
+    )
 
     @property
     def followers_count(self):
@@ -227,10 +252,21 @@ class Post(BaseModel):
     class Meta:
         verbose_name = _('Posts')
         verbose_name_plural = _('Posts')
+        indexes = [
+            GinIndex(fields=['search_vector'], name='post_search_vector_gin'),
+        ]
 
     def __str__(self):
         return f'{self.id}. {self.title}'
 
+    def delete(self, *args, **kwargs):
+        """Update statistics of post's deleted comments at once."""
+        # Prevent import error
+        from .services.forum_update import batched_stats_update
+
+        with batched_stats_update():
+            return super().delete(*args, **kwargs)
+
 
 class Comment(BaseModel):
     """Comments model
@@ -241,6 +277,7 @@ class Comment(BaseModel):
         post (Post): link to a post in which comment is placed
         author (AppUser): link to a Client who is looking for Attorney
         text (text): text of the comment
+        position (int): position of the comment in post (starting from 0)
         created (datetime): timestamp when instance was created
         modified (datetime): timestamp when instance was modified last time
 
@@ -260,16 +297,43 @@ class Comment(BaseModel):
     text = models.TextField(
         _('Text of the comment'),
     )
+    position = models.PositiveIntegerField(
+        _('Position in post'),
+        default=0,
+        editable=False,
+    )
 
     objects = querysets.CommentQuerySet.as_manager()
 
     class Meta:
         verbose_name = _('Comment')
         verbose_name_plural = _('Comments')
+        indexes = [
+            models.Index(
+                fields=['post', 'position'], name='comment_post_position_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.id}. {self.text[:5]}... @ {self.author}'
 
+    def save(self, **kwargs):
+        """Allocate position of new comment in its post.
+
+        Post's row is locked till the end of transaction, so concurrent
+        comments get sequential positions.
+
+        """
+        if not self._state.adding:
+            return super().save(**kwargs)
+        with transaction.atomic():
+            Post.objects.lock(self.post_id)
+            last_position = Comment.objects.filter(
+                post_id=self.post_id
+            ).aggregate(last_position=Max('position'))['last_position']
+            self.position = 0 if last_position is None else last_position + 1
+            super().save(**kwargs)
+
 
 class FollowedPost(BaseModel):
     """Many-to-many relation between users and topics.
@@ -341,3 +405,37 @@ class UserStats(BaseModel):
 
     def __str__(self):
         return f'{self.user}'
+
+
+class OpportunityMatch(BaseModel):
+    """Post, which is opportunity for attorney.
+
+    Matches are calculated once, when post gets its first comment (and when
+    attorney changes profile), so attorneys' opportunities are read by
+    index instead of filtering all posts for each attorney.
+
+    Attributes:
+        post (Post): Foreign key for matched post.
+        user (users.AppUser): Foreign key for attorney's user.
+
+    """
+    post = models.ForeignKey(
+        'Post',
+        verbose_name=_('Post'),
+        on_delete=models.CASCADE,
+        related_name='opportunity_matches',
+    )
+    user = models.ForeignKey(
+        'users.AppUser',
+        verbose_name=_('Attorney'),
+        on_delete=models.CASCADE,
+        related_name='opportunity_matches',
+    )
+
+    class Meta:
+        verbose_name = _('Opportunity match')
+        verbose_name_plural = _('Opportunity matches')
+        unique_together = ('user', 'post')
+
+    def __str__(self):
+        return f'{self.post_id} for {self.user_id}'
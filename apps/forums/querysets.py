@@ -1,7 +1,6 @@
 from datetime import datetime
 
-from django.contrib.postgres.search import SearchQuery, SearchVector
-from django.db.models import Count, F, Q, QuerySet
+from django.db.models import Q, QuerySet
 
 from apps.users.models import AppUser
 
@@ -10,7 +9,24 @@ __all__ = (
 )
 
 
-class PostQuerySet(QuerySet):
+class CommentsStatsDeletionMixin:
+    """Update statistics of cascade deleted comments at once.
+
+    Deleted posts and topics remove all their comments, so statistics of
+    related topics and authors are updated once for whole deletion instead
+    of update per comment.
+
+    """
+
+    def delete(self):
+        # Prevent import error
+        from .services.forum_update import batched_stats_update
+
+        with batched_stats_update():
+            return super().delete()
+
+
+class PostQuerySet(CommentsStatsDeletionMixin, QuerySet):
     """QuerySet class for `Post` model."""
 
     def opportunities(self, user: AppUser):
@@ -43,6 +59,18 @@ class PostQuerySet(QuerySet):
 
         return qs_filtered_states.by_attorney_specialties_or_keywords(user)
 
+    def lock(self, post_id: int):
+        """Lock post's row till the end of current transaction."""
+        list(
+            self.select_for_update().filter(pk=post_id).values_list(
+                'pk', flat=True
+            )
+        )
+
+    def matched_opportunities(self, user: AppUser):
+        """Get opportunities of attorney from stored opportunity matches."""
+        return self.filter(opportunity_matches__user=user)
+
     def by_user_specialties(self, user: AppUser):
         """Filter posts by user's specialities."""
         specialities = user.specialities.all()
@@ -51,19 +79,20 @@ class PostQuerySet(QuerySet):
         )
 
     def by_attorney_specialties_or_keywords(self, user: AppUser):
-        """Filter topics by attorney's specialities or keywords."""
+        """Filter posts by attorney's specialities or keywords.
+
+        Keywords are searched in stored search vector of post's title and
+        first comment.
+
+        """
         # Prevent import error
-        from .services import convert_keywords_to_querytext
+        from .services import get_keywords_search_query
 
         specialities = user.specialities.all()
-        keywords = user.attorney.keywords
-        search_querytext = convert_keywords_to_querytext(keywords)
-        search_query = SearchQuery(search_querytext, search_type='raw')
-        qs_with_search_vector = self.annotate(
-            search=SearchVector('title', 'first_comment__text')
-        )
-        return qs_with_search_vector.filter(
-            Q(topic__practice_area__in=specialities) | Q(search=search_query)
+        search_query = get_keywords_search_query(user.attorney.keywords)
+        return self.filter(
+            Q(topic__practice_area__in=specialities) |
+            Q(search_vector=search_query)
         )
 
     def by_attorney_practice_jurisdictions(self, user: AppUser):
@@ -90,7 +119,7 @@ class PostQuerySet(QuerySet):
         )
 
 
-class TopicQuerySet(QuerySet):
+class TopicQuerySet(CommentsStatsDeletionMixin, QuerySet):
     """QuerySet class for `Topic` model."""
 
     def by_user_specialties(self, user: AppUser):
@@ -100,6 +129,22 @@ class TopicQuerySet(QuerySet):
             practice_area__in=specialities
         )
 
+    def by_attorney_specialties_or_keywords(self, user: AppUser):
+        """Filter topics by attorney's specialities or keywords.
+
+        Keywords are searched in stored search vector of topic's title and
+        description.
+
+        """
+        # Prevent import error
+        from .services import get_keywords_search_query
+
+        specialities = user.specialities.all()
+        search_query = get_keywords_search_query(user.attorney.keywords)
+        return self.filter(
+            Q(practice_area__in=specialities) | Q(search_vector=search_query)
+        )
+
     def opportunities(self, user: AppUser):
         """Get opportunities for attorney."""
         qs_filtered_states = self.by_attorney_practice_jurisdictions(user=user)
@@ -137,13 +182,16 @@ class TopicQuerySet(QuerySet):
 class CommentQuerySet(QuerySet):
     """QuerySet class for `Post` model."""
 
-    def with_position(self):
-        """Add post position to queryset."""
-        return self.annotate(
-            position=Count(
-                'post__comments', filter=Q(
-                    post=F('post'),
-                    post__comments__created__lt=F('created')
-                )
-            )
+    def on_page_of(self, comment, page_size: int):
+        """Get comments on the page of post's comments, which holds comment.
+
+        Positions of post's comments are sequential, so page is read by range
+        of indexed positions instead of offset.
+
+        """
+        start = comment.position // page_size * page_size
+        return self.filter(
+            post_id=comment.post_id,
+            position__gte=start,
+            position__lt=start + page_size,
         )
@@ -1,12 +1,36 @@
-from .forum_update import set_comments_count, set_last_comment, update_all
-from .query_service import convert_keywords_to_querytext
+from .forum_update import (
+    batched_stats_update,
+    set_first_comment,
+    update_all,
+    update_comment_stats,
+)
+from .opportunities import (
+    match_post_opportunities,
+    rematch_attorney_opportunities,
+)
+from .query_service import (
+    convert_keywords_to_querytext,
+    get_keywords_search_query,
+)
+from .search import (
+    fill_search_vectors,
+    update_posts_search_vectors,
+    update_topics_search_vectors,
+)
 from .statistics import get_attorney_statistics, get_stats_for_dashboard
 
 __all__ = (
-    'set_last_comment',
-    'set_comments_count',
+    'set_first_comment',
+    'update_comment_stats',
+    'batched_stats_update',
     'update_all',
     'get_attorney_statistics',
     'convert_keywords_to_querytext',
+    'get_keywords_search_query',
+    'fill_search_vectors',
+    'update_posts_search_vectors',
+    'update_topics_search_vectors',
+    'match_post_opportunities',
+    'rematch_attorney_opportunities',
     'get_stats_for_dashboard'
 )
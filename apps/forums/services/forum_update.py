@@ -1,90 +1,227 @@
-from typing import Union
+import threading
+import typing
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
 
 from apps.forums.models import Comment, Post, Topic, UserStats
-from apps.users.models import AppUser
 
+__all__ = (
+    'set_first_comment',
+    'update_comment_stats',
+    'batched_stats_update',
+    'update_all',
+)
 
-def set_last_comment(
-    instance: Union[Topic, Post],
-    last_comment: Comment = None,
-):
-    """Set last comment for `instance`.
+# Pending changes of forum statistics of current thread, they are collected
+# in `batched_stats_update` block and applied on its exit
+_batch = threading.local()
 
-    Set provided last comment for instance.
-    If no `last_comment` were provide, this
-    will fetch last comment from db.
 
-    """
-    if isinstance(instance, Topic):
-        last_comment_filter = dict(post__topic=instance)
-
-    elif isinstance(instance, Post):
-        last_comment_filter = dict(post=instance)
+class StatsChanges:
+    """Changes of forum statistics collected from created/deleted comments.
 
-    else:
-        return
+    Attributes:
+        counts (Counter): changes of comments count per (model, pk)
+        last_comments (dict): id of newest created comment per (model, pk)
+        stale_last_comments (set): (model, pk) pairs, which last comment was
+            deleted and should be recalculated
 
-    if not last_comment:
-        last_comment = Comment.objects \
-            .filter(**last_comment_filter) \
-            .order_by('-created') \
-            .first()
-
-    instance.last_comment = last_comment
-    instance.save()
+    """
 
+    def __init__(self):
+        self.counts = Counter()
+        self.last_comments = {}
+        self.stale_last_comments = set()
+
+    def add(self, comment: Comment, delta: int):
+        """Add changes of statistics made by comment's creation/deletion."""
+        targets = (
+            (Post, comment.post_id),
+            (Topic, comment.post.topic_id),
+            (UserStats, comment.author_id),
+        )
+        for model, pk in targets:
+            if pk is None:
+                continue
+            self.counts[model, pk] += delta
+            if model is UserStats:
+                continue
+            if delta > 0:
+                self.last_comments[model, pk] = max(
+                    comment.pk, self.last_comments.get((model, pk), 0)
+                )
+            else:
+                self.stale_last_comments.add((model, pk))
+
+    def apply(self):
+        """Apply collected changes by atomic updates.
+
+        Each changed post, topic and user stats row is updated by one
+        `UPDATE`, where counters are changed by `F()` expressions, so
+        concurrent changes are not lost.
+
+        """
+        with transaction.atomic():
+            authors_ids = [
+                pk for model, pk in self.counts if model is UserStats
+            ]
+            UserStats.objects.bulk_create(
+                [UserStats(user_id=user_id) for user_id in authors_ids],
+                ignore_conflicts=True,
+            )
+            for (model, pk), delta in self.counts.items():
+                updates = {}
+                if delta:
+                    updates['comment_count'] = Greatest(
+                        F('comment_count') + delta, Value(0)
+                    )
+                if (model, pk) in self.last_comments:
+                    updates['last_comment'] = newer_comment(
+                        self.last_comments[model, pk]
+                    )
+                if not updates:
+                    continue
+                lookup = 'user_id' if model is UserStats else 'pk'
+                model.objects.filter(**{lookup: pk}).update(**updates)
+
+            for model in (Post, Topic):
+                pks = [
+                    pk for stale_model, pk in self.stale_last_comments
+                    if stale_model is model
+                ]
+                if pks:
+                    # Deleted comment is already unlinked by `SET_NULL`
+                    model.objects.filter(
+                        pk__in=pks, last_comment__isnull=True
+                    ).update(last_comment=last_comment_subquery(model))
+
+
+def newer_comment(comment_id: int) -> Case:
+    """Get expression, which sets last comment unless newer one is set."""
+    return Case(
+        When(
+            Q(last_comment__isnull=True) | Q(last_comment__lt=comment_id),
+            then=Value(comment_id),
+        ),
+        default=F('last_comment'),
+        output_field=IntegerField(),
+    )
+
+
+def comments_of(model) -> typing.Tuple[QuerySet, str]:
+    """Get comments of outer post, topic or user stats and grouping field."""
+    if model is Post:
+        return Comment.objects.filter(post=OuterRef('pk')), 'post'
+    if model is Topic:
+        return (
+            Comment.objects.filter(post__topic=OuterRef('pk')), 'post__topic'
+        )
+    return Comment.objects.filter(author=OuterRef('user_id')), 'author'
+
+
+def last_comment_subquery(model) -> Subquery:
+    """Get subquery of newest comment of outer post or topic."""
+    comments, _ = comments_of(model)
+    return Subquery(comments.order_by('-created').values('pk')[:1])
+
+
+def comment_count_subquery(model) -> Coalesce:
+    """Get grouped subquery of comments count of outer object."""
+    comments, group_field = comments_of(model)
+    return Coalesce(
+        Subquery(
+            comments.order_by().values(group_field).annotate(
+                count=Count('pk')
+            ).values('count'),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+@contextmanager
+def batched_stats_update():
+    """Collect forum statistics changes in block and apply them at once.
+
+    Comments created or deleted in block change statistics of their posts,
+    topics and authors by one update per object on block's exit, instead of
+    updates per comment. Nested blocks are applied by outer one.
 
-def set_first_comment(
-    instance: Post,
-    first_comment: Comment,
-):
-    """Set first comment for `instance`.
     """
+    if getattr(_batch, 'changes', None) is not None:
+        yield
+        return
 
-    instance.first_comment = first_comment
-    instance.save()
+    _batch.changes = StatsChanges()
+    try:
+        yield
+        changes = _batch.changes
+    finally:
+        _batch.changes = None
+    changes.apply()
 
 
-def set_comments_count(
-    instance: Union[Topic, Post, AppUser],
-    count: int = None,
-):
-    """Set posts count for `instance`.
+def update_comment_stats(comment: Comment, delta: int):
+    """Update statistics of comment's post, topic and author.
 
-    Increase posts count on count value. If no `count` were provide, this
-    will count posts count in db query.
+    Arguments:
+        comment: created or deleted comment
+        delta: 1 for created comment, -1 for deleted one
 
     """
-    if isinstance(instance, AppUser):
-        author = instance
-        instance, _ = UserStats.objects.get_or_create(user=author)
-        comment_count_filter = dict(author=author)
-
-    elif isinstance(instance, Topic):
-        comment_count_filter = dict(post__topic=instance)
-
-    elif isinstance(instance, Post):
-        comment_count_filter = dict(post=instance)
-
-    else:
+    changes = getattr(_batch, 'changes', None)
+    if changes is not None:
+        changes.add(comment, delta)
         return
+    changes = StatsChanges()
+    changes.add(comment, delta)
+    changes.apply()
 
-    if count:
-        instance.comment_count = instance.comment_count + count
-    else:
-        instance.comment_count = Comment.objects \
-            .filter(**comment_count_filter) \
-            .count()
 
-    instance.save()
+def set_first_comment(instance: Post, first_comment: Comment):
+    """Set first comment for `instance` unless it's already set."""
+    Post.objects.filter(
+        pk=instance.pk, first_comment__isnull=True
+    ).update(first_comment=first_comment)
+    if instance.first_comment_id is None:
+        instance.first_comment = first_comment
 
 
 def update_all():
-    """Update all categories, topics and user stats objects."""
+    """Recalculate statistics of all posts, topics and users.
 
-    for category in Topic.objects.all():
-        set_last_comment(category)
-        set_comments_count(category)
+    Statistics are recalculated by one `UPDATE` per model with grouped
+    subqueries for counts and last comments.
 
-    for post in Post.objects.distinct('author'):
-        set_comments_count(post.author)
+    """
+    with transaction.atomic():
+        for model in (Post, Topic):
+            model.objects.update(
+                comment_count=comment_count_subquery(model),
+                last_comment=last_comment_subquery(model),
+            )
+        authors_ids = Comment.objects.order_by().values_list(
+            'author_id', flat=True
+        ).distinct()
+        UserStats.objects.bulk_create(
+            [UserStats(user_id=user_id) for user_id in authors_ids],
+            ignore_conflicts=True,
+        )
+        UserStats.objects.update(
+            comment_count=comment_count_subquery(UserStats)
+        )
@@ -0,0 +1,137 @@
+import typing
+
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    OuterRef,
+    Value,
+    When,
+)
+
+from ...forums.models import OpportunityMatch, Post
+from ...users.models import AppUser, Attorney, Client
+from .query_service import get_keywords_search_query
+
+__all__ = (
+    'match_post_opportunities',
+    'rematch_attorney_opportunities',
+)
+
+# Max number of attorneys, which keywords are checked against post by one
+# query
+KEYWORDS_MATCH_BATCH_SIZE = 100
+
+
+def get_post_candidates(post: Post) -> typing.List[tuple]:
+    """Get attorneys, who practice in state of post's client.
+
+    Attorneys are found by index of practice jurisdictions' states, each one
+    is returned with its keywords and flag of speciality match with post's
+    practice area.
+
+    Returns:
+        list of (user id, keywords, has speciality) tuples
+
+    """
+    state_id = Client.objects.filter(
+        user__comments=post.first_comment_id
+    ).values_list('state_id', flat=True).first()
+    if state_id is None:
+        return []
+
+    practice_area_id = post.topic.practice_area_id if post.topic_id else None
+    has_speciality = Exists(
+        AppUser.specialities.through.objects.filter(
+            appuser_id=OuterRef('user_id'),
+            speciality_id=practice_area_id,
+        )
+    )
+    return list(
+        Attorney.objects.filter(
+            practice_jurisdictions__state_id=state_id
+        ).annotate(
+            has_speciality=has_speciality,
+        ).values_list('user_id', 'keywords', 'has_speciality').distinct()
+    )
+
+
+def match_keywords(post: Post, candidates: typing.Dict[int, list]) -> list:
+    """Get attorneys, which keywords are found in post.
+
+    Attorneys' keywords queries are compiled once and cached, all of them
+    are checked against stored post's search vector by one query per batch.
+
+    """
+    matched = []
+    candidates = list(candidates.items())
+    for start in range(0, len(candidates), KEYWORDS_MATCH_BATCH_SIZE):
+        batch = candidates[start:start + KEYWORDS_MATCH_BATCH_SIZE]
+        matches = Post.objects.filter(pk=post.pk).values(**{
+            f'match_{user_id}': Case(
+                When(search_vector=get_keywords_search_query(keywords),
+                     then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+            for user_id, keywords in batch
+        }).first() or {}
+        matched.extend(
+            user_id for user_id, _ in batch if matches.get(f'match_{user_id}')
+        )
+    return matched
+
+
+def match_post_opportunities(post: Post) -> int:
+    """Find attorneys, for which post is opportunity, and save matches.
+
+    It's the same logic as in `PostQuerySet.opportunities`, but inverted:
+    post is matched with attorneys practicing in its client's state, which
+    have post's speciality or (if they have keywords) which keywords are
+    found in post's title or first comment.
+
+    Returns:
+        number of matched attorneys
+
+    """
+    if post.first_comment_id is None:
+        return 0
+
+    matched = []
+    keywords_candidates = {}
+    for user_id, keywords, has_speciality in get_post_candidates(post):
+        if has_speciality:
+            matched.append(user_id)
+        elif keywords:
+            keywords_candidates[user_id] = keywords
+    matched.extend(match_keywords(post, keywords_candidates))
+
+    OpportunityMatch.objects.bulk_create(
+        [OpportunityMatch(post=post, user_id=user_id) for user_id in matched],
+        ignore_conflicts=True,
+    )
+    return len(matched)
+
+
+def rematch_attorney_opportunities(user: AppUser) -> int:
+    """Rebuild opportunities matches of attorney after profile's change.
+
+    Returns:
+        number of matched posts
+
+    """
+    posts_ids = list(
+        Post.objects.opportunities(user).values_list('pk', flat=True)
+        .distinct()
+    )
+    with transaction.atomic():
+        OpportunityMatch.objects.filter(user=user).delete()
+        OpportunityMatch.objects.bulk_create(
+            [
+                OpportunityMatch(post_id=post_id, user=user)
+                for post_id in posts_ids
+            ],
+            ignore_conflicts=True,
+        )
+    return len(posts_ids)
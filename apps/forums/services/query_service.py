@@ -1,4 +1,14 @@
 """Module store helpers for querysets."""
+import hashlib
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQueryField
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Value
+from django.db.models.functions import Cast
+
+KEYWORDS_QUERY_CACHE_KEY = 'forums_keywords_query:{digest}'
 
 
 def convert_keywords_to_querytext(keywords_list: list) -> str:
@@ -15,3 +25,25 @@ def convert_keywords_to_querytext(keywords_list: list) -> str:
     """
     row = "' | '".join(keywords_list)
     return f"'{row}'"
+
+
+def get_keywords_search_query(keywords_list: list) -> Cast:
+    """Get compiled search query of keywords.
+
+    Query text is compiled by postgres' `to_tsquery` once and the result is
+    cached by keywords, so later searches (for example for all attorneys in
+    daily opportunities task) use ready `tsquery` without its parsing and
+    normalization.
+
+    """
+    querytext = convert_keywords_to_querytext(keywords_list)
+    key = KEYWORDS_QUERY_CACHE_KEY.format(
+        digest=hashlib.md5(querytext.encode()).hexdigest()
+    )
+    tsquery = cache.get(key)
+    if tsquery is None:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT to_tsquery(%s)::text', [querytext])
+            tsquery = cursor.fetchone()[0]
+        cache.set(key, tsquery, settings.FORUMS_KEYWORDS_QUERY_CACHE_TIMEOUT)
+    return Cast(Value(tsquery), output_field=SearchQueryField())
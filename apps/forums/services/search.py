@@ -0,0 +1,60 @@
+import typing
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Model, OuterRef, Subquery
+
+from ...forums.models import Comment, Post, Topic
+
+__all__ = (
+    'update_posts_search_vectors',
+    'update_topics_search_vectors',
+    'fill_search_vectors',
+)
+
+
+def get_post_search_vector() -> SearchVector:
+    """Get search vector of post's title and first comment."""
+    first_comment_text = Subquery(
+        Comment.objects.filter(pk=OuterRef('first_comment')).values('text')
+    )
+    return SearchVector('title', first_comment_text)
+
+
+def get_topic_search_vector() -> SearchVector:
+    """Get search vector of topic's title and description."""
+    return SearchVector('title', 'description')
+
+
+def update_posts_search_vectors(posts_ids: typing.Iterable[int]) -> int:
+    """Update stored search vectors of posts by one query."""
+    return Post.objects.filter(pk__in=posts_ids).update(
+        search_vector=get_post_search_vector()
+    )
+
+
+def update_topics_search_vectors(topics_ids: typing.Iterable[int]) -> int:
+    """Update stored search vectors of topics by one query."""
+    return Topic.objects.filter(pk__in=topics_ids).update(
+        search_vector=get_topic_search_vector()
+    )
+
+
+def fill_search_vectors(model: typing.Type[Model], batch_size: int) -> int:
+    """Fill search vectors of all posts or topics by batches.
+
+    Returns:
+        number of updated objects
+
+    """
+    update_search_vectors = {
+        Post: update_posts_search_vectors,
+        Topic: update_topics_search_vectors,
+    }[model]
+    ids = model.objects.order_by('pk').values_list('pk', flat=True)
+    updated, last_id = 0, 0
+    while True:
+        batch = list(ids.filter(pk__gt=last_id)[:batch_size])
+        if not batch:
+            return updated
+        updated += update_search_vectors(batch)
+        last_id = batch[-1]
@@ -1,9 +1,12 @@
-from django.db.models import signals
+from django.db import transaction
+from django.db.models import F, signals
 from django.dispatch import Signal, receiver
 
-from apps.forums.models import Comment, Post
-from apps.forums.services import forum_update
+from apps.forums import tasks
+from apps.forums.models import Comment, Post, Topic
+from apps.forums.services import forum_update, search
 from apps.forums.services.forum_update import set_first_comment
+from apps.users.models import AppUser, Attorney
 
 new_opportunities_for_attorney = Signal(providing_args=('instance',))
 new_opportunities_for_attorney.__doc__ = (
@@ -48,44 +51,106 @@ def new_post(instance: Comment, created: bool, **kwargs):
     if not created:
         return
 
-    if not instance.post.first_comment:
+    if not instance.post.first_comment_id:
         set_first_comment(instance=instance.post, first_comment=instance)
+        search.update_posts_search_vectors([instance.post_id])
+        post_id = instance.post_id
+        transaction.on_commit(
+            lambda: tasks.match_post_opportunities.delay(post_id)
+        )
 
     new_comment_on_post.send(sender=Comment, instance=instance)
     if instance.author.is_attorney:
         new_comment_on_post_by_attorney.send(sender=Comment, instance=instance)
 
 
+@receiver(signals.post_save, sender=Topic)
+def update_topic_search_vector(instance: Topic, **kwargs):
+    """Update stored search vector of saved topic."""
+    search.update_topics_search_vectors([instance.pk])
+
+
+@receiver(signals.post_save, sender=Post)
+def update_post_search_vector(instance: Post, **kwargs):
+    """Update stored search vector of saved post."""
+    search.update_posts_search_vectors([instance.pk])
+
+
+@receiver(signals.post_save, sender=Comment)
+def update_first_comment_search_vector(
+    instance: Comment, created: bool, **kwargs
+):
+    """Update search vector of post, which first comment was edited."""
+    if created:
+        return
+    search.update_posts_search_vectors(
+        Post.objects.filter(first_comment=instance).values('pk')
+    )
+
+
 @receiver(signals.post_save, sender=Comment)
 def post_creation(instance: Comment, created: bool, **kwargs):
-    """Perform recalculation for statistic data in related models."""
+    """Increase comments counters of related post, topic and author."""
     if not created:
         return
+    forum_update.update_comment_stats(instance, 1)
 
-    # Update related topic
-    forum_update.set_last_comment(instance.post, instance)
-    forum_update.set_comments_count(instance.post, 1)
 
-    # Update related category
-    forum_update.set_last_comment(instance.post.topic, instance)
-    forum_update.set_comments_count(instance.post.topic, 1)
+@receiver(signals.post_delete, sender=Comment)
+def post_deletion(instance: Comment, **kwargs):
+    """Decrease comments counters of related post, topic and author.
+
+    Last comments of post and topic are recalculated if deleted comment was
+    the last one.
 
-    # Update post's author user stats
-    forum_update.set_comments_count(instance.author, 1)
+    """
+    forum_update.update_comment_stats(instance, -1)
 
 
 @receiver(signals.post_delete, sender=Comment)
-def post_deletion(instance: Comment, **kwargs):
-    """Perform recalculation for statistic data in related models.
+def shift_comments_positions(instance: Comment, **kwargs):
+    """Shift positions of comments after deleted one to keep them sequential.
+    """
+    with transaction.atomic():
+        Post.objects.lock(instance.post_id)
+        Comment.objects.filter(
+            post_id=instance.post_id, position__gt=instance.position
+        ).update(position=F('position') - 1)
+
+
+def rematch_opportunities(*users_ids: int):
+    """Rebuild opportunities matches of attorneys after transaction."""
+    for user_id in users_ids:
+        transaction.on_commit(
+            lambda user_id=user_id: (
+                tasks.rematch_attorney_opportunities.delay(user_id)
+            )
+        )
+
+
+@receiver(signals.post_save, sender=Attorney)
+def attorney_profile_changed(
+    instance: Attorney, created: bool, update_fields=None, **kwargs
+):
+    """Rebuild attorney's opportunities matches when keywords can change."""
+    if created or (update_fields and 'keywords' not in update_fields):
+        return
+    rematch_opportunities(instance.pk)
+
 
-    Update topic and category statistic in case of post deletion.
+@receiver(signals.m2m_changed, sender=Attorney.practice_jurisdictions.through)
+@receiver(signals.m2m_changed, sender=AppUser.specialities.through)
+def attorney_practice_changed(
+    instance, action: str, reverse: bool, pk_set: set, **kwargs
+):
+    """Rebuild opportunities matches on changes of jurisdictions/specialities.
+
+    Not attorneys' users are skipped by task.
 
     """
-    # Update related topic
-    forum_update.set_comments_count(instance.post)
-    forum_update.set_last_comment(instance.post)
-    # Update related category
-    forum_update.set_comments_count(instance.post.topic)
-    forum_update.set_last_comment(instance.post.topic)
-    # Update user statistic
-    forum_update.set_comments_count(instance.author)
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        rematch_opportunities(instance.pk)
+    elif pk_set:
+        rematch_opportunities(*pk_set)
@@ -6,7 +6,27 @@ from config.celery import app
 
 from ..users import models as user_models
 from ..users.services import create_stat
-from . import models
+from . import models, services
+
+
+@app.task()
+def match_post_opportunities(post_id: int):
+    """Celery task to match new post with attorneys' opportunities."""
+    post = models.Post.objects.filter(pk=post_id).first()
+    if post is None:
+        return
+    services.match_post_opportunities(post)
+
+
+@app.task()
+def rematch_attorney_opportunities(user_id: int):
+    """Celery task to rebuild attorney's matches after profile's change."""
+    user = user_models.AppUser.objects.filter(
+        pk=user_id, attorney__isnull=False
+    ).first()
+    if user is None:
+        return
+    services.rematch_attorney_opportunities(user)
 
 
 @app.task()
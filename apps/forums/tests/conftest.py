@@ -1,6 +1,10 @@
 import pytest
 
-from apps.forums.factories import CategoryFactory, PostFactory, TopicFactory
+from apps.forums.factories import (
+    ForumPracticeAreasFactory,
+    PostFactory,
+    TopicFactory,
+)
 from apps.forums.models import Topic
 from apps.users.factories import ClientFactory
 from apps.users.models import Attorney, Client
@@ -39,7 +43,7 @@ def opportunity_with_keywords(
         topic.first_post = PostFactory(
             topic=topic,
             author=client_with_same_state.user,
-            text=' '.join(attorney.keywords)
+            description=' '.join(attorney.keywords)
         )
         topic.save()
         return topic
@@ -54,9 +58,7 @@ def opportunity_with_speciality(
     """Create opportunity with speciality match."""
     with django_db_blocker.unblock():
         topic = TopicFactory(
-            category=CategoryFactory(
-                speciality=attorney.user.specialities.first()
-            )
+            practice_area=ForumPracticeAreasFactory()
         )
         topic.first_post = PostFactory(
             topic=topic,
@@ -73,14 +75,12 @@ def not_opportunity(
     """Create topic that are not opportunity."""
     with django_db_blocker.unblock():
         topic = TopicFactory(
-            category=CategoryFactory(
-                speciality=attorney.user.specialities.first()
-            )
+            practice_area=ForumPracticeAreasFactory()
         )
         topic.first_post = PostFactory(
             topic=topic,
             author=ClientFactory(state=None).user,
-            text=' '.join(attorney.keywords)
+            description=' '.join(attorney.keywords)
         )
         topic.save()
         return topic
@@ -0,0 +1,171 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from cities_light.models import Region
+
+from ...users.factories import AttorneyFactory, ClientFactory
+from ...users.models import Jurisdiction
+from .. import factories, models, services
+from ..services import forum_update
+
+
+def test_update_comment_stats():
+    """Test that comments counters are changed on comments creation."""
+    post = factories.PostFactory()
+    comment = factories.CommentFactory(post=post)
+    factories.CommentFactory(post=post, author=comment.author)
+
+    post.refresh_from_db()
+    post.topic.refresh_from_db()
+    assert post.comment_count == 2
+    assert post.topic.comment_count == 2
+    assert post.last_comment_id == post.topic.last_comment_id
+    assert models.UserStats.objects.get(
+        user=comment.author
+    ).comment_count == 2
+
+
+def test_batched_stats_update_on_post_deletion():
+    """Test that stats of post's deleted comments are updated at once."""
+    post = factories.PostFactory()
+    other_post = factories.PostFactory(topic=post.topic)
+    other_comment = factories.CommentFactory(post=other_post)
+    comments = factories.CommentFactory.create_batch(
+        size=3, post=post, author=other_comment.author
+    )
+    topic = post.topic
+    topic.refresh_from_db()
+    assert topic.last_comment_id == comments[-1].pk
+
+    with CaptureQueriesContext(connection) as queries:
+        post.delete()
+
+    topic_updates = [
+        query for query in queries.captured_queries
+        if query['sql'].startswith('UPDATE "forums_topic"')
+    ]
+    # Deleted last comment is unlinked by `SET_NULL`, then topic is updated
+    # once for counter and once for recalculated last comment
+    assert len(topic_updates) == 3
+    topic.refresh_from_db()
+    assert topic.comment_count == 1
+    assert topic.last_comment_id == other_comment.pk
+    assert models.UserStats.objects.get(
+        user=other_comment.author
+    ).comment_count == 1
+
+
+def test_batched_stats_update_nested():
+    """Test that nested block's changes are applied by outer block."""
+    post = factories.PostFactory()
+
+    with forum_update.batched_stats_update():
+        with forum_update.batched_stats_update():
+            factories.CommentFactory(post=post)
+        post.refresh_from_db()
+        assert post.comment_count == 0
+
+    post.refresh_from_db()
+    assert post.comment_count == 1
+
+
+def search_posts(keywords: list):
+    """Search posts by keywords in stored search vectors."""
+    return models.Post.objects.filter(
+        search_vector=services.get_keywords_search_query(keywords)
+    )
+
+
+def test_post_search_vector():
+    """Test that post is found by text of its first comment."""
+    post = factories.PostFactory(title='Divorce')
+    comment = factories.CommentFactory(post=post, text='Custody of zebra')
+    factories.CommentFactory(post=post, text='Giraffe')
+
+    assert post in search_posts(['zebra'])
+    assert post in search_posts(['divorce'])
+    # Only first comment is searched
+    assert post not in search_posts(['giraffe'])
+
+    comment.text = 'Custody of penguin'
+    comment.save()
+
+    assert post in search_posts(['penguin'])
+    assert post not in search_posts(['zebra'])
+
+
+def test_topic_search_vector():
+    """Test that topic's search vector is updated on save."""
+    topic = factories.TopicFactory(title='Immigration', description='Visa')
+    search_query = services.get_keywords_search_query(['visa'])
+
+    assert models.Topic.objects.filter(
+        pk=topic.pk, search_vector=search_query
+    ).exists()
+
+
+def test_fill_search_vectors():
+    """Test that search vectors of existing posts are filled by batches."""
+    posts = factories.PostFactory.create_batch(size=3, title='Bankruptcy')
+    models.Post.objects.filter(
+        pk__in=[post.pk for post in posts]
+    ).update(search_vector=None)
+    assert not search_posts(['bankruptcy']).exists()
+
+    updated = services.fill_search_vectors(models.Post, batch_size=2)
+
+    assert updated == models.Post.objects.count()
+    assert set(search_posts(['bankruptcy'])) == set(posts)
+
+
+def test_match_post_opportunities():
+    """Test that post is matched with attorneys by state and keywords."""
+    region = Region.objects.first()
+    jurisdiction = Jurisdiction.objects.create(state=region)
+    attorney = AttorneyFactory(keywords=['okapi'])
+    attorney.practice_jurisdictions.set([jurisdiction])
+    other_attorney = AttorneyFactory(keywords=['tapir'])
+    other_attorney.practice_jurisdictions.set([jurisdiction])
+    client = ClientFactory(state=region)
+    post = factories.PostFactory(
+        author=client.user, topic=factories.TopicFactory(practice_area=None)
+    )
+    factories.CommentFactory(post=post, author=client.user, text='Okapi')
+    post.refresh_from_db()
+
+    assert services.match_post_opportunities(post) == 1
+    assert list(
+        models.Post.objects.matched_opportunities(attorney.user)
+    ) == [post]
+    assert not models.Post.objects.matched_opportunities(
+        other_attorney.user
+    ).exists()
+
+    other_attorney.keywords = ['okapi']
+    other_attorney.save()
+    services.rematch_attorney_opportunities(other_attorney.user)
+
+    assert post in models.Post.objects.matched_opportunities(
+        other_attorney.user
+    )
+
+
+def test_match_post_opportunities_other_state():
+    """Test that post isn't matched with attorneys from other states."""
+    region, other_region = Region.objects.all()[:2]
+    attorney = AttorneyFactory(keywords=['okapi'])
+    attorney.practice_jurisdictions.set([
+        Jurisdiction.objects.create(state=other_region)
+    ])
+    client = ClientFactory(state=region)
+    post = factories.PostFactory(
+        author=client.user, topic=factories.TopicFactory(practice_area=None)
+    )
+    factories.CommentFactory(post=post, author=client.user, text='Okapi')
+    post.refresh_from_db()
+
+    services.match_post_opportunities(post)
+
+    assert not models.Post.objects.matched_opportunities(
+        attorney.user
+    ).exists()
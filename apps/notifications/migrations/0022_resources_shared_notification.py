@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+def add_resources_shared_notification(apps, schema_editor):
+    NotificationType = apps.get_model('notifications', 'NotificationType')
+    NotificationGroup = apps.get_model('notifications', 'NotificationGroup')
+    NotificationType.objects.create(
+        runtime_tag='resources_shared',
+        title='Files shared',
+        is_for_attorney=True,
+        is_for_enterprise=True,
+        is_for_paralegal=True,
+        is_for_client=True,
+        description='Batch of files is shared with you',
+        group=NotificationGroup.objects.filter(title='documents').first(),
+    )
+
+
+def remove_resources_shared_notification(apps, schema_editor):
+    NotificationType = apps.get_model('notifications', 'NotificationType')
+    NotificationType.objects.filter(runtime_tag='resources_shared').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0021_admin_registration_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=add_resources_shared_notification,
+            reverse_code=remove_resources_shared_notification,
+            elidable=False
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from apps.users.models import AppUser
 
@@ -22,13 +23,15 @@ class NotificationDispatchQuery(models.QuerySet):
     def get_allowed_to_notify(self):
         """Get dispatches, which settings allows to notify.
 
-        Also annotate notification's settings.
+        Also annotate notification's settings. Settings are taken from one
+        `NotificationSetting` row of recipient, so dispatches aren't
+        duplicated for recipients with several settings rows.
 
         """
         from .models import NotificationSetting
         settings_qs = NotificationSetting.objects.filter(
             user=models.OuterRef('recipient')
-        )
+        ).order_by('-pk')[:1]
         return self.annotate(
             by_email=models.Subquery(settings_qs.values('by_email')),
             by_push=models.Subquery(settings_qs.values('by_push')),
@@ -36,6 +39,21 @@ class NotificationDispatchQuery(models.QuerySet):
             models.Q(by_email=True) | models.Q(by_push=True)
         )
 
+    def mark_as_sent(self) -> int:
+        """Mark prepared dispatches as sent with one query.
+
+        Returns:
+            Number of updated dispatches
+
+        """
+        from .models import NotificationDispatch
+        return self.filter(
+            status=NotificationDispatch.STATUS_PREPARED
+        ).update(
+            status=NotificationDispatch.STATUS_SENT,
+            modified=timezone.now(),
+        )
+
     def get_unread_count(self):
         """Get number of unread notification"""
         from apps.notifications.models import NotificationDispatch
@@ -0,0 +1,110 @@
+import json
+import time
+import typing
+
+from django.conf import settings
+from django.db import models
+
+from django_redis import get_redis_connection
+
+from .resources import BaseNotificationResource
+
+__all__ = (
+    'get_coalescing_group',
+    'buffer_notification',
+    'pop_due_notifications',
+)
+
+# Sorted set of groups with pending notifications, score is time when group
+# should be flushed
+PENDING_GROUPS_KEY = 'notifications:coalescing:pending'
+# List of packed notification payloads of group
+GROUP_EVENTS_KEY = 'notifications:coalescing:events:{group}'
+
+
+def get_coalescing_window(
+    resource_class: typing.Type[BaseNotificationResource]
+) -> int:
+    """Get coalescing window(in seconds) of resource's notifications."""
+    return settings.NOTIFICATIONS_COALESCING_WINDOWS.get(
+        resource_class.runtime_tag, 0
+    )
+
+
+def get_coalescing_group(
+    resource_class: typing.Type[BaseNotificationResource],
+    instance: models.Model,
+) -> typing.Optional[str]:
+    """Get group in which notification should be coalesced.
+
+    Group consists of runtime_tag and id of object, by which resource's
+    notifications are coalesced(`coalesce_by` attribute of resource). For
+    example comments in forum are coalesced by post.
+
+    Returns:
+        None if notification shouldn't be coalesced
+
+    """
+    if not resource_class.coalesce_by:
+        return None
+    if not get_coalescing_window(resource_class):
+        return None
+    group_id = getattr(instance, resource_class.coalesce_by, None)
+    if group_id is None:
+        return None
+    return f'{resource_class.runtime_tag}:{group_id}'
+
+
+def get_redis():
+    """Get redis connection used for notifications' buffering."""
+    return get_redis_connection(settings.NOTIFICATIONS_COALESCING_REDIS_ALIAS)
+
+
+def buffer_notification(
+    resource_class: typing.Type[BaseNotificationResource],
+    group: str,
+    payload: dict,
+):
+    """Put notification payload to group's buffer.
+
+    Group is scheduled to be flushed in coalescing window after its first
+    notification. Later notifications don't move flush time, so notifications
+    are delayed at most for coalescing window.
+
+    """
+    flush_at = time.time() + get_coalescing_window(resource_class)
+    pipe = get_redis().pipeline()
+    pipe.rpush(GROUP_EVENTS_KEY.format(group=group), json.dumps(payload))
+    pipe.zadd(PENDING_GROUPS_KEY, {group: flush_at}, nx=True)
+    pipe.execute()
+
+
+def pop_due_notifications(
+    now: float = None
+) -> typing.Dict[str, typing.List[dict]]:
+    """Get and remove from buffer notifications of groups ready for flush.
+
+    Group is removed from pending ones before its notifications are taken, so
+    concurrent flushes won't take the same group twice. Notifications, that
+    arrived after group was taken, start new group.
+
+    Returns:
+        Mapping of group to list of its packed notification payloads
+
+    """
+    redis = get_redis()
+    now = now or time.time()
+    due_groups = redis.zrangebyscore(PENDING_GROUPS_KEY, '-inf', now)
+    notifications = {}
+    for group in due_groups:
+        if not redis.zrem(PENDING_GROUPS_KEY, group):
+            continue
+        group = group.decode()
+        events_key = GROUP_EVENTS_KEY.format(group=group)
+        pipe = redis.pipeline()
+        pipe.lrange(events_key, 0, -1)
+        pipe.delete(events_key)
+        events, _ = pipe.execute()
+        if events:
+            notifications[group] = [json.loads(event) for event in events]
+    return notifications
@@ -1,19 +1,43 @@
 import logging
 import pprint
+import time
+import typing
+from collections import namedtuple
 from functools import partial
 
+from django.conf import settings
 from django.db.models import QuerySet
 
-from libs.utils import get_base_url
+from libs.utils import chunked, get_base_url
 
 from ...notifications import models, querysets
 from ...users.models import AppUser
+from .preferences import get_preferences, is_allowed_to_notify
 from .resources import RESOURCE_MAPPING, BaseNotificationResource
-from .sender import send_notification_by_email, send_notification_by_push
+from .sender import (
+    get_recipients_devices,
+    send_notification_by_email,
+    send_notification_by_push,
+    send_notifications_by_email_in_batch,
+    send_notifications_by_push_in_batch,
+)
 from .tools import get_allowed_to_notify
 
 logger = logging.getLogger('django')
 
+DispatchBatchStats = namedtuple(
+    'DispatchBatchStats',
+    [
+        'dispatches',
+        'emails',
+        'emails_sent',
+        'pushes',
+        'pushes_sent',
+        'marked_as_sent',
+        'duration',
+    ]
+)
+
 
 class NotificationDispatcher:
     """Used to send notifications to it's recipients.
@@ -30,6 +54,12 @@ class NotificationDispatcher:
         dispatches (NotificationDispatchQuery):
             Queryset of notification dispatches, that will be used for
             dispatching
+        batched (bool):
+            Send dispatches in batches(by default it's taken from
+            `NOTIFICATIONS_BATCHED_FAN_OUT` setting)
+        recipients (QuerySet):
+            Queryset of potential recipients, which is used instead of
+            resource's recipients(for example for coalesced notifications)
 
     """
 
@@ -37,22 +67,54 @@ class NotificationDispatcher:
         self,
         resource: BaseNotificationResource = None,
         notification: models.Notification = None,
-        dispatches: querysets.NotificationDispatchQuery = None
+        dispatches: querysets.NotificationDispatchQuery = None,
+        batched: bool = None,
+        recipients: QuerySet = None,
     ):
         """Initiate notification dispatcher."""
         self.resource: BaseNotificationResource = resource
         self.notification: models.Notification = notification
         self.dispatches: QuerySet = dispatches
+        if batched is None:
+            batched = settings.NOTIFICATIONS_BATCHED_FAN_OUT
+        self.batched = batched
+        self.recipients: QuerySet = recipients
+
+    def get_potential_recipients(self) -> QuerySet:
+        """Get recipients of notification without checking their settings."""
+        if self.recipients is not None:
+            return self.recipients
+        return self.resource.get_recipients()
 
     def get_recipients(self) -> QuerySet:
         """Get recipients to which we allowed to send notifications."""
         assert self.resource, 'resource is not set'
         assert self.notification, 'notification is not set'
         return get_allowed_to_notify(
-            recipients=self.resource.get_recipients(),
+            recipients=self.get_potential_recipients(),
             runtime_tag=self.notification.type.runtime_tag
         )
 
+    def get_recipients_ids(self) -> typing.List[int]:
+        """Get ids of recipients to which we allowed to send notifications.
+
+        Unlike `get_recipients` recipients are checked in memory by using
+        cached notifications preferences.
+
+        """
+        assert self.resource, 'resource is not set'
+        assert self.notification, 'notification is not set'
+        runtime_tag = self.notification.type.runtime_tag
+        recipients_ids = self.get_potential_recipients().values_list(
+            'pk', flat=True
+        )
+        preferences = get_preferences(recipients_ids)
+        return [
+            recipient_id for recipient_id, recipient_preferences
+            in preferences.items()
+            if is_allowed_to_notify(recipient_preferences, runtime_tag)
+        ]
+
     def create_notification_dispatches(
         self
     ) -> querysets.NotificationDispatchQuery:
@@ -60,10 +122,10 @@ class NotificationDispatcher:
         dispatches = models.NotificationDispatch.objects.bulk_create(
             models.NotificationDispatch(
                 notification=self.notification,
-                recipient=recipient,
+                recipient_id=recipient_id,
                 sender=self.resource.user
             )
-            for recipient in self.get_recipients()
+            for recipient_id in self.get_recipients_ids()
         )
         pks = [dispatch.pk for dispatch in dispatches]
         return models.NotificationDispatch.objects.filter(
@@ -86,18 +148,120 @@ class NotificationDispatcher:
     def notify(self):
         """Send push and email notifications to recipients"""
         notification_dispatches = self.get_notification_dispatches_queryset()
+        if self.batched:
+            self.notify_in_batches(notification_dispatches)
+            return
         for dispatch in notification_dispatches:
             self.dispatch_notification(dispatch=dispatch)
 
+    @classmethod
+    def notify_in_batches(
+        cls, dispatches: querysets.NotificationDispatchQuery
+    ) -> typing.List[DispatchBatchStats]:
+        """Send notifications to recipients batch by batch."""
+        batches_stats = []
+        for batch in chunked(
+            dispatches.iterator(), settings.NOTIFICATIONS_BATCH_SIZE
+        ):
+            stats = cls.dispatch_batch(dispatches=batch)
+            logger.info(f'Notifications batch dispatched: {stats}')
+            batches_stats.append(stats)
+        return batches_stats
+
+    @classmethod
+    def dispatch_batch(
+        cls, dispatches: typing.Sequence[models.NotificationDispatch]
+    ) -> DispatchBatchStats:
+        """Dispatch batch of notifications to recipients.
+
+        Dispatches of the same notification share one notification instance,
+        so notification's content object is fetched once per batch. Devices
+        of all recipients are fetched with one query, emails are sent through
+        one connection and successful dispatches are marked as sent with one
+        update query.
+
+        """
+        started_at = time.monotonic()
+        notifications = {}
+        email_messages = []
+        push_messages = []
+        for dispatch in dispatches:
+            notification = notifications.setdefault(
+                dispatch.notification_id, dispatch.notification
+            )
+            dispatch.notification = notification
+            cls.prepare_notification_payload(
+                notification=notification, recipient=dispatch.recipient
+            )
+            resource = RESOURCE_MAPPING[notification.type.runtime_tag]
+            if dispatch.by_email:
+                email_messages.append((
+                    dispatch,
+                    resource.get_email_subject(
+                        notification, recipient=dispatch.recipient
+                    ),
+                    resource.get_email_notification_content(
+                        notification=notification, recipient=dispatch.recipient
+                    ),
+                ))
+            if dispatch.by_push:
+                push_messages.append((
+                    dispatch,
+                    notification.title,
+                    resource.get_push_notification_content(
+                        notification=notification, recipient=dispatch.recipient
+                    ),
+                ))
+
+        sent_by_email = send_notifications_by_email_in_batch(email_messages)
+        devices = {}
+        if push_messages and settings.FCM_FIREBASE_ENABLED:
+            devices = get_recipients_devices(
+                dispatch.recipient_id for dispatch, _, _ in push_messages
+            )
+        sent_by_push = send_notifications_by_push_in_batch(
+            push_messages, devices=devices
+        )
+
+        sent_dispatches = [
+            dispatch.pk for dispatch in dispatches
+            if (not dispatch.by_email or dispatch.pk in sent_by_email)
+            and (not dispatch.by_push or dispatch.pk in sent_by_push)
+        ]
+        marked_as_sent = 0
+        if sent_dispatches:
+            marked_as_sent = models.NotificationDispatch.objects.filter(
+                pk__in=sent_dispatches
+            ).mark_as_sent()
+
+        return DispatchBatchStats(
+            dispatches=len(dispatches),
+            emails=len(email_messages),
+            emails_sent=len(sent_by_email),
+            pushes=len(push_messages),
+            pushes_sent=len(sent_by_push),
+            marked_as_sent=marked_as_sent,
+            duration=round(time.monotonic() - started_at, 3),
+        )
+
+    @staticmethod
+    def prepare_notification_payload(
+        notification: models.Notification, recipient: AppUser
+    ):
+        """Add recipient related data to notification's extra payload."""
+        notification.extra_payload['user_name'] = ' '.join(
+            [recipient.first_name, recipient.last_name]
+        )
+        notification.extra_payload['user_key'] = recipient.uuid
+        notification.extra_payload['current_site'] = get_base_url()
+
     @classmethod
     def dispatch_notification(cls, dispatch: models.NotificationDispatch):
         """Dispatch notification to recipient."""
         notification = dispatch.notification
-        notification.extra_payload['user_name'] = ' '.join(
-            [dispatch.recipient.first_name, dispatch.recipient.last_name]
+        cls.prepare_notification_payload(
+            notification=notification, recipient=dispatch.recipient
         )
-        notification.extra_payload['user_key'] = dispatch.recipient.uuid
-        notification.extra_payload['current_site'] = get_base_url()
         resource = RESOURCE_MAPPING[notification.type.runtime_tag]
         send = partial(
             cls.send,
@@ -0,0 +1,157 @@
+import typing
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from .resources import NOTIFICATION_RESOURCES, BaseNotificationResource
+
+__all__ = (
+    'pack_notification_payload',
+    'unpack_notification_payload',
+)
+
+# Key used to mark references to model instances in packed kwargs
+MODEL_REFERENCE_KEY = '__model__'
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Signal's kwargs, which resources don't need
+EXCLUDED_KWARGS = ('signal', 'sender')
+
+
+def get_resource_path(
+    resource_class: typing.Type[BaseNotificationResource]
+) -> str:
+    """Get dotted path of resource class, which is used in payloads.
+
+    Runtime tags can't be used to identify resources, since they are not
+    unique(for example leads and group chats both have `new_chat` tag).
+
+    """
+    return f'{resource_class.__module__}.{resource_class.__qualname__}'
+
+
+RESOURCES_BY_PATH = {
+    get_resource_path(resource): resource
+    for resource in NOTIFICATION_RESOURCES
+}
+
+
+def pack_notification_payload(
+    resource_class: typing.Type[BaseNotificationResource],
+    instance: models.Model,
+    **kwargs,
+) -> dict:
+    """Pack notification data into JSON serializable payload.
+
+    Instead of model instances payload contains only references to them
+    (content type id and primary key), so it's compact and worker always
+    works with actual data from db. Sets, lists and tuples are packed as
+    lists.
+
+    Raises:
+        TypeError: if kwargs contain values, that can't be packed
+
+    """
+    return dict(
+        resource=get_resource_path(resource_class),
+        instance=_pack_model(instance),
+        kwargs={
+            key: _pack_value(value)
+            for key, value in kwargs.items()
+            if key not in EXCLUDED_KWARGS
+        },
+    )
+
+
+def unpack_notification_payload(
+    payload: dict
+) -> typing.Tuple[
+    typing.Type[BaseNotificationResource], models.Model, dict
+]:
+    """Restore resource class, instance and kwargs from packed payload.
+
+    Instance is fetched with one query with resource's `select_related`
+    relations. Model instances from kwargs are fetched with one query per
+    model.
+
+    Raises:
+        ObjectDoesNotExist: if instance was deleted
+
+    """
+    resource_class = RESOURCES_BY_PATH[payload['resource']]
+    content_type_id, pk = payload['instance']
+    instance_model = ContentType.objects.get_for_id(
+        content_type_id
+    ).model_class()
+    instance = instance_model._default_manager.select_related(
+        *resource_class.select_related
+    ).get(pk=pk)
+
+    references = defaultdict(set)
+    for value in payload['kwargs'].values():
+        _collect_references(value, references)
+    fetched = {}
+    for content_type_id, pks in references.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        fetched[content_type_id] = {
+            str(pk): obj
+            for pk, obj in model._default_manager.in_bulk(pks).items()
+        }
+    kwargs = {
+        key: _unpack_value(value, fetched)
+        for key, value in payload['kwargs'].items()
+    }
+    return resource_class, instance, kwargs
+
+
+def _pack_model(instance: models.Model) -> list:
+    """Get reference to model instance.
+
+    Primary keys, which are not integers(like UUID), are packed as strings.
+
+    """
+    content_type = ContentType.objects.get_for_model(instance)
+    pk = instance.pk
+    if not isinstance(pk, int):
+        pk = str(pk)
+    return [content_type.pk, pk]
+
+
+def _pack_value(value: typing.Any) -> typing.Any:
+    """Pack value of kwarg."""
+    if isinstance(value, models.Model):
+        return {MODEL_REFERENCE_KEY: _pack_model(value)}
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return [_pack_value(item) for item in value]
+    if isinstance(value, SCALAR_TYPES):
+        return value
+    raise TypeError(
+        f'Value of type `{type(value).__name__}` can not be passed to '
+        f'notification task'
+    )
+
+
+def _collect_references(value: typing.Any, references: dict):
+    """Collect references to model instances from packed value."""
+    if isinstance(value, dict):
+        content_type_id, pk = value[MODEL_REFERENCE_KEY]
+        references[content_type_id].add(pk)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_references(item, references)
+
+
+def _unpack_value(value: typing.Any, fetched: dict) -> typing.Any:
+    """Restore packed value of kwarg.
+
+    If referenced instance was deleted, it's restored as `None`.
+
+    """
+    if isinstance(value, dict):
+        content_type_id, pk = value[MODEL_REFERENCE_KEY]
+        return fetched[content_type_id].get(str(pk))
+    if isinstance(value, list):
+        return [_unpack_value(item, fetched) for item in value]
+    return value
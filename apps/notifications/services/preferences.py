@@ -0,0 +1,114 @@
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ...notifications import models
+
+__all__ = (
+    'CHANNEL_CATEGORIES',
+    'get_channel_category',
+    'get_preferences',
+    'is_allowed_to_notify',
+    'invalidate_preferences',
+)
+
+# Channel categories of notifications. Each category is a name of
+# `NotificationSetting` field, which user can use to turn off notifications
+# of the category. Notifications without category depend only on `by_email`
+# and `by_push` settings
+CATEGORY_CHATS = 'by_chats'
+CATEGORY_MATTERS = 'by_matters'
+CATEGORY_FORUMS = 'by_forums'
+CATEGORY_CONTACTS = 'by_contacts'
+
+CHANNEL_CATEGORIES = {
+    'new_message': CATEGORY_CHATS,
+    'new_chat': CATEGORY_CHATS,
+    'new_video_call': CATEGORY_CHATS,
+    'matter_status_update': CATEGORY_MATTERS,
+    'new_matter_shared': CATEGORY_MATTERS,
+    'new_matter_referred': CATEGORY_MATTERS,
+    'new_matter_accepted': CATEGORY_MATTERS,
+    'new_referral_declined': CATEGORY_MATTERS,
+    'document_uploaded_to_matter': CATEGORY_MATTERS,
+    'new_billing_item': CATEGORY_MATTERS,
+    'new_invoice': CATEGORY_MATTERS,
+    'new_post': CATEGORY_FORUMS,
+    'new_attorney_post': CATEGORY_FORUMS,
+    'new_post_on_topic': CATEGORY_FORUMS,
+    'new_opportunities': CATEGORY_CONTACTS,
+    'new_registered_contact_shared': CATEGORY_CONTACTS,
+}
+
+# Fields of `NotificationSetting` which are stored in cache
+PREFERENCES_FIELDS = (
+    'by_email',
+    'by_push',
+    CATEGORY_CHATS,
+    CATEGORY_MATTERS,
+    CATEGORY_FORUMS,
+    CATEGORY_CONTACTS,
+)
+
+PREFERENCES_CACHE_KEY = 'notifications:preferences:{user_id}'
+
+
+def get_channel_category(runtime_tag: str) -> typing.Optional[str]:
+    """Get channel category of notification type by its runtime_tag."""
+    return CHANNEL_CATEGORIES.get(runtime_tag)
+
+
+def get_preferences(
+    users_ids: typing.Iterable[int]
+) -> typing.Dict[int, dict]:
+    """Get users' notifications preferences.
+
+    Preferences are taken from cache, missing ones are fetched from db with
+    one query and put to cache. Users without `NotificationSetting` get empty
+    preferences, which means that they can't be notified.
+
+    Returns:
+        Mapping of user id to dict with `NotificationSetting` values
+
+    """
+    keys = {
+        PREFERENCES_CACHE_KEY.format(user_id=user_id): user_id
+        for user_id in users_ids
+    }
+    cached = cache.get_many(keys.keys())
+    preferences = {keys[key]: value for key, value in cached.items()}
+
+    missing_ids = set(keys.values()) - set(preferences.keys())
+    if not missing_ids:
+        return preferences
+
+    fetched = {user_id: {} for user_id in missing_ids}
+    # Latest setting of user wins, same as in dispatches filtering
+    settings_values = models.NotificationSetting.objects.filter(
+        user_id__in=missing_ids
+    ).order_by('pk').values('user_id', *PREFERENCES_FIELDS)
+    for setting_values in settings_values:
+        fetched[setting_values.pop('user_id')] = setting_values
+    cache.set_many(
+        {
+            PREFERENCES_CACHE_KEY.format(user_id=user_id): value
+            for user_id, value in fetched.items()
+        },
+        timeout=settings.NOTIFICATIONS_PREFERENCES_CACHE_TIMEOUT,
+    )
+    preferences.update(fetched)
+    return preferences
+
+
+def is_allowed_to_notify(preferences: dict, runtime_tag: str) -> bool:
+    """Check if user's preferences allow to send notification."""
+    if not preferences.get('by_email') and not preferences.get('by_push'):
+        return False
+    category = get_channel_category(runtime_tag)
+    return category is None or preferences.get(category, False)
+
+
+def invalidate_preferences(user_id: int):
+    """Remove user's notifications preferences from cache."""
+    cache.delete(PREFERENCES_CACHE_KEY.format(user_id=user_id))
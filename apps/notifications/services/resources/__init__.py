@@ -22,6 +22,7 @@ from .documents import (
     DocumentSharedNotificationResource,
     DocumentUploadedNotificationResource,
     DocumentUploadedToMatterNotificationResource,
+    ResourcesSharedNotificationResource,
 )
 from .forums import (
     NewAttorneyCommentNotificationResource,
@@ -46,6 +47,7 @@ NOTIFICATION_RESOURCES = (
     DocumentSharedNotificationResource,
     DocumentUploadedNotificationResource,
     DocumentUploadedToMatterNotificationResource,
+    ResourcesSharedNotificationResource,
     MatterStatusUpdateNotificationResource,
     NewBillingItemNotificationResource,
     NewAttorneyEventNotificationResource,
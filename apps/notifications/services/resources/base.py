@@ -41,6 +41,13 @@ class BaseNotificationResource:
         email_content_template(str):
             Path to html template for email notification's content. Used for
             creating html content for email notifications
+        select_related(tuple):
+            Relations of instance, which are fetched together with instance,
+            when it's restored in notification task
+        coalesce_by(str):
+            Name of instance's attribute with id of object, by which bursts
+            of notifications are coalesced into one digest notification
+            (if coalescing window is set for runtime_tag)
 
     """
     signal = None
@@ -53,6 +60,8 @@ class BaseNotificationResource:
     email_content_template: str = None
     deep_link_template: str = None
     id_attr_path: str = None
+    select_related: tuple = ()
+    coalesce_by: str = None
 
     def __init__(self, instance: BaseModel, **kwargs):
         """Initialize notification resource."""
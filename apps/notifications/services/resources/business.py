@@ -21,6 +21,7 @@ class NewMessageNotificationResource(BaseNotificationResource):
     """
     signal = business_signals.new_message
     instance_type = business_models.MatterComment
+    coalesce_by = 'post_id'
     runtime_tag = 'new_message'
     title = 'New message'
     deep_link_template = '{base_url}/matters/messages/{id}'
@@ -183,6 +184,7 @@ class NewMatterResource(BaseNotificationResource):
     """
     signal = business_signals.new_matter
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'new_matter'
     title = 'New Matter'
     deep_link_template = '{base_url}/matters/{id}'
@@ -224,6 +226,7 @@ class MatterStatusUpdateNotificationResource(BaseNotificationResource):
     """
     signal = business_signals.matter_status_update
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'matter_status_update'
     title = 'Matter status update'
     deep_link_template = '{base_url}/matters/{id}'
@@ -358,6 +361,7 @@ class MatterReferredResource(BaseNotificationResource):
     """
     signal = business_signals.new_matter_referred
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'new_matter_referred'
     title = 'New Matter Referred'
     deep_link_template = '{base_url}/matters/{id}'
@@ -433,6 +437,7 @@ class ReferralAcceptedResource(BaseNotificationResource):
     """
     signal = business_signals.new_referral_accepted
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'new_referral_accepted'
     title = 'Referral Accepted'
     deep_link_template = '{base_url}/matters/{id}'
@@ -506,6 +511,7 @@ class ReferralDeclinedResource(BaseNotificationResource):
     """
     signal = business_signals.new_referral_declined
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'new_referral_declined'
     title = 'Referral Declined'
     deep_link_template = '{base_url}/matters/{id}'
@@ -580,6 +586,7 @@ class MatterStageUpdateNotificationResource(BaseNotificationResource):
     """
     signal = business_signals.matter_stage_update
     instance_type = business_models.Matter
+    select_related = ('attorney__user', 'client__user')
     runtime_tag = 'matter_stage_update'
     title = 'Matter stage update'
     deep_link_template = '{base_url}/matters/{id}'
@@ -871,6 +878,7 @@ class NewBillingItemNotificationResource(BaseNotificationResource):
     """
     signal = business_signals.billing_item_is_created
     instance_type = business_models.BillingItem
+    coalesce_by = 'matter_id'
     runtime_tag = 'new_billing_item'
     title = 'New billing item'
     deep_link_template = '{base_url}/matters/billing-item/{id}'
@@ -21,6 +21,11 @@ class DocumentSharedNotificationResource(BaseNotificationResource):
     """
     signal = documents_signals.document_shared_by_attorney
     instance_type = documents_models.Document
+    select_related = (
+        'created_by',
+        'matter__attorney__user',
+        'matter__client__user',
+    )
     runtime_tag = 'document_shared_by_attorney'
     title = 'File shared'
     deep_link_template = '{base_url}/matters/{id}'
@@ -63,6 +68,11 @@ class DocumentUploadedNotificationResource(BaseNotificationResource):
     """
     signal = documents_signals.document_uploaded_to_folder
     instance_type = documents_models.Document
+    select_related = (
+        'created_by',
+        'matter__attorney__user',
+        'matter__client__user',
+    )
     runtime_tag = 'document_uploaded'
     title = 'File uploaded'
     deep_link_template = '{base_url}/documents/{id}'
@@ -122,7 +132,13 @@ class DocumentUploadedToMatterNotificationResource(BaseNotificationResource):
     """
     signal = documents_signals.document_uploaded_to_matter
     instance_type = documents_models.Document
+    select_related = (
+        'created_by',
+        'matter__attorney__user',
+        'matter__client__user',
+    )
     runtime_tag = 'document_uploaded_to_matter'
+    coalesce_by = 'matter_id'
     title = 'File uploaded to matter'
     deep_link_template = '{base_url}/documents/{id}'
     id_attr_path: str = 'id'
@@ -176,3 +192,55 @@ class DocumentUploadedToMatterNotificationResource(BaseNotificationResource):
             pk=notification.extra_payload.get('notification_sender')
         ).first()
         return payload
+
+
+class ResourcesSharedNotificationResource(BaseNotificationResource):
+    """Notification class for batch of resources shared with users.
+
+    This notification is sent once per batch sharing of documents and
+    folders, instead of one notification per resource.
+
+    Recipients: users, who got access to new resources
+
+    """
+    signal = documents_signals.resources_shared
+    instance_type = user_models.AppUser
+    runtime_tag = 'resources_shared'
+    title = 'Files shared'
+    deep_link_template = '{base_url}/documents'
+    id_attr_path: str = 'pk'
+    web_content_template = (
+        'notifications/documents/resources_shared/web.txt'
+    )
+    push_content_template = (
+        'notifications/documents/resources_shared/push.txt'
+    )
+    email_subject_template = (
+        '{{instance.full_name}} has shared files with you'
+    )
+    email_content_template = (
+        'notifications/documents/resources_shared/email.html'
+    )
+
+    def __init__(
+        self,
+        instance: BaseModel,
+        receiver_pks,
+        resources_count: int,
+        **kwargs
+    ):
+        """Add user, recipients and number of shared resources."""
+        self.user: user_models.AppUser = instance
+        self.receiver_pks = receiver_pks
+        self.resources_count = resources_count
+        super().__init__(instance, **kwargs)
+
+    def get_recipients(self) -> QuerySet:
+        """Get users, with whom resources were shared."""
+        return user_models.AppUser.objects.filter(pk__in=self.receiver_pks)
+
+    def get_notification_extra_payload(self) -> dict:
+        return dict(
+            resources_count=self.resources_count,
+            notification_sender=self.instance.pk,
+        )
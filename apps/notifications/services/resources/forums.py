@@ -20,9 +20,11 @@ class NewCommentNotificationResource(BaseNotificationResource):
     """
     signal = forums_signals.new_comment_on_post
     instance_type = forum_models.Comment
+    select_related = ('post', 'author')
     # TODO: these template paths and runtime tag
     #  needs to be updated in accordance with new forums system
     runtime_tag = 'new_post'
+    coalesce_by = 'post_id'
     title = 'New comment'
     deep_link_template = '{base_url}/forum/post/{id}/0'
     id_attr_path: str = 'post_id'
@@ -63,6 +65,7 @@ class NewAttorneyCommentNotificationResource(BaseNotificationResource):
     """
     signal = forums_signals.new_comment_on_post_by_attorney
     instance_type = forum_models.Comment
+    select_related = ('post', 'author')
     # TODO: these template paths and runtime tag
     #  needs to be updated in accordance with new forums system
     runtime_tag = 'new_attorney_post'
@@ -1,13 +1,26 @@
 import logging
+import typing
+from collections import defaultdict
 
 from django.conf import settings
+from django.core.mail import get_connection
 
+from fcm_django.fcm import fcm_send_bulk_message
 from fcm_django.models import FCMDevice
 
+from libs.utils import chunked
+
 from apps.users.models import AppUser
 
+from .. import models
 from .email import EmailNotification
 
+# Notification dispatch with rendered title and content
+PreparedMessage = typing.Tuple[models.NotificationDispatch, str, str]
+
+# FCM errors after which device can't receive push notifications anymore
+FCM_INACTIVE_DEVICE_ERRORS = ('NotRegistered', 'InvalidRegistration')
+
 logger = logging.getLogger('django')
 
 
@@ -58,18 +71,9 @@ def send_notification_by_push(
         logger.info(f'{recipient} has no devices to push notification')
         return True
 
-    dispatch = kwargs['dispatch']
-    notification = kwargs['notification']
-    runtime_tag = notification.type.runtime_tag
-    notification_data = dict(
-        runtime_tag=runtime_tag,
-        object_id=notification.object_id,
-        dispatch_id=dispatch.pk,
-        notification_foreground=True
-    )
-    notification_data.update(settings.PUSH_NOTIFICATIONS_EXTRA_PARAMS.get(
-            runtime_tag, {}
-        )
+    notification_data = get_push_notification_data(
+        dispatch=kwargs['dispatch'],
+        notification=kwargs['notification'],
     )
     response = recipient_devices.send_message(
         title=title,
@@ -95,6 +99,151 @@ def send_notification_by_push(
     return send_status
 
 
+def get_push_notification_data(
+    dispatch: models.NotificationDispatch,
+    notification: models.Notification,
+) -> dict:
+    """Get data payload of push notification."""
+    runtime_tag = notification.type.runtime_tag
+    notification_data = dict(
+        runtime_tag=runtime_tag,
+        object_id=notification.object_id,
+        dispatch_id=dispatch.pk,
+        notification_foreground=True
+    )
+    notification_data.update(settings.PUSH_NOTIFICATIONS_EXTRA_PARAMS.get(
+            runtime_tag, {}
+        )
+    )
+    return notification_data
+
+
+def get_recipients_devices(
+    recipients_ids: typing.Iterable[int]
+) -> typing.Dict[int, typing.List[str]]:
+    """Get registration ids of recipients' active devices with one query."""
+    devices = defaultdict(list)
+    recipients_devices = FCMDevice.objects.filter(
+        user_id__in=recipients_ids,
+        active=True,
+    ).values_list('user_id', 'registration_id')
+    for user_id, registration_id in recipients_devices:
+        devices[user_id].append(registration_id)
+    return devices
+
+
+def send_notifications_by_email_in_batch(
+    messages: typing.Sequence[PreparedMessage]
+) -> typing.Set[int]:
+    """Send email notifications using one email backend connection.
+
+    Returns:
+        Set of ids of dispatches, which emails were sent successfully
+
+    """
+    sent_dispatches = set()
+    if not messages:
+        return sent_dispatches
+
+    with get_connection() as connection:
+        for dispatch, title, content in messages:
+            email_notification = EmailNotification(
+                subject=title,
+                recipient_list=(dispatch.recipient.email,),
+                html_message=content
+            )
+            if email_notification.send(connection=connection):
+                sent_dispatches.add(dispatch.pk)
+            else:
+                logger.error(
+                    f'Email notification sent failed: `{title}` to '
+                    f'{dispatch.recipient}(pk={dispatch.recipient_id})'
+                )
+    logger.info(
+        f'Email notifications sent in batch: '
+        f'{len(sent_dispatches)}/{len(messages)}'
+    )
+    return sent_dispatches
+
+
+def send_notifications_by_push_in_batch(
+    messages: typing.Sequence[PreparedMessage],
+    devices: typing.Dict[int, typing.List[str]],
+) -> typing.Set[int]:
+    """Send push notifications using FCM multicast requests.
+
+    Each recipient's devices are notified by multicast requests, which are
+    split by `NOTIFICATIONS_FCM_MULTICAST_SIZE`. Devices, that FCM reported
+    as not registered, are deactivated with one query.
+
+    Arguments:
+        messages: prepared dispatches with push title and content
+        devices: mapping of recipient id to registration ids of his active
+            devices
+
+    Returns:
+        Set of ids of dispatches, which push notifications were sent
+        successfully
+
+    """
+    # If fcm is disabled just mark all dispatches as sent
+    if not settings.FCM_FIREBASE_ENABLED:
+        return set(dispatch.pk for dispatch, _, _ in messages)
+
+    sent_dispatches = set()
+    inactive_registration_ids = []
+    for dispatch, title, content in messages:
+        registration_ids = devices.get(dispatch.recipient_id)
+        if not registration_ids:
+            logger.info(
+                f'{dispatch.recipient} has no devices to push notification'
+            )
+            sent_dispatches.add(dispatch.pk)
+            continue
+
+        notification_data = get_push_notification_data(
+            dispatch=dispatch,
+            notification=dispatch.notification,
+        )
+        success_count = 0
+        for registration_ids_chunk in chunked(
+            registration_ids, settings.NOTIFICATIONS_FCM_MULTICAST_SIZE
+        ):
+            response = fcm_send_bulk_message(
+                registration_ids=registration_ids_chunk,
+                title=title,
+                body=content,
+                data=notification_data,
+            )
+            logger.info(format_push_sending_results(response))
+            success_count += response['success']
+            inactive_registration_ids.extend(
+                registration_id
+                for registration_id, result in zip(
+                    registration_ids_chunk, response['results']
+                )
+                if result.get('error') in FCM_INACTIVE_DEVICE_ERRORS
+            )
+
+        if success_count:
+            sent_dispatches.add(dispatch.pk)
+        else:
+            logger.warning(
+                f'Push notification sent failed: `{title}` to '
+                f'{dispatch.recipient}(pk={dispatch.recipient_id})'
+            )
+
+    if inactive_registration_ids:
+        FCMDevice.objects.filter(
+            registration_id__in=inactive_registration_ids
+        ).update(active=False)
+    logger.info(
+        f'Push notifications sent in batch: '
+        f'{len(sent_dispatches)}/{len(messages)}'
+    )
+    return sent_dispatches
+
+
 def format_push_sending_results(response: dict) -> str:
     """Format fcm response."""
     results = (str(result) for result in response['results'])
@@ -4,8 +4,12 @@ from functools import partial
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import signals as db_signals
 from django.db.transaction import on_commit
+from django.dispatch import receiver
 
 from . import models, tasks
+from .services.coalescing import buffer_notification, get_coalescing_group
+from .services.payloads import pack_notification_payload
+from .services.preferences import invalidate_preferences
 from .services.resources import RESOURCE_MAPPING
 
 logger = logging.getLogger('django')
@@ -14,15 +18,18 @@ logger = logging.getLogger('django')
 def generate_and_send_notification(instance, resource_class, **kwargs):
     """Generate notification for new event and send it to it's recipients."""
     logger.info(f'New notification: {resource_class.runtime_tag}')
-    # Celery can't pickle signal object(_thread.lock object)
-    kwargs.pop('signal')
-    on_commit(
-        lambda: tasks.send_notifications.delay(
-            resource_class,
-            instance,
-            **kwargs
+    # Task gets only ids of instances, which it fetches from db by itself.
+    # Kwargs, which can't be packed, raise `TypeError` right here, instead of
+    # sending broken payload to worker
+    payload = pack_notification_payload(resource_class, instance, **kwargs)
+    # Bursts of notifications are buffered and later sent as one digest
+    group = get_coalescing_group(resource_class, instance)
+    if group:
+        on_commit(
+            lambda: buffer_notification(resource_class, group, payload)
         )
-    )
+        return
+    on_commit(lambda: tasks.send_notifications.delay(payload))
 
 
 def delete_redundant_notification(instance, **kwargs):
@@ -42,6 +49,15 @@ def delete_redundant_notification(instance, **kwargs):
     ).delete()
 
 
+@receiver(db_signals.post_save, sender=models.NotificationSetting)
+@receiver(db_signals.post_delete, sender=models.NotificationSetting)
+def invalidate_cached_preferences(
+    instance: models.NotificationSetting, **kwargs
+):
+    """Invalidate cached notifications preferences of setting's user."""
+    invalidate_preferences(user_id=instance.user_id)
+
+
 # Connect `generate_and_send_notification` function to all signal and model
 # pairs from `SIGNALS_MAPPING`
 # Connect all models from `SIGNALS_MAPPING` to `delete_redundant_notification`
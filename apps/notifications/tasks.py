@@ -1,29 +1,112 @@
 import logging
+import typing
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet
 
 from post_request_task.task import task
 
 from config.celery import app
 
-from ..core.models import BaseModel
+from ..users.models import AppUser
 from . import models, querysets
+from .services.coalescing import pop_due_notifications
 from .services.dispatcher import NotificationDispatcher
+from .services.payloads import unpack_notification_payload
+from .services.resources import BaseNotificationResource
 
 logger = logging.getLogger('django')
 
 
-@task()
-def send_notifications(resource_class, instance: BaseModel, **kwargs):
-    """Send notifications by using notification resource and dispatcher."""
+@task(serializer='json')
+def send_notifications(payload: dict):
+    """Send notifications by using notification resource and dispatcher.
+
+    Payload is packed by `pack_notification_payload`, it contains only ids
+    of instances, which are fetched from db right before sending.
+
+    """
+    try:
+        resource_class, instance, kwargs = unpack_notification_payload(
+            payload
+        )
+    except ObjectDoesNotExist:
+        logger.warning(
+            f'Notification `{payload["resource"]}` is skipped, since its '
+            f'instance {payload["instance"]} no longer exists'
+        )
+        return
     resource = resource_class(instance=instance, **kwargs)
+    create_and_dispatch_notification(resource=resource)
+
+
+@app.task(serializer='json')
+def send_coalesced_notifications(payloads: typing.List[dict]):
+    """Send one digest notification for burst of coalesced notifications.
+
+    Digest notification is generated by resource of the latest notification
+    in burst and it's sent to all recipients of burst's notifications, except
+    author of the latest notification's instance.
+    Number of coalesced notifications is added to notification's extra
+    payload as `coalesced_count`.
+
+    """
+    resources = []
+    for payload in payloads:
+        try:
+            resource_class, instance, kwargs = unpack_notification_payload(
+                payload
+            )
+        except ObjectDoesNotExist:
+            continue
+        resources.append(resource_class(instance=instance, **kwargs))
+    if not resources:
+        return
+
+    recipients_ids = set()
+    for resource in resources:
+        recipients_ids.update(
+            resource.get_recipients().values_list('pk', flat=True)
+        )
+    recipients_ids.discard(getattr(resources[-1].instance, 'author_id', None))
+    create_and_dispatch_notification(
+        resource=resources[-1],
+        recipients=AppUser.objects.filter(pk__in=recipients_ids),
+        coalesced_count=len(resources),
+    )
+
+
+@app.task()
+def flush_coalesced_notifications():
+    """Send notifications of coalescing groups, which windows are over."""
+    for group, payloads in pop_due_notifications().items():
+        logger.info(
+            f'Flushing {len(payloads)} coalesced notifications of `{group}`'
+        )
+        if len(payloads) == 1:
+            send_notifications.delay(payloads[0])
+        else:
+            send_coalesced_notifications.delay(payloads)
+
+
+def create_and_dispatch_notification(
+    resource: BaseNotificationResource,
+    recipients: QuerySet = None,
+    **extra_payload,
+):
+    """Create notification for resource and dispatch it to recipients."""
     notification = models.Notification.objects.create(
         type=resource.notification_type,
         title=resource.title,
         content_object=resource.instance,
-        extra_payload=resource.get_notification_extra_payload(),
+        extra_payload=dict(
+            resource.get_notification_extra_payload(), **extra_payload
+        ),
     )
     dispatcher = NotificationDispatcher(
         resource=resource,
-        notification=notification
+        notification=notification,
+        recipients=recipients,
     )
     logger.info(
         f'Beginning notification sending process `{resource.runtime_tag}`'
@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock, patch
+
+from ...business.models import Matter
+from ...forums.factories import CommentFactory, FollowedPostFactory
+from ...users.models import Attorney
+from .. import tasks
+from ..models import Notification
+from ..services.coalescing import get_coalescing_group
+from ..services.payloads import pack_notification_payload
+from ..services.resources import (
+    MatterStatusUpdateNotificationResource,
+    NewBillingItemNotificationResource,
+    NewCommentNotificationResource,
+)
+
+
+class TestCoalescing:
+    """Tests for coalescing of notifications."""
+
+    def test_get_coalescing_group(self, settings, matter: Matter):
+        """Test that group contains runtime_tag and coalesced object id."""
+        settings.NOTIFICATIONS_COALESCING_WINDOWS = {'new_billing_item': 60}
+        billing_item = MagicMock(matter_id=matter.pk)
+
+        group = get_coalescing_group(
+            NewBillingItemNotificationResource, billing_item
+        )
+
+        assert group == f'new_billing_item:{matter.pk}'
+
+    def test_get_coalescing_group_without_window(
+        self, settings, matter: Matter
+    ):
+        """Test that notifications without window are not coalesced."""
+        settings.NOTIFICATIONS_COALESCING_WINDOWS = {}
+        billing_item = MagicMock(matter_id=matter.pk)
+
+        assert get_coalescing_group(
+            NewBillingItemNotificationResource, billing_item
+        ) is None
+
+    def test_get_coalescing_group_for_not_coalesced_resource(
+        self, settings, matter: Matter
+    ):
+        """Test that resources without `coalesce_by` are not coalesced."""
+        settings.NOTIFICATIONS_COALESCING_WINDOWS = {
+            'matter_status_update': 60
+        }
+
+        assert get_coalescing_group(
+            MatterStatusUpdateNotificationResource, matter
+        ) is None
+
+    @patch('apps.notifications.tasks.send_coalesced_notifications.delay')
+    @patch('apps.notifications.tasks.send_notifications.delay')
+    @patch('apps.notifications.tasks.pop_due_notifications')
+    def test_flush_coalesced_notifications(
+        self,
+        pop_due_notifications_mock: MagicMock,
+        send_notifications_mock: MagicMock,
+        send_coalesced_notifications_mock: MagicMock,
+    ):
+        """Test that only bursts are sent as digest notifications."""
+        single, first, second = {'id': 1}, {'id': 2}, {'id': 3}
+        pop_due_notifications_mock.return_value = {
+            'new_billing_item:1': [single],
+            'new_billing_item:2': [first, second],
+        }
+
+        tasks.flush_coalesced_notifications()
+
+        send_notifications_mock.assert_called_once_with(single)
+        send_coalesced_notifications_mock.assert_called_once_with(
+            [first, second]
+        )
+
+    @patch('apps.notifications.tasks.NotificationDispatcher.notify')
+    def test_send_coalesced_notifications(
+        self,
+        notify_mock: MagicMock,
+        matter: Matter,
+        attorney: Attorney,
+    ):
+        """Test that digest notification has number of notifications."""
+        payloads = [
+            pack_notification_payload(
+                MatterStatusUpdateNotificationResource,
+                matter,
+                new_status=matter.status,
+            )
+        ] * 3
+
+        tasks.send_coalesced_notifications(payloads)
+
+        notify_mock.assert_called_once()
+        notification = Notification.objects.filter(
+            object_id=matter.pk
+        ).latest('created')
+        assert notification.extra_payload['coalesced_count'] == 3
+
+    @patch('apps.notifications.tasks.create_and_dispatch_notification')
+    def test_send_coalesced_notifications_without_author(
+        self, create_and_dispatch_notification_mock: MagicMock,
+    ):
+        """Test that digest isn't sent to author of the latest comment."""
+        followed_post = FollowedPostFactory()
+        other_followed_post = FollowedPostFactory(post=followed_post.post)
+        comments = (
+            CommentFactory(
+                post=followed_post.post, author=followed_post.follower
+            ),
+            CommentFactory(
+                post=followed_post.post, author=other_followed_post.follower
+            ),
+        )
+        payloads = [
+            pack_notification_payload(NewCommentNotificationResource, comment)
+            for comment in comments
+        ]
+
+        tasks.send_coalesced_notifications(payloads)
+
+        recipients = create_and_dispatch_notification_mock.call_args[1][
+            'recipients'
+        ]
+        assert list(recipients) == [followed_post.follower]
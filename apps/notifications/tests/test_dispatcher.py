@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ...users.models import Attorney, UserStatistic
-from ..models import Notification, NotificationSetting
+from ..models import Notification, NotificationDispatch, NotificationSetting
 from ..services.dispatcher import NotificationDispatcher
 from ..services.resources import (
     BaseNotificationResource,
@@ -51,6 +51,19 @@ def dispatcher(
     return NotificationDispatcher(
         resource=resource,
         notification=notification,
+        batched=False,
+    )
+
+
+@pytest.fixture(scope='module')
+def batched_dispatcher(
+    resource: BaseNotificationResource, notification: Notification
+) -> NotificationDispatcher:
+    """Create notification dispatcher with batched fan-out for testing."""
+    return NotificationDispatcher(
+        resource=resource,
+        notification=notification,
+        batched=True,
     )
 
 
@@ -115,6 +128,22 @@ class TestDispatcher:
 
         assert dispatches.filter(recipient=attorney.user).exists()
 
+    def test_get_recipients_with_several_settings(
+        self,
+        attorney: Attorney,
+        dispatcher: NotificationDispatcher,
+        notification_setting: NotificationSetting,
+    ):
+        """Test that recipient with several settings rows isn't duplicated."""
+        notification_setting.by_email = True
+        notification_setting.save()
+        NotificationSetting.objects.create(user=attorney.user)
+
+        recipients = dispatcher.get_recipients().filter(pk=attorney.user_id)
+
+        assert recipients.count() == 1
+        assert dispatcher.get_recipients_ids().count(attorney.user_id) == 1
+
     @patch('apps.notifications.services.dispatcher.send_notification_by_email')
     @patch('apps.notifications.services.dispatcher.send_notification_by_push')
     def test_notification_dispatching(
@@ -171,3 +200,76 @@ class TestDispatcher:
 
         send_by_push_mock.assert_not_called()
         send_by_email_mock.assert_called_once()
+
+
+class TestBatchedDispatcher:
+    """Tests for `NotificationDispatcher` class in batched fan-out mode."""
+
+    @patch(
+        'apps.notifications.services.dispatcher.'
+        'send_notifications_by_email_in_batch'
+    )
+    @patch(
+        'apps.notifications.services.dispatcher.'
+        'send_notifications_by_push_in_batch'
+    )
+    def test_notification_dispatching(
+        self,
+        send_by_push_mock: MagicMock,
+        send_by_email_mock: MagicMock,
+        attorney: Attorney,
+        batched_dispatcher: NotificationDispatcher,
+        notification_setting: NotificationSetting,
+    ):
+        """Test batched dispatching with all settings turn on."""
+        notification_setting.by_email = True
+        notification_setting.by_push = True
+        notification_setting.save()
+        dispatches = batched_dispatcher.get_notification_dispatches_queryset()
+        sent_dispatches = set(dispatches.values_list('pk', flat=True))
+        send_by_email_mock.return_value = sent_dispatches
+        send_by_push_mock.return_value = sent_dispatches
+
+        batches_stats = batched_dispatcher.notify_in_batches(dispatches)
+
+        send_by_push_mock.assert_called_once()
+        send_by_email_mock.assert_called_once()
+        assert sum(
+            stats.marked_as_sent for stats in batches_stats
+        ) == len(sent_dispatches)
+        assert not dispatches.filter(
+            status=NotificationDispatch.STATUS_PREPARED
+        ).exists()
+
+    @patch(
+        'apps.notifications.services.dispatcher.'
+        'send_notifications_by_email_in_batch'
+    )
+    @patch(
+        'apps.notifications.services.dispatcher.'
+        'send_notifications_by_push_in_batch'
+    )
+    def test_notification_dispatching_with_failed_email(
+        self,
+        send_by_push_mock: MagicMock,
+        send_by_email_mock: MagicMock,
+        attorney: Attorney,
+        batched_dispatcher: NotificationDispatcher,
+        notification_setting: NotificationSetting,
+    ):
+        """Test that dispatch isn't marked as sent if email failed."""
+        notification_setting.by_email = True
+        notification_setting.by_push = True
+        notification_setting.save()
+        dispatches = batched_dispatcher.get_notification_dispatches_queryset()
+        send_by_email_mock.return_value = set()
+        send_by_push_mock.return_value = set(
+            dispatches.values_list('pk', flat=True)
+        )
+
+        batches_stats = batched_dispatcher.notify_in_batches(dispatches)
+
+        assert not sum(stats.marked_as_sent for stats in batches_stats)
+        assert not dispatches.filter(
+            status=NotificationDispatch.STATUS_SENT
+        ).exists()
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from ...business.models import Matter
+from ...users.models import Attorney
+from ..services.payloads import (
+    RESOURCES_BY_PATH,
+    pack_notification_payload,
+    unpack_notification_payload,
+)
+from ..services.resources import (
+    MatterReferredResource,
+    MatterStatusUpdateNotificationResource,
+    NewChatNotificationResource,
+    NewSingleGroupChatResource,
+)
+
+
+class TestNotificationPayloads:
+    """Tests for packing of notification task payloads."""
+
+    def test_pack_and_unpack(self, matter: Matter, attorney: Attorney):
+        """Test that packed payload is JSON and restores the same data."""
+        payload = pack_notification_payload(
+            MatterReferredResource,
+            matter,
+            notification_sender=attorney.user,
+            user=attorney.user,
+            sender=Matter,
+        )
+        payload = json.loads(json.dumps(payload))
+
+        resource_class, instance, kwargs = unpack_notification_payload(
+            payload
+        )
+
+        assert resource_class is MatterReferredResource
+        assert instance == matter
+        assert kwargs == dict(
+            notification_sender=attorney.user,
+            user=attorney.user,
+        )
+
+    def test_pack_scalars(self, matter: Matter):
+        """Test that scalar kwargs are kept as is."""
+        payload = pack_notification_payload(
+            MatterStatusUpdateNotificationResource,
+            matter,
+            new_status=matter.status,
+        )
+
+        assert payload['kwargs'] == dict(new_status=matter.status)
+
+    def test_pack_unsupported_value(self, matter: Matter):
+        """Test that values of unsupported types are not packed."""
+        with pytest.raises(TypeError):
+            pack_notification_payload(
+                MatterStatusUpdateNotificationResource,
+                matter,
+                new_status=object(),
+            )
+
+    def test_resources_with_same_runtime_tag(self, attorney: Attorney):
+        """Test that resources with the same runtime tag are distinguished."""
+        assert (
+            NewChatNotificationResource.runtime_tag
+            == NewSingleGroupChatResource.runtime_tag
+        )
+        payload = pack_notification_payload(
+            NewChatNotificationResource, attorney.user,
+        )
+
+        assert RESOURCES_BY_PATH[payload['resource']] is (
+            NewChatNotificationResource
+        )
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+
+import pytest
+
+from ...users.models import Attorney
+from ..models import NotificationSetting
+from ..services import preferences
+
+
+@pytest.fixture
+def notification_setting(attorney: Attorney) -> NotificationSetting:
+    """Get attorney's notification setting with clean cache."""
+    setting, _ = NotificationSetting.objects.get_or_create(
+        user=attorney.user
+    )
+    cache.delete(
+        preferences.PREFERENCES_CACHE_KEY.format(user_id=attorney.user_id)
+    )
+    return setting
+
+
+class TestPreferences:
+    """Tests for cached notifications preferences."""
+
+    def test_get_preferences_is_cached(
+        self,
+        attorney: Attorney,
+        notification_setting: NotificationSetting,
+        django_assert_num_queries,
+    ):
+        """Test that preferences are fetched from db only once."""
+        with django_assert_num_queries(1):
+            preferences.get_preferences([attorney.user_id])
+        with django_assert_num_queries(0):
+            user_preferences = preferences.get_preferences(
+                [attorney.user_id]
+            )
+        assert user_preferences[attorney.user_id]['by_email'] == (
+            notification_setting.by_email
+        )
+
+    def test_preferences_invalidated_on_save(
+        self,
+        attorney: Attorney,
+        notification_setting: NotificationSetting,
+    ):
+        """Test that cached preferences are invalidated on setting save."""
+        notification_setting.by_chats = True
+        notification_setting.save()
+        preferences.get_preferences([attorney.user_id])
+
+        notification_setting.by_chats = False
+        notification_setting.save()
+
+        user_preferences = preferences.get_preferences([attorney.user_id])
+        assert not user_preferences[attorney.user_id]['by_chats']
+
+    def test_get_preferences_of_latest_setting(
+        self,
+        attorney: Attorney,
+        notification_setting: NotificationSetting,
+    ):
+        """Test that preferences are taken from user's latest setting."""
+        notification_setting.by_email = True
+        notification_setting.save()
+        NotificationSetting.objects.create(user=attorney.user, by_email=False)
+
+        user_preferences = preferences.get_preferences([attorney.user_id])
+
+        assert not user_preferences[attorney.user_id]['by_email']
+
+    @pytest.mark.parametrize(
+        argnames='user_preferences, runtime_tag, is_allowed',
+        argvalues=(
+            ({'by_email': True, 'by_chats': True}, 'new_chat', True),
+            ({'by_email': True, 'by_chats': False}, 'new_chat', False),
+            ({'by_email': False, 'by_push': False}, 'new_chat', False),
+            ({'by_push': True}, 'new_user_registered', True),
+            ({}, 'new_user_registered', False),
+        )
+    )
+    def test_is_allowed_to_notify(
+        self, user_preferences: dict, runtime_tag: str, is_allowed: bool
+    ):
+        """Test checking of preferences against notification category."""
+        assert preferences.is_allowed_to_notify(
+            user_preferences, runtime_tag
+        ) == is_allowed
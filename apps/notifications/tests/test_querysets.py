@@ -96,3 +96,18 @@ class TestNotificationNotificationDispatchQuerySet:
             get_allowed_to_notify()
 
         assert dispatch not in dispatches
+
+    def test_allowed_to_notify_with_several_settings(
+        self,
+        notification_dispatch_and_setting
+    ):
+        """Test that dispatch isn't duplicated by several settings rows."""
+        dispatch, setting = notification_dispatch_and_setting
+        setting.by_email = True
+        setting.save()
+        models.NotificationSetting.objects.create(user=dispatch.recipient)
+
+        dispatches = models.NotificationDispatch.objects. \
+            get_allowed_to_notify().filter(pk=dispatch.pk)
+
+        assert dispatches.count() == 1
@@ -8,7 +8,7 @@ from apps.business.models import Lead, Matter, Opportunity
 
 from ...core.api.views import BaseViewSet, CRUDViewSet
 from ...users.api.permissions import IsAttorneyHasActiveSubscription
-from .. import models
+from .. import models, services
 from . import filters, permissions, serializers
 from .serializers import MessageAttachmentSerializer
 
@@ -36,6 +36,15 @@ class ChatViewSet(
     )
     filterset_class = filters.ChatFilter
     ordering_fields = ('created', 'single_chat_participants__is_favorite', )
+    ordering_annotations = {
+        'last_message': services.get_last_message_time_expression(),
+        'is_favorite': lambda request: services.get_is_favorite_expression(
+            request.user
+        ),
+        'chat_type': lambda request: services.get_chat_type_expression(
+            request.user
+        ),
+    }
     search_fields = ('participants__first_name', 'participants__last_name', )
     base_permissions = (
         IsAuthenticated,
@@ -56,29 +65,6 @@ class ChatViewSet(
     }
     serializer_class = serializers.ChatSerializer
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serialized_data = self.get_serializer(page, many=True).data
-        else:
-            serialized_data = self.get_serializer(queryset, many=True).data
-        ordering_fields = request.GET.getlist('ordering', [])
-        for field in ordering_fields:
-            reverse = False
-            if field.startswith('-'):
-                reverse = True
-                field = field[1:]
-            serialized_data = sorted(
-                serialized_data,
-                key=lambda k: (k[field] is not None, k[field]),
-                reverse=reverse
-            )
-        if page is not None:
-            return self.get_paginated_response(serialized_data)
-        return Response(serialized_data)
-
     def get_queryset(self):
         """Limit returned dispatches to current user."""
         qs = super().get_queryset()
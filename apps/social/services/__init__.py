@@ -1,5 +1,13 @@
+from .chats import (
+    get_chat_type_expression,
+    get_is_favorite_expression,
+    get_last_message_time_expression,
+)
 from .group_chats import add_participants_to_single_group_chat
 
 __all__ = (
     'add_participants_to_single_group_chat',
+    'get_chat_type_expression',
+    'get_is_favorite_expression',
+    'get_last_message_time_expression',
 )
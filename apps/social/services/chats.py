@@ -0,0 +1,83 @@
+from django.db.models import (
+    CharField,
+    Case,
+    Exists,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.expressions import BaseExpression
+
+from ...business.models import Lead
+from ...users.models import AppUser
+from .. import models
+
+__all__ = (
+    'get_last_message_time_expression',
+    'get_is_favorite_expression',
+    'get_chat_type_expression',
+)
+
+
+def get_last_message_time_expression() -> BaseExpression:
+    """Get expression which calculates time of chat's last message."""
+    return Subquery(
+        models.Message.objects.filter(
+            chat=OuterRef('pk')
+        ).order_by('-created').values('created')[:1]
+    )
+
+
+def get_is_favorite_expression(user: AppUser) -> BaseExpression:
+    """Get expression which shows if chat is user's favorite one."""
+    return Exists(
+        models.SingleChatParticipants.objects.filter(
+            chat=OuterRef('pk'),
+            appuser=user,
+            is_favorite=True,
+        )
+    )
+
+
+def get_chat_type_expression(user: AppUser) -> BaseExpression:
+    """Get expression which calculates type of chat for user.
+
+    Type is calculated the same way as in `ChatSerializer.get_chat_type`:
+    chat's type is defined by relation of attorney with other participants -
+    `clients`, `opportunities`, `leads` or `network`. Chats of not attorneys
+    have no type.
+
+    """
+    if not user.is_attorney:
+        return Value(None, output_field=CharField())
+
+    attorney = user.attorney
+    other_participants = models.SingleChatParticipants.objects.filter(
+        chat=OuterRef('pk')
+    ).exclude(appuser=user)
+    types = (
+        ('clients', dict(appuser__client__matters__attorney=attorney)),
+        ('clients', dict(
+            appuser__client__leads__attorney=attorney,
+            appuser__client__leads__status=Lead.STATUS_CONVERTED,
+        )),
+        ('opportunities', dict(
+            appuser__client__opportunities__attorney=attorney,
+        )),
+        ('leads', dict(
+            appuser__client__leads__attorney=attorney,
+            appuser__client__leads__status=Lead.STATUS_ACTIVE,
+        )),
+    )
+    return Case(
+        *(
+            When(
+                Exists(other_participants.filter(**lookups)),
+                then=Value(chat_type),
+            )
+            for chat_type, lookups in types
+        ),
+        default=Value('network'),
+        output_field=CharField(),
+    )
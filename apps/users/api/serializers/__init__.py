@@ -5,6 +5,7 @@ from .attorney_links import (
 )
 from .attorneys import (
     AttorneyDetailSerializer,
+    AttorneyDirectorySerializer,
     AttorneyOnboardingSerializer,
     AttorneyOverviewSerializer,
     AttorneyRegisterSerializer,
@@ -100,6 +101,7 @@ __all__ = (
     'AttorneyPeriodStatsQueryParamsSerializer',
     'AttorneyRegisterSerializer',
     'AttorneyShortSerializer',
+    'AttorneyDirectorySerializer',
     'AttorneySerializer',
     'AttorneyOverviewSerializer',
     'AttorneyCurrentStatisticsDataSerializer',
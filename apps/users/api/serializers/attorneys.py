@@ -30,7 +30,6 @@ class AttorneySerializer(AppUserRelatedSerializerMixin, BaseSerializer):
     education = AttorneyEducationSerializer(many=True, allow_empty=False)
     distance = serializers.FloatField(
         default=None,
-        source='distance.m',
         label='Distance to attorney in meters',
         read_only=True
     )
@@ -214,6 +213,43 @@ class AttorneyShortSerializer(AttorneySerializer):
         )
 
 
+class AttorneyDirectorySerializer(AttorneySerializer):
+    """Serializer for attorneys' directory cards.
+
+    Contains only fields, which are loaded with attorney, user and
+    specialities, so list of attorneys doesn't need other relations.
+
+    """
+
+    class Meta:
+        model = models.Attorney
+        fields = (
+            'id',
+            'distance',
+            'first_name',
+            'middle_name',
+            'last_name',
+            'email',
+            'phone',
+            'type',
+            'avatar',
+            'firm_name',
+            'is_verified',
+            'has_active_subscription',
+            'verification_status',
+            'featured',
+            'sponsored',
+            'sponsor_link',
+            'years_of_experience',
+            'specialities',
+            'specialities_data',
+            'fee_rate',
+            'fee_currency',
+            'fee_currency_data',
+        )
+        read_only_fields = fields
+
+
 class AttorneyOverviewSerializer(AttorneySerializer):
     """Serializes the limited attorney details for matter overview"""
 
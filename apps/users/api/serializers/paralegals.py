@@ -23,7 +23,6 @@ class ParalegalSerializer(AppUserRelatedSerializerMixin, BaseSerializer):
     education = ParalegalEducationSerializer(many=True, allow_empty=False)
     distance = serializers.FloatField(
         default=None,
-        source='distance.m',
         label='Distance to paralegal in meters',
         read_only=True
     )
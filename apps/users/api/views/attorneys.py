@@ -1,3 +1,5 @@
+from functools import partial
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
@@ -31,7 +33,6 @@ from ..filters import (
     AttorneyFilter,
     IndustryContactsSearchFilter,
     IndustryContactsTypeFilter,
-    LeadClientFilter,
     LeadClientSearchFilter,
 )
 # from ..serializers.industry_contacts import (
@@ -74,17 +75,20 @@ class AttorneyViewSet(
     serializer_class = serializers.AttorneySerializer
     serializers_map = {
         'create': serializers.AttorneyRegisterSerializer,
+        'list': serializers.AttorneyDirectorySerializer,
         'retrieve': serializers.AttorneyDetailSerializer,
         'validate_registration': serializers.AttorneyRegisterSerializer,
         'leads_and_clients': LeadAndClientSerializer,
     }
+    # Lean queryset for directory list, it loads only data of cards
     queryset = Attorney.objects.real_users().select_related(
         'user',
-        'user__client',
-        'user__owned_enterprise',
-        'user__paralegal',
         'fee_currency',
     ).prefetch_related(
+        'user__specialities',
+    )
+    # Relations of attorney's profile, which are loaded only on retrieve
+    retrieve_prefetch_related = (
         Prefetch(
             'matters', queryset=Matter.objects.order_by('-modified')
         ),
@@ -102,7 +106,6 @@ class AttorneyViewSet(
         'followers',
         'education',
         'education__university',
-        'user__specialities',
         'firm_locations',
         'firm_locations__country',
         'firm_locations__state',
@@ -141,14 +144,21 @@ class AttorneyViewSet(
     lookup_value_regex = '[0-9]+'
 
     def get_queryset(self):
-        """Add distance to qs, using data from query_params."""
+        """Add distance to qs, using data from query_params.
+
+        Relations of full profile are prefetched only for `retrieve`.
+
+        """
         qs = super().get_queryset()
+        if self.action == 'retrieve':
+            qs = qs.prefetch_related(*self.retrieve_prefetch_related)
         qp = self.request.query_params
         if qp.get('is_verified') == "true":
             return qs.verified()
         return qs.with_distance(
             longitude=qp.get('longitude'),
-            latitude=qp.get('latitude')
+            latitude=qp.get('latitude'),
+            radius=qp.get('distance__lte'),
         )
 
     def create(self, request, *args, **kwargs):
@@ -299,83 +309,39 @@ class AttorneyViewSet(
 
     @action(detail=True, methods=['GET'])
     def leads_and_clients(self, request, *args, **kwargs):
-        """Returns attorney's leads and clients."""
+        """Returns attorney's leads and clients.
+
+        Clients, leads and pending invites are searched, filtered, ordered
+        and paginated by db as one queryset.
+
+        """
         attorney = get_object_or_404(self.queryset, **kwargs)
         try:
             search_filter = LeadClientSearchFilter()
-            type_filter = LeadClientFilter()
-
-            leads_clients = Client.attorney_clients_and_leads(attorney).\
-                select_related(
-                    'user',
-                    'country',
-                    'state',
-                    'city',
-                    'city__region',
-                ).prefetch_related(
-                    Prefetch(
-                        'matters',
-                        queryset=Matter.objects.filter(attorney=attorney)
-                    ),
-                    Prefetch(
-                        'leads',
-                        queryset=Lead.objects.filter(
-                            status=Lead.STATUS_CONVERTED, attorney=attorney
-                        )
-                    ),
-                ).distinct()
-            leads_clients = search_filter.search_lead_client(
-                request, leads_clients
+            contacts = services.get_attorney_contacts(
+                attorney=attorney,
+                user=request.user,
+                search_filter=partial(
+                    search_filter.search_lead_client, request
+                ),
+                contact_type=request.query_params.get('type'),
+                ordering=request.query_params.getlist('ordering', []),
+            )
+            page = self.paginate_queryset(queryset=contacts)
+            serializer = LeadAndClientSerializer(
+                services.get_contacts_instances(
+                    page if page is not None else contacts
+                ),
+                many=True,
+                context={'request': request}
             )
-            leads_clients = type_filter.filter_type(request, leads_clients)
-
-            invites = Invite.get_pending_attorney_invites(attorney).\
-                select_related(
-                    'country',
-                    'state',
-                    'city',
-                    'city__region',
-                ).prefetch_related(
-                    'matters'
-                )
-            invites = search_filter.search_lead_client(request, invites)
-            invites = type_filter.filter_type(request, invites)
-
-            leads_and_clients = set(leads_clients) | set(invites)
-
-            page = self.paginate_queryset(queryset=list(leads_and_clients))
-            ordering_fields = request.GET.getlist('ordering', [])
-            if page is not None:
-                serializer = LeadAndClientSerializer(
-                    page,
-                    many=True,
-                    context={'request': request}
-                )
-            else:
-                serializer = LeadAndClientSerializer(
-                    leads_and_clients,
-                    many=True,
-                    context={'request': request}
-                )
-            data = serializer.data
-            for field in ordering_fields:
-                reverse = False
-                if field.startswith('-'):
-                    reverse = True
-                    field = field[1:]
-                data = sorted(
-                    data,
-                    key=lambda k: (k[field] is not None, k[field]),
-                    reverse=reverse
-                )
             if page is not None:
-                return self.get_paginated_response(data)
-            else:
-                return Response(
-                    data=data,
-                    status=status.HTTP_200_OK
-                )
-        except Exception as e:
+                return self.get_paginated_response(serializer.data)
+            return Response(
+                data=serializer.data,
+                status=status.HTTP_200_OK
+            )
+        except Exception:
             return Response(
                 status=status.HTTP_400_BAD_REQUEST,
             )
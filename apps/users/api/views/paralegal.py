@@ -87,7 +87,8 @@ class ParalegalViewSet(
         qp = self.request.query_params
         return qs.with_distance(
             longitude=qp.get('longitude'),
-            latitude=qp.get('latitude')
+            latitude=qp.get('latitude'),
+            radius=qp.get('distance__lte'),
         )
 
     def create(self, request, *args, **kwargs):
@@ -0,0 +1,38 @@
+# Generated by Django 3.0.9 on 2026-10-17 14:00
+
+from django.db import migrations, models
+
+# Bits of `AppUser.roles` by profile models
+PROFILES_ROLES = (
+    ('Attorney', 1),
+    ('Client', 2),
+    ('Support', 4),
+    ('Paralegal', 8),
+    ('Enterprise', 16),
+)
+
+
+def fill_roles(apps, schema_editor):
+    """Set roles of users by their existing profiles."""
+    AppUser = apps.get_model('users', 'AppUser')
+    for model_name, role in PROFILES_ROLES:
+        profiles = apps.get_model('users', model_name).objects.all()
+        AppUser.objects.filter(
+            pk__in=profiles.values('user_id')
+        ).update(roles=models.F('roles').bitor(role))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0079_auto_20231215_0056'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appuser',
+            name='roles',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text='Bitmask of user roles, it is kept in sync by profiles (attorney, client, support, paralegal, enterprise)', verbose_name='Roles'),
+        ),
+        migrations.RunPython(fill_roles, migrations.RunPython.noop),
+    ]
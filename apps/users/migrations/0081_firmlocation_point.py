@@ -0,0 +1,31 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+FILL_POINTS_SQL = """
+UPDATE users_firmlocation
+SET point = ST_SetSRID(
+    ST_MakePoint(cities_light_city.longitude, cities_light_city.latitude),
+    4326
+)::geography
+FROM cities_light_city
+WHERE users_firmlocation.city_id = cities_light_city.id
+    AND cities_light_city.latitude IS NOT NULL
+    AND cities_light_city.longitude IS NOT NULL
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0008_city_timezone'),
+        ('users', '0080_appuser_roles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='firmlocation',
+            name='point',
+            field=django.contrib.gis.db.models.fields.PointField(editable=False, geography=True, null=True, srid=4326, verbose_name='Coordinates'),
+        ),
+        migrations.RunSQL(FILL_POINTS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.contrib.gis.db.models import PointField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -136,6 +138,8 @@ class FirmLocation(BaseModel):
         address (str): Address
         city (str): City
         zip_codes (str): ZipCode
+        point (Point): Coordinates of location(of its city), used in
+            proximity search of attorneys and paralegals
     """
     country = models.ForeignKey(
         'cities_light.Country',
@@ -174,6 +178,14 @@ class FirmLocation(BaseModel):
         verbose_name=_('ZipCode')
     )
 
+    point = PointField(
+        geography=True,
+        srid=settings.LOCATION_SRID,
+        null=True,
+        editable=False,
+        verbose_name=_('Coordinates'),
+    )
+
     class Meta:
         verbose_name = _('FirmLocation')
         verbose_name_plural = _('FirmLocation')
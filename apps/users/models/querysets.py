@@ -1,12 +1,14 @@
 import logging
+import math
 import typing
 from datetime import datetime
 
 from django.conf import settings
-from django.contrib.gis.db.models.functions import Distance
 from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.core.cache import cache
 from django.db import models
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
 
 from ...finance.models.payments.querysets import AbstractPaidObjectQuerySet
 from .utils.verification import VerifiedRegistrationQuerySet
@@ -22,6 +24,134 @@ __all__ = (
 
 logger = logging.getLogger('django')
 
+# Approximate length (in meters) of one degree of latitude
+METERS_IN_DEGREE = 111_320
+
+PROXIMITY_CACHE_KEY = 'proximity:{model}:{longitude}:{latitude}:{radius}'
+
+
+class KNNDistance(models.Func):
+    """Distance (in meters) between geographies calculated by `<->` operator.
+
+    Unlike `Distance` function, ordering by it can use GiST index (KNN
+    search).
+
+    """
+    arg_joiner = ' <-> '
+    template = '%(expressions)s'
+
+
+class ProximityQuerySetMixin:
+    """Proximity search of users-like models by their firm locations.
+
+    Attributes:
+        firm_locations_lookup (str): lookup from `FirmLocation` to model
+
+    """
+    firm_locations_lookup: str = None
+
+    def with_distance(
+        self,
+        longitude: typing.Union[int, float, str],
+        latitude: typing.Union[int, float, str],
+        radius: typing.Union[int, float, str] = None,
+    ):
+        """Add distance (to nearest firm location) annotation to queryset.
+
+        If invalid coordinates are sent, method will annotate queryset with
+        distance = null. We can't simply return queryset(self), because we
+        later in api use `distance` to order instances.
+
+        Distance is in meters. It's calculated for each instance by
+        subquery, so ordering by it sorts annotated values and doesn't use
+        index. If `radius` (in meters) is set, queryset is prefiltered by
+        firm locations within radius using GiST index (see
+        `get_nearby_ids`), so only nearby instances are annotated, exact
+        filtering by distance is still done by `distance` annotation.
+
+        """
+        try:
+            point = Point(
+                x=float(longitude),
+                y=float(latitude),
+                srid=settings.LOCATION_SRID,
+            )
+        except (TypeError, ValueError) as error:
+            logger.info(
+                f'{self.__class__.__name__}: Incorrect cords were passed: '
+                f'`{error}`'
+            )
+            return self.annotate(
+                distance=models.Value(None, output_field=models.FloatField())
+            )
+
+        queryset = self
+        try:
+            radius = float(radius)
+        except (TypeError, ValueError):
+            radius = None
+        if radius is not None:
+            queryset = queryset.filter(
+                pk__in=self.get_nearby_ids(point, radius)
+            )
+        return queryset.annotate(distance=self.get_distance(point))
+
+    def get_distance(self, point: Point) -> Subquery:
+        """Get subquery of distance to nearest firm location of instance.
+
+        Nearest location is found among instance's locations by ordering
+        them by `<->` distance to point.
+
+        """
+        from .extra import FirmLocation
+
+        point_field = FirmLocation._meta.get_field('point')
+        nearest = FirmLocation.objects.filter(
+            point__isnull=False, **{self.firm_locations_lookup: OuterRef('pk')}
+        ).annotate(
+            distance=KNNDistance(
+                'point',
+                models.Value(point, output_field=point_field),
+                output_field=models.FloatField(),
+            )
+        ).order_by('distance').values('distance')[:1]
+        return Subquery(nearest, output_field=models.FloatField())
+
+    def get_nearby_ids(self, point: Point, radius: float) -> typing.List[int]:
+        """Get ids of instances with firm locations within radius from point.
+
+        Locations are found by `ST_DWithin` using GiST index. Point is snapped
+        to grid of `PROXIMITY_SEARCH_GRID_SIZE` and radius is increased by
+        half of cell's diagonal, so result contains all instances within
+        radius from any point of the cell and is cached for repeated searches
+        near the same place.
+
+        """
+        grid_size = settings.PROXIMITY_SEARCH_GRID_SIZE
+        snapped = Point(
+            x=round(point.x / grid_size) * grid_size,
+            y=round(point.y / grid_size) * grid_size,
+            srid=settings.LOCATION_SRID,
+        )
+        key = PROXIMITY_CACHE_KEY.format(
+            model=self.model._meta.label_lower,
+            longitude=f'{snapped.x:.6f}',
+            latitude=f'{snapped.y:.6f}',
+            radius=int(math.ceil(radius)),
+        )
+        ids = cache.get(key)
+        if ids is None:
+            margin = grid_size * METERS_IN_DEGREE * math.sqrt(2) / 2
+            ids = list(
+                self.model.objects.filter(
+                    firm_locations__point__dwithin=(
+                        snapped, D(m=math.ceil(radius) + margin)
+                    )
+                ).values_list('pk', flat=True).distinct()
+            )
+            cache.set(key, ids, settings.PROXIMITY_SEARCH_CACHE_TIMEOUT)
+        return ids
+
 
 class InviteQuerySet(models.QuerySet):
     """Queryset class for `Invite` model."""
@@ -43,6 +173,14 @@ class InviteQuerySet(models.QuerySet):
 class AppUserQuerySet(models.QuerySet):
     """Queryset class for `AppUser` model."""
 
+    def add_role(self, role: int) -> int:
+        """Set role's bit in users' `roles` by single UPDATE."""
+        return self.update(roles=models.F('roles').bitor(role))
+
+    def remove_role(self, role: int) -> int:
+        """Clear role's bit in users' `roles` by single UPDATE."""
+        return self.update(roles=models.F('roles').bitand(~role))
+
     def available_for_share(self, matter=None):
         """Get queryset of available for sharing users.
 
@@ -103,37 +241,9 @@ class AppUserQuerySet(models.QuerySet):
         return self.filter(email__iexact=email).exists()
 
 
-class AttorneyQuerySet(VerifiedRegistrationQuerySet):
+class AttorneyQuerySet(ProximityQuerySetMixin, VerifiedRegistrationQuerySet):
     """Queryset class for `Attorney` model."""
-
-    def with_distance(
-        self,
-        longitude: typing.Union[int, float, str],
-        latitude: typing.Union[int, float, str],
-    ):
-        """Add distance annotation to attorney queryset.
-
-        If invalid coordinates are sent, method will annotate queryset with
-        distance = null. We can't simply return queryset(self), because we
-        later in api use `distance` to order attorneys.
-
-        """
-        try:
-            point = Point(
-                x=float(longitude),
-                y=float(latitude),
-                srid=settings.LOCATION_SRID,
-            )
-        except (TypeError, ValueError) as error:
-            logger.info(
-                f'AttorneyQuerySet: Incorrect cords were passed: `{error}`'
-            )
-            return self.annotate(
-                distance=models.Value(None, output_field=models.FloatField())
-            )
-        return self.annotate(
-            distance=Distance('firm_location', point)
-        )
+    firm_locations_lookup = 'attorneys'
 
     def has_lead_with_user(self, user):
         """Filter attorneys that client has lead with.
@@ -172,37 +282,9 @@ class AttorneyQuerySet(VerifiedRegistrationQuerySet):
         )
 
 
-class ParalegalQuerySet(VerifiedRegistrationQuerySet):
+class ParalegalQuerySet(ProximityQuerySetMixin, VerifiedRegistrationQuerySet):
     """Queryset class for `Paralegal` model."""
-
-    def with_distance(
-        self,
-        longitude: typing.Union[int, float, str],
-        latitude: typing.Union[int, float, str],
-    ):
-        """Add distance annotation to paralegal queryset.
-
-        If invalid coordinates are sent, method will annotate queryset with
-        distance = null. We can't simply return queryset(self), because we
-        later in api use `distance` to order paralegals.
-
-        """
-        try:
-            point = Point(
-                x=float(longitude),
-                y=float(latitude),
-                srid=settings.LOCATION_SRID,
-            )
-        except (TypeError, ValueError) as error:
-            logger.info(
-                f'ParalegalQuerySet: Incorrect cords were passed: `{error}`'
-            )
-            return self.annotate(
-                distance=models.Value(None, output_field=models.FloatField())
-            )
-        return self.annotate(
-            distance=Distance('firm_location', point)
-        )
+    firm_locations_lookup = 'paralegals'
 
     def has_lead_with_user(self, user):
         """Filter paralegals that client has lead with.
@@ -83,6 +83,13 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         USER_TYPE_STAFF,
     )
 
+    # bits of user's roles, user has role if related profile exists
+    ROLE_ATTORNEY = 1
+    ROLE_CLIENT = 2
+    ROLE_SUPPORT = 4
+    ROLE_PARALEGAL = 8
+    ROLE_ENTERPRISE_ADMIN = 16
+
     uuid = models.UUIDField(
         default=uuid.uuid4,
         unique=True,
@@ -198,6 +205,16 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         default=None  # Set PST as default
     )
 
+    roles = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_('Roles'),
+        help_text=_(
+            'Bitmask of user roles, it is kept in sync by profiles '
+            '(attorney, client, support, paralegal, enterprise)'
+        ),
+    )
+
     objects = AppUserManager()
 
     # so authentication happens by email instead of username
@@ -216,6 +233,25 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
             return self.full_name
         return self.email
 
+    def save(self, *args, **kwargs):
+        """Save user without `roles`.
+
+        Roles are changed only by profiles' signals with queryset updates,
+        so stale value of loaded instance doesn't override them.
+
+        """
+        is_update = (
+            not self._state.adding and
+            not kwargs.get('force_insert') and
+            kwargs.get('update_fields') is None
+        )
+        if is_update:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'roles'
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def avatar_url(self):
         """Return the user's avatar"""
@@ -232,6 +268,10 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
             return f'{self.first_name} {self.last_name}'
         return None
 
+    def has_role(self, role: int) -> bool:
+        """Check if user has role by `roles` bitmask(without queries)."""
+        return bool(self.roles & role)
+
     @property
     def is_attorney(self):
         """Check if user is attorney or not.
@@ -239,7 +279,7 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         self.attorney is link to Attorney model defined in attorneys.py.
 
         """
-        return hasattr(self, 'attorney')
+        return self.has_role(self.ROLE_ATTORNEY)
 
     @property
     def is_client(self):
@@ -248,7 +288,7 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         self.client is link to Client model defined in clients.py.
 
         """
-        return hasattr(self, 'client')
+        return self.has_role(self.ROLE_CLIENT)
 
     @property
     def is_support(self):
@@ -257,7 +297,7 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         self.support is link to Support model defined in support.py.
 
         """
-        return hasattr(self, 'support')
+        return self.has_role(self.ROLE_SUPPORT)
 
     @property
     def is_developer(self):
@@ -275,7 +315,7 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         self.paralegal is link to Paralegal model defined in paralegal.py.
 
         """
-        return hasattr(self, 'paralegal')
+        return self.has_role(self.ROLE_PARALEGAL)
 
     @property
     def is_enterprise_admin(self):
@@ -284,33 +324,36 @@ class AppUser(BaseModel, AbstractBaseUser, PermissionsMixin):
         self.enterprise is link to Enterprise model defined in enterprise.py
 
         """
-        return hasattr(self, 'owned_enterprise') and \
-            self.owned_enterprise and \
-            self.owned_enterprise.user_id == self.pk
+        return self.has_role(self.ROLE_ENTERPRISE_ADMIN)
 
     def is_enterprise_admin_of(self, enterprise_id):
         """Check if user is enterprise admin or not
 
-        self.enterprise is link to Enterprise model defined in enterprise.py
+        self.enterprise is link to Enterprise model defined in enterprise.py,
+        primary key of enterprise is id of its admin user.
 
         """
-        return hasattr(self, 'owned_enterprise') and \
-            self.owned_enterprise and \
-            str(self.owned_enterprise.id) == enterprise_id
+        return self.is_enterprise_admin and \
+            str(self.pk) == str(enterprise_id)
 
     @property
     def user_type(self):
-        """Return user's type as str."""
+        """Return user's type as str.
+
+        Enterprise admins have attorney or paralegal profile too, type of
+        such profile takes precedence over enterprise.
+
+        """
         if self.is_client:
             return self.USER_TYPE_CLIENT
-        elif self.is_enterprise_admin:
-            return self.USER_TYPE_ENTERPRISE
         elif self.is_attorney:
             return self.USER_TYPE_ATTORNEY
         elif self.is_support:
             return self.USER_TYPE_SUPPORT
         elif self.is_paralegal:
             return self.USER_TYPE_PARALEGAL
+        elif self.is_enterprise_admin:
+            return self.USER_TYPE_ENTERPRISE
         return self.USER_TYPE_STAFF
 
     @property
@@ -409,7 +452,7 @@ class AppUserHelperMixin:
             Attorney: self.user.is_client or self.user.is_support,
             Paralegal: self.user.is_attorney or self.user.is_support,
             Enterprise: self.user.is_paralegal or self.user.is_support,
-            Client: self.user.is_enterprise_admin or self.user.is_support,
+            Client: self.user.is_support,
             Support: self.user.is_attorney or self.user.is_client,
         }
 
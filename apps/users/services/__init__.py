@@ -1,3 +1,4 @@
+from .contacts import get_attorney_contacts, get_contacts_instances
 from .statistics import (
     create_stat,
     get_attorney_period_statistic,
@@ -14,4 +15,6 @@ __all__ = (
     'get_stats_for_dashboard',
     'create_stat',
     'get_or_create_support_fee_payment',
+    'get_attorney_contacts',
+    'get_contacts_instances',
 )
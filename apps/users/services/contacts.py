@@ -0,0 +1,265 @@
+import typing
+
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
+
+from libs.api.filters import get_column_ordering
+
+from ...business.models import Lead, Matter
+from ...users import models
+
+__all__ = (
+    'CONTACTS_ORDERING_FIELDS',
+    'get_attorney_contacts',
+    'get_contacts_instances',
+)
+
+# Columns of unified contacts rows. Both parts of union are annotated with
+# them in the same order, so union's columns match
+CONTACT_COLUMNS = (
+    'contact_id',
+    'contact_sort_id',
+    'contact_is_pending',
+    'contact_first_name',
+    'contact_middle_name',
+    'contact_last_name',
+    'contact_email',
+    'contact_phone',
+    'contact_company',
+    'contact_job',
+    'contact_type',
+    'contact_matters_count',
+)
+
+# Map of `ordering` param values to contacts columns. `contact_id` contains
+# ids of clients and invites' UUIDs as text, so clients are ordered by id with
+# numeric `contact_sort_id`, which is null for invites
+CONTACTS_ORDERING_FIELDS = {
+    'id': 'contact_sort_id',
+    'is_pending': 'contact_is_pending',
+    'first_name': 'contact_first_name',
+    'middle_name': 'contact_middle_name',
+    'last_name': 'contact_last_name',
+    'email': 'contact_email',
+    'phone': 'contact_phone',
+    'company': 'contact_company',
+    'job': 'contact_job',
+    'type': 'contact_type',
+    'matters_count': 'contact_matters_count',
+}
+
+DEFAULT_CONTACTS_ORDERING = (
+    'contact_first_name', 'contact_last_name', 'contact_id'
+)
+
+CONTACT_TYPE_CLIENT = 'client'
+CONTACT_TYPE_LEAD = 'lead'
+CONTACT_TYPE_PENDING = 'pending'
+
+
+def _count_subquery(queryset: QuerySet, field: str) -> Coalesce:
+    """Get count of queryset rows grouped by `field` as subquery."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(field).annotate(
+                count=Count('pk')
+            ).values('count'),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def _text_column(field: str) -> Coalesce:
+    """Get text column, in which empty values are stored as empty strings.
+
+    Combined querysets are ordered by plain columns, so nulls are replaced
+    to go first on ascending ordering and last on descending one.
+
+    """
+    return Coalesce(F(field), Value(''), output_field=CharField())
+
+
+def _annotate_clients(
+    clients: QuerySet, attorney: models.Attorney, with_matters: bool
+) -> QuerySet:
+    """Annotate attorney's clients with contacts columns."""
+    attorney_matters = Matter.objects.filter(
+        client=OuterRef('pk'), attorney=attorney
+    )
+    converted_leads = Lead.objects.filter(
+        client=OuterRef('pk'),
+        attorney=attorney,
+        status=Lead.STATUS_CONVERTED,
+    )
+    is_client = Q(contact_has_converted_leads=True)
+    if with_matters:
+        is_client |= Q(contact_has_matters=True)
+    return clients.annotate(
+        contact_has_matters=Exists(attorney_matters),
+        contact_has_converted_leads=Exists(converted_leads),
+    ).annotate(
+        contact_id=Cast('pk', output_field=CharField()),
+        contact_sort_id=F('pk'),
+        contact_is_pending=Value(False, output_field=BooleanField()),
+        contact_first_name=_text_column('user__first_name'),
+        contact_middle_name=_text_column('user__middle_name'),
+        contact_last_name=_text_column('user__last_name'),
+        contact_email=_text_column('user__email'),
+        contact_phone=_text_column('user__phone'),
+        contact_company=_text_column('organization_name'),
+        contact_job=_text_column('job'),
+        contact_type=Case(
+            When(
+                is_client,
+                then=Value(CONTACT_TYPE_CLIENT, output_field=CharField()),
+            ),
+            default=Value(CONTACT_TYPE_LEAD, output_field=CharField()),
+            output_field=CharField(),
+        ),
+        contact_matters_count=_count_subquery(attorney_matters, 'client'),
+    )
+
+
+def _annotate_invites(invites: QuerySet) -> QuerySet:
+    """Annotate pending invites with contacts columns."""
+    return invites.annotate(
+        contact_id=Cast('pk', output_field=CharField()),
+        contact_sort_id=Value(None, output_field=IntegerField()),
+        contact_is_pending=Value(True, output_field=BooleanField()),
+        contact_first_name=_text_column('first_name'),
+        contact_middle_name=_text_column('middle_name'),
+        contact_last_name=_text_column('last_name'),
+        contact_email=_text_column('email'),
+        contact_phone=_text_column('phone'),
+        contact_company=_text_column('organization_name'),
+        contact_job=_text_column('role'),
+        contact_type=F('client_type'),
+        contact_matters_count=_count_subquery(
+            Matter.objects.filter(invite=OuterRef('pk')), 'invite'
+        ),
+    )
+
+
+def get_attorney_contacts(
+    attorney: models.Attorney,
+    user: models.AppUser,
+    search_filter: typing.Callable[[QuerySet], QuerySet] = None,
+    contact_type: str = None,
+    ordering: typing.Sequence[str] = (),
+) -> QuerySet:
+    """Get attorney's clients, leads and pending invites as one queryset.
+
+    Clients and invites are combined by SQL UNION into rows with
+    `CONTACT_COLUMNS`, so filtering, ordering and pagination are done by db.
+    Use `get_contacts_instances` to get instances for rows.
+
+    Arguments:
+        attorney: attorney whose contacts are returned
+        user: user who requests contacts(clients with matters are considered
+            as clients only for attorneys)
+        search_filter: function to filter clients and invites querysets
+        contact_type: `client`, `lead` or `pending`
+        ordering: `ordering` params(like `-first_name`), unknown fields are
+            ignored
+
+    """
+    clients = _annotate_clients(
+        models.Client.attorney_clients_and_leads(attorney),
+        attorney=attorney,
+        with_matters=user.is_attorney,
+    )
+    invites = _annotate_invites(
+        models.Invite.get_pending_attorney_invites(attorney)
+    )
+    if search_filter:
+        clients = search_filter(clients)
+        invites = search_filter(invites)
+
+    if contact_type == CONTACT_TYPE_PENDING:
+        clients = clients.none()
+    elif contact_type in (CONTACT_TYPE_CLIENT, CONTACT_TYPE_LEAD):
+        clients = clients.filter(contact_type=contact_type)
+        invites = invites.filter(client_type=contact_type)
+
+    contacts = clients.values(*CONTACT_COLUMNS).union(
+        invites.values(*CONTACT_COLUMNS)
+    )
+    return contacts.order_by(*get_contacts_ordering(ordering))
+
+
+def get_contacts_ordering(ordering: typing.Sequence[str]) -> list:
+    """Convert `ordering` params to ordering by contacts columns.
+
+    Text columns don't contain nulls, so empty values go first on ascending
+    ordering and last on descending.
+
+    """
+    order_by = []
+    for field in ordering:
+        column = CONTACTS_ORDERING_FIELDS.get(field.lstrip('-'))
+        if column:
+            order_by.append(get_column_ordering(field, column))
+    order_by.extend(DEFAULT_CONTACTS_ORDERING)
+    return order_by
+
+
+def get_contacts_instances(contacts: typing.Iterable[dict]) -> list:
+    """Get `Client` and `Invite` instances for contacts rows.
+
+    Instances are returned in the same order as rows and have
+    `contact_type` and `contact_matters_count` attributes set from rows.
+
+    """
+    contacts = list(contacts)
+    clients_ids = [
+        contact['contact_id'] for contact in contacts
+        if not contact['contact_is_pending']
+    ]
+    invites_ids = [
+        contact['contact_id'] for contact in contacts
+        if contact['contact_is_pending']
+    ]
+    clients = models.Client.objects.filter(
+        pk__in=clients_ids
+    ).select_related(
+        'user',
+        'country',
+        'state',
+        'city',
+        'city__region',
+    )
+    invites = models.Invite.objects.filter(
+        pk__in=invites_ids
+    ).select_related(
+        'country',
+        'state',
+        'city',
+        'city__region',
+    )
+    instances = {str(client.pk): client for client in clients}
+    instances.update({str(invite.pk): invite for invite in invites})
+
+    result = []
+    for contact in contacts:
+        instance = instances.get(contact['contact_id'])
+        if instance is None:
+            continue
+        instance.contact_type = contact['contact_type']
+        instance.contact_matters_count = contact['contact_matters_count']
+        result.append(instance)
+    return result
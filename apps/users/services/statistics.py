@@ -1,7 +1,9 @@
 from datetime import datetime
 from functools import partial
 
-import arrow
+from django.db.models import Sum
+
+from libs.time_series import get_cached_time_series, get_time_series
 
 from ...business import services as business_services
 from ...documents import services as documents_services
@@ -87,31 +89,37 @@ def get_stats_for_time_period_by_tag(
     tag: str,
     time_frame: str = 'month',
 ) -> dict:
-    """Get user stats by tag for time period divided by time frame."""
-    stats = []
-    total_sum = 0
-    start = arrow.get(start)
-    end = arrow.get(end)
-    for range_date in list(arrow.Arrow.range(time_frame, start, end)):
-        # Calculate amount of matters for period of time
-        count = models.UserStatistic.objects.stats_count_for_tag(
-            user=user,
-            start_date=range_date.floor(time_frame).datetime,
-            end_date=range_date.ceil(time_frame).datetime,
-            tag=tag
-        )
-        total_sum += count
-        stats.append(
-            {
-                'date': range_date.datetime,
-                'count': count
-            },
+    """Get user stats by tag for time period divided by time frame.
+
+    Stats of all time frames are calculated by single query and cached.
+
+    """
+    def calculate():
+        time_series = get_time_series(
+            queryset=models.UserStatistic.objects.filter(user=user, tag=tag),
+            date_field='created',
+            aggregate=Sum('count'),
+            start=start,
+            end=end,
+            time_frame=time_frame,
         )
+        stats = [
+            {'date': point.date, 'count': point.value}
+            for point in time_series
+        ]
+        return {
+            'total_sum': sum(stat['count'] for stat in stats),
+            'stats': stats,
+        }
 
-    return {
-        'total_sum': total_sum,
-        'stats': stats,
-    }
+    return get_cached_time_series(
+        name=f'stats:{tag}',
+        user_id=user.pk,
+        start=start,
+        end=end,
+        time_frame=time_frame,
+        calculate=calculate,
+    )
 
 
 def create_stat(user, tag: str, count: int = 1) -> models.UserStatistic:
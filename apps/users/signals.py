@@ -2,9 +2,13 @@ import os
 import typing
 from typing import Union
 
+from django.conf import settings
+from django.contrib.gis.geos import Point
 from django.db.models import signals
 from django.dispatch import Signal, receiver
 
+from libs.time_series import invalidate_cached_time_series
+
 from ..business.models import Stage
 from ..documents.models import Folder
 from ..notifications.models import NotificationSetting
@@ -51,6 +55,57 @@ new_user_registered.__doc__ = (
 )
 
 
+# Roles of users, which are set by profiles
+PROFILES_ROLES = {
+    models.Attorney: models.AppUser.ROLE_ATTORNEY,
+    models.Client: models.AppUser.ROLE_CLIENT,
+    models.Support: models.AppUser.ROLE_SUPPORT,
+    models.Paralegal: models.AppUser.ROLE_PARALEGAL,
+    models.Enterprise: models.AppUser.ROLE_ENTERPRISE_ADMIN,
+}
+
+
+def _set_cached_user_role(instance, role: int, has_role: bool):
+    """Update `roles` of profile's user, if it's already loaded."""
+    user = instance._state.fields_cache.get('user')
+    if user is None:
+        return
+    if has_role:
+        user.roles |= role
+    else:
+        user.roles &= ~role
+
+
+@receiver(signals.post_save, sender=models.Attorney)
+@receiver(signals.post_save, sender=models.Client)
+@receiver(signals.post_save, sender=models.Support)
+@receiver(signals.post_save, sender=models.Paralegal)
+@receiver(signals.post_save, sender=models.Enterprise)
+def add_user_role(instance, created: bool, **kwargs):
+    """Add role of new profile to its user.
+
+    This receiver is registered first, so other receivers see user's role.
+
+    """
+    if not created:
+        return
+    role = PROFILES_ROLES[type(instance)]
+    models.AppUser.objects.filter(pk=instance.user_id).add_role(role)
+    _set_cached_user_role(instance, role, has_role=True)
+
+
+@receiver(signals.post_delete, sender=models.Attorney)
+@receiver(signals.post_delete, sender=models.Client)
+@receiver(signals.post_delete, sender=models.Support)
+@receiver(signals.post_delete, sender=models.Paralegal)
+@receiver(signals.post_delete, sender=models.Enterprise)
+def remove_user_role(instance, **kwargs):
+    """Remove role of deleted profile from its user."""
+    role = PROFILES_ROLES[type(instance)]
+    models.AppUser.objects.filter(pk=instance.user_id).remove_role(role)
+    _set_cached_user_role(instance, role, has_role=False)
+
+
 @receiver(signals.post_save, sender=models.Attorney)
 @receiver(signals.post_save, sender=models.Paralegal)
 @receiver(signals.post_save, sender=models.Enterprise)
@@ -152,6 +207,13 @@ def new_opportunities_statistics(
     )
 
 
+@receiver(signals.post_save, sender=models.UserStatistic)
+@receiver(signals.post_delete, sender=models.UserStatistic)
+def invalidate_user_statistics(instance: models.UserStatistic, **kwargs):
+    """Drop cached period statistics of user when they are changed."""
+    invalidate_cached_time_series(instance.user_id)
+
+
 @receiver(signals.post_save, sender=models.Attorney)
 @receiver(signals.post_save, sender=models.Paralegal)
 @receiver(signals.post_save, sender=models.Support)
@@ -210,3 +272,21 @@ def enable_new_contact_notifications(
                 instance=instance,
                 receiver_pks=kwargs.get('pk_set')
             )
+
+
+@receiver(signals.pre_save, sender=models.FirmLocation)
+def set_firm_location_point(instance: models.FirmLocation, **kwargs):
+    """Set coordinates of firm location from its city.
+
+    They are used by proximity search of attorneys and paralegals.
+
+    """
+    city = instance.city if instance.city_id else None
+    if city is None or city.latitude is None or city.longitude is None:
+        instance.point = None
+        return
+    instance.point = Point(
+        x=float(city.longitude),
+        y=float(city.latitude),
+        srid=settings.LOCATION_SRID,
+    )
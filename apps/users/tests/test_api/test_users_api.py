@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 
 from rest_framework.test import APIClient
@@ -7,7 +9,7 @@ import pytest
 from libs.testing.constants import FORBIDDEN, NO_CONTENT, OK, UNAUTHORIZED
 
 from ...factories import AttorneyVerifiedFactory
-from ...models import AppUser, Attorney
+from ...models import AppUser, Attorney, Client
 
 
 def get_list_url(api_name: str):
@@ -211,3 +213,23 @@ class TestAttorneyAPI:
         # Check that client has unfollowed attorney
         if user and user.is_client:
             assert follow_attorney not in user.followed_attorneys.all()
+
+
+class TestAttorneysDirectory:
+    """Test list of attorneys."""
+
+    def get_list_queries_count(self, api_client: APIClient) -> int:
+        """Get number of queries made by attorneys list request."""
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(get_list_url('attorney_api'))
+        assert response.status_code == OK
+        return len(queries)
+
+    def test_list_queries_count(self, api_client: APIClient, client: Client):
+        """Check that number of queries doesn't depend on attorneys count."""
+        api_client.force_authenticate(user=client.user)
+        AttorneyVerifiedFactory.create_batch(size=2)
+        queries_count = self.get_list_queries_count(api_client)
+
+        AttorneyVerifiedFactory.create_batch(size=5)
+        assert self.get_list_queries_count(api_client) == queries_count
@@ -16,7 +16,14 @@ from ..factories import (
     SupportFactory,
     SupportVerifiedFactory,
 )
-from ..models import AppUser, Attorney, Client, Invite, Support
+from ..models import (
+    AppUser,
+    Attorney,
+    Client,
+    Enterprise,
+    Invite,
+    Support,
+)
 from ..models.clients import AbstractClient
 
 
@@ -298,6 +305,39 @@ class TestAppUser:
         assert support.user.user_type == 'support'
         assert staff.user_type == 'staff'
 
+    def test_roles_are_synced_with_profiles(
+        self, django_assert_num_queries
+    ):
+        """Test that roles are read from user's row without queries."""
+        client = ClientFactory()
+        user = AppUser.objects.get(pk=client.pk)
+
+        with django_assert_num_queries(0):
+            assert user.is_client
+            assert not user.is_attorney
+            assert user.user_type == AppUser.USER_TYPE_CLIENT
+
+        client.delete()
+        user.refresh_from_db()
+        assert not user.is_client
+        assert user.user_type == AppUser.USER_TYPE_STAFF
+
+    def test_attorney_enterprise_admin_roles(self):
+        """Test roles of attorney, who is admin of enterprise."""
+        attorney = AttorneyFactory()
+        other_attorney = AttorneyFactory()
+        Enterprise.objects.create(user=attorney.user, role='Attorney')
+        user = AppUser.objects.get(pk=attorney.pk)
+
+        assert user.is_attorney
+        assert user.is_enterprise_admin
+        assert user.user_type == AppUser.USER_TYPE_ATTORNEY
+        assert user.is_enterprise_admin_of(str(user.pk))
+        assert not user.is_enterprise_admin_of(str(other_attorney.pk))
+        assert not other_attorney.user.is_enterprise_admin_of(
+            str(other_attorney.pk)
+        )
+
     def test_is_developer(self, staff: AppUser):
         """Test `is_developer` method"""
         assert not staff.is_developer
@@ -174,14 +174,42 @@ class TestAttorneyQuerySet:
         argvalues=valid_cords,
     )
     def test_with_distance_method_valid_cords(self, longitude, latitude):
-        """Test `with_distance` with valid coordinates."""
-        attorneys = models.Attorney.objects.with_distance(
+        """Test `with_distance` with valid coordinates.
+
+        Distance is calculated for attorneys with located firm locations.
+
+        """
+        attorneys = models.Attorney.objects.filter(
+            firm_locations__point__isnull=False
+        ).with_distance(
             longitude=longitude,
             latitude=latitude
         )
 
         assert not attorneys.filter(distance__isnull=True).exists()
 
+    def test_with_distance_method_radius(self):
+        """Test `with_distance` filters attorneys within radius."""
+        near, far = factories.AttorneyVerifiedFactory.create_batch(size=2)
+        for attorney, longitude in ((near, 30.0), (far, 31.0)):
+            location = models.FirmLocation.objects.create(
+                address='Test', zip_code='00000'
+            )
+            models.FirmLocation.objects.filter(pk=location.pk).update(
+                point=Point(longitude, 50.0, srid=4326)
+            )
+            attorney.firm_locations.add(location)
+
+        attorneys = models.Attorney.objects.with_distance(
+            longitude=30.001,
+            latitude=50.0,
+            radius=1000,
+        )
+
+        assert near in attorneys
+        assert far not in attorneys
+        assert attorneys.get(pk=near.pk).distance < 1000
+
     @pytest.mark.parametrize(
         argnames='longitude, latitude',
         argvalues=invalid_cords,
@@ -1,3 +1,4 @@
+import arrow
 import pytest
 from constance import config
 
@@ -22,3 +23,112 @@ def test_get_or_create_support_fee_payment():
     assert payment.recipient_id is None
     assert payment.payer_id == support.pk
     assert payment.application_fee_amount == 0.0
+
+
+def test_get_attorney_contacts():
+    """Test that clients, leads and pending invites are listed together."""
+    from ...business.factories import LeadFactory, MatterFactory
+
+    attorney = factories.AttorneyVerifiedFactory()
+    matter = MatterFactory(attorney=attorney)
+    lead = LeadFactory(attorney=attorney)
+    invite = factories.InviteFactory(
+        inviter=attorney.user,
+        user_type=models.Invite.USER_TYPE_CLIENT,
+        client_type=models.Invite.CLIENT_TYPE_LEAD,
+    )
+
+    contacts = services.get_attorney_contacts(
+        attorney=attorney, user=attorney.user, ordering=['-is_pending']
+    )
+    instances = services.get_contacts_instances(contacts)
+
+    assert instances[0] == invite
+    assert set(instances[1:]) == {matter.client, lead.client}
+    types = {
+        instance.pk: instance.contact_type for instance in instances
+    }
+    assert types[matter.client.pk] == 'client'
+    assert types[lead.client.pk] == 'lead'
+
+    pending = services.get_attorney_contacts(
+        attorney=attorney, user=attorney.user, contact_type='pending'
+    )
+    assert [contact['contact_id'] for contact in pending] == [
+        str(invite.pk)
+    ]
+
+
+def test_get_attorney_contacts_ordering():
+    """Test that contacts are ordered by nullable columns in db."""
+    attorney = factories.AttorneyVerifiedFactory()
+    invites = [
+        factories.InviteFactory(
+            inviter=attorney.user,
+            user_type=models.Invite.USER_TYPE_CLIENT,
+            client_type=models.Invite.CLIENT_TYPE_LEAD,
+            middle_name=middle_name,
+        )
+        for middle_name in ('B', None, 'A')
+    ]
+
+    ascending = services.get_attorney_contacts(
+        attorney=attorney, user=attorney.user, ordering=['middle_name']
+    )
+    descending = services.get_attorney_contacts(
+        attorney=attorney, user=attorney.user, ordering=['-middle_name']
+    )
+
+    expected = [str(invites[index].pk) for index in (1, 2, 0)]
+    assert [contact['contact_id'] for contact in ascending] == expected
+    assert [contact['contact_id'] for contact in descending] == (
+        expected[::-1]
+    )
+
+
+def test_get_attorney_contacts_ordering_by_id():
+    """Test that clients are ordered by numeric id before invites."""
+    from ...business.factories import LeadFactory
+
+    attorney = factories.AttorneyVerifiedFactory()
+    leads = [
+        LeadFactory(attorney=attorney, client__user__id=user_id)
+        for user_id in (1000000, 999999)
+    ]
+    invite = factories.InviteFactory(
+        inviter=attorney.user,
+        user_type=models.Invite.USER_TYPE_CLIENT,
+        client_type=models.Invite.CLIENT_TYPE_LEAD,
+    )
+
+    contacts = services.get_attorney_contacts(
+        attorney=attorney, user=attorney.user, ordering=['id']
+    )
+
+    assert [contact['contact_id'] for contact in contacts] == [
+        str(leads[1].client_id), str(leads[0].client_id), str(invite.pk)
+    ]
+
+
+def test_get_stats_for_time_period_by_tag():
+    """Test that stats are bucketed by time frame with empty buckets."""
+    attorney = factories.AttorneyVerifiedFactory()
+    tag = models.UserStatistic.TAG_ACTIVE_LEAD
+    end = arrow.utcnow().floor('day')
+    start = end.shift(days=-2)
+    old_stat = services.create_stat(attorney.user, tag, count=3)
+    models.UserStatistic.objects.filter(pk=old_stat.pk).update(
+        created=start.shift(hours=1).datetime
+    )
+    services.create_stat(attorney.user, tag, count=2)
+
+    stats = services.get_stats_for_time_period_by_tag(
+        user=attorney.user,
+        start=start.datetime,
+        end=end.datetime,
+        tag=tag,
+        time_frame='day',
+    )
+
+    assert stats['total_sum'] == 5
+    assert [stat['count'] for stat in stats['stats']] == [3, 0, 2]
@@ -1,30 +1,124 @@
+import functools
+
 from django.conf import settings
+from django.utils.module_loading import import_string
 
 from web3 import Web3
+from web3.providers import BaseProvider
+
+__all__ = (
+    'RecordWriter',
+    'LocalStubProvider',
+    'get_record_writer',
+    'create_new_record',
+)
 
 abi = '[{"inputs":[],"stateMutability":"nonpayable","type":"constructor"},{"inputs":[{"internalType":"uint256","name":"recordId","type":"uint256"}],"name":"getRecord","outputs":[{"components":[{"internalType":"string","name":"id","type":"string"},{"internalType":"enum RecordContract.RecordKind","name":"kind","type":"uint8"},{"internalType":"uint256","name":"signedAt","type":"uint256"}],"internalType":"struct RecordContract.Record","name":"record","type":"tuple"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"getRecords","outputs":[{"components":[{"internalType":"string","name":"id","type":"string"},{"internalType":"enum RecordContract.RecordKind","name":"kind","type":"uint8"},{"internalType":"uint256","name":"signedAt","type":"uint256"}],"internalType":"struct RecordContract.Record[]","name":"_records","type":"tuple[]"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"getRecordsSize","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"string","name":"id","type":"string"},{"internalType":"enum RecordContract.RecordKind","name":"kind","type":"uint8"}],"name":"newRecord","outputs":[{"internalType":"uint256","name":"recordId","type":"uint256"}],"stateMutability":"nonpayable","type":"function"}]'  # noqa: E501
 
 
-def create_new_record(id, kind):
+class LocalStubProvider(BaseProvider):
+    """Provider, which answers requests of `RecordWriter` without network.
+
+    It's used in tests and local development instead of ethereum node,
+    transactions are accepted and their hashes are returned, but they are
+    not stored anywhere.
+
+    """
+    responses = {
+        'eth_chainId': '0x1',
+        'eth_getTransactionCount': '0x0',
+        'eth_estimateGas': '0x5208',
+        'eth_gasPrice': '0x1',
+        'eth_maxPriorityFeePerGas': '0x1',
+        'eth_getBlockByNumber': {'number': '0x1', 'baseFeePerGas': '0x1'},
+    }
+
+    def make_request(self, method, params):
+        """Get response for RPC request."""
+        if method == 'eth_sendRawTransaction':
+            result = Web3.keccak(hexstr=params[0]).hex()
+        else:
+            result = self.responses[method]
+        return {'jsonrpc': '2.0', 'id': 0, 'result': result}
+
+    def isConnected(self):
+        """Stub is always connected."""
+        return True
+
+
+def get_provider() -> BaseProvider:
+    """Get provider of ethereum node.
+
+    Provider's class can be set by `ETH_PROVIDER` setting, otherwise http
+    provider of infura's project is used.
+
+    """
+    if settings.ETH_PROVIDER:
+        return import_string(settings.ETH_PROVIDER)()
     infura_url = 'https://{}.infura.io/v3/{}'.format(
         settings.ETH_NETWORK_NAME, settings.WEB3_INFURA_PROJECT_ID)
+    return Web3.HTTPProvider(
+        infura_url,
+        request_kwargs={'timeout': settings.ETH_REQUEST_TIMEOUT},
+    )
+
+
+class RecordWriter:
+    """Writer of records to record contract.
+
+    Connection to node(and its http session), contract and account are
+    created once, and account's nonce is tracked locally: it's fetched once
+    (including pending transactions) and incremented after each sent
+    transaction, so records sent in row don't reuse nonce of pending ones.
+    After failure nonce is fetched again, since it could be out of sync.
+
+    Writer isn't thread safe, records are expected to be sent by single
+    worker (see `send_contract_records` task).
+
+    """
 
-    w3 = Web3(Web3.HTTPProvider(infura_url))
+    def __init__(self, provider: BaseProvider = None):
+        self.w3 = Web3(provider or get_provider())
+        self.contract = self.w3.eth.contract(
+            address=settings.ETH_CONTRACT_ADDRESS, abi=abi
+        )
+        self.account = self.w3.eth.account.from_key(settings.ETH_PRIVATE_KEY)
+        self.nonce = None
 
-    contract = w3.eth.contract(address=settings.ETH_CONTRACT_ADDRESS, abi=abi)
+    def get_nonce(self) -> int:
+        """Get nonce for next transaction of account."""
+        if self.nonce is None:
+            self.nonce = self.w3.eth.get_transaction_count(
+                self.account.address, 'pending'
+            )
+        return self.nonce
 
-    account = w3.eth.account.from_key(settings.ETH_PRIVATE_KEY)
+    def write(self, id, kind) -> str:
+        """Send transaction with new record and return its hash."""
+        try:
+            transaction = self.contract.functions.newRecord(
+                str(id), int(kind)
+            ).buildTransaction({
+                'from': self.account.address,
+                'nonce': self.get_nonce(),
+            })
+            signed_transaction = self.account.sign_transaction(transaction)
+            self.w3.eth.send_raw_transaction(
+                signed_transaction.rawTransaction
+            )
+        except Exception:
+            self.nonce = None
+            raise
+        self.nonce += 1
+        return signed_transaction.hash.hex()
 
-    transaction = contract.functions.newRecord(
-        str(id), int(kind)
-    ).buildTransaction({
-        'from': account.address,
-        'nonce': w3.eth.getTransactionCount(account.address)
-    })
 
-    signed_transaction = w3.eth.account.signTransaction(
-        transaction, private_key=settings.ETH_PRIVATE_KEY)
+@functools.lru_cache(maxsize=None)
+def get_record_writer() -> RecordWriter:
+    """Get record writer of current process."""
+    return RecordWriter()
 
-    w3.eth.send_raw_transaction(signed_transaction.rawTransaction)
 
-    return signed_transaction.hash.hex()
+def create_new_record(id, kind) -> str:
+    """Write new record to record contract and return transaction's hash."""
+    return get_record_writer().write(id, kind)
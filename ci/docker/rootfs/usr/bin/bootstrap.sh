@@ -26,6 +26,7 @@ case $APP_ENV in
         ### Starting supervisord services
         echo "Starting Celery worker..."
         supervisorctl start celery_worker
+        supervisorctl start celery_blockchain_worker
 
         echo "Starting Celery beat..."
         supervisorctl start celery_beat
@@ -42,6 +43,7 @@ case $APP_ENV in
                 ### Starting supervisord services
                 echo "Starting Celery worker..."
                 supervisorctl start celery_worker
+                supervisorctl start celery_blockchain_worker
 
                 echo "Starting Celery beat..."
                 supervisorctl start celery_beat
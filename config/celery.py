@@ -31,11 +31,26 @@ app.conf.beat_schedule = {
         # execute every 1st day of month
         'schedule': crontab(minute=0, hour=0, day_of_month=1),
     },
+    'Reconcile invoices totals': {
+        'task': 'apps.business.tasks.reconcile_invoices_totals',
+        # execute every day
+        'schedule': crontab(minute=30, hour=0),
+    },
     'Clean old envelopes': {
         'task': 'apps.esign.tasks.clean_old_envelopes',
         # execute every day
         'schedule': crontab(minute=0, hour=0),
     },
+    'Flush coalesced notifications': {
+        'task': 'apps.notifications.tasks.flush_coalesced_notifications',
+        # execute every minute
+        'schedule': crontab(),
+    },
+    'Send contract records': {
+        'task': 'apps.documents.tasks.send_contract_records',
+        # execute every minute to retry failed records
+        'schedule': crontab(),
+    },
     'Cancel failed payments': {
         'task': 'apps.finance.tasks.cancel_failed_payments',
         # execute every day
@@ -5,6 +5,7 @@
 from .admin import *
 from .allauth import *
 from .authentication import *
+from .blockchain import *
 from .business_logic import *
 from .cacheops import *
 from .celery import *
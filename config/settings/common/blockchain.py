@@ -0,0 +1,14 @@
+# Blockchain records of documents
+# Import path of web3 provider's class, if it isn't set, http provider of
+# infura's project is used
+ETH_PROVIDER = None
+# Timeout(in seconds) of requests to ethereum node
+ETH_REQUEST_TIMEOUT = 30
+# Max number of records sent in one transaction of outbox processing
+ETH_RECORDS_BATCH_SIZE = 20
+# Max number of attempts to send record, after them record is marked as failed
+ETH_RECORDS_MAX_ATTEMPTS = 10
+# Delay(in seconds) after first failed attempt, it's doubled after each one
+ETH_RECORDS_RETRY_DELAY = 30
+# Max delay(in seconds) between attempts
+ETH_RECORDS_MAX_RETRY_DELAY = 60 * 60
@@ -1 +1,36 @@
 # This file holds settings specific to the project
+
+# Time (in seconds) for which attorneys' period statistics (time series) are
+# cached, cache is also invalidated when statistics change
+TIME_SERIES_CACHE_TIMEOUT = 60 * 15
+
+# Time (in seconds) for which counters of clients' matters on client overview
+# (due amount, unread messages and documents) are cached, cache is also
+# invalidated on new comments, documents and payments
+CLIENT_OVERVIEW_CACHE_TIMEOUT = 60 * 15
+
+# Timers of time entries
+# Alias of redis cache, which keeps states of users' timers
+TIMERS_REDIS_ALIAS = 'default'
+# Time (in seconds) for which timer's state is kept in redis after its last
+# change, expired states are recalculated from time entries
+TIMERS_STATE_TIMEOUT = 60 * 60 * 24
+
+# Number of matters, for which monthly invoices are generated by one batch
+INVOICES_GENERATION_BATCH_SIZE = 500
+
+# Forums' full-text search
+# Number of posts/topics, which search vectors are filled by one query
+FORUMS_SEARCH_VECTORS_BATCH_SIZE = 1000
+# Time (in seconds) for which compiled search queries of attorneys' keywords
+# are cached
+FORUMS_KEYWORDS_QUERY_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Folders duplication
+# Max number of resources(folders and documents) in duplicated folder, which
+# are copied right in request, bigger folders are copied by celery task
+DOCUMENTS_COPY_SYNC_LIMIT = 1000
+# Number of resources created by one query on copying
+DOCUMENTS_COPY_BATCH_SIZE = 500
+# Time (in seconds) for which progress of copying is kept
+DOCUMENTS_COPY_PROGRESS_TIMEOUT = 60 * 60 * 24
@@ -14,3 +14,10 @@ CELERY_TASK_ALWAYS_EAGER = False
 CELERY_IMPORTS = (
     'libs.django_cities_light.tasks',
 )
+
+# Blockchain records are sent by dedicated worker with single process
+# (`celery worker -Q blockchain -c 1`), so nonce of account is tracked by one
+# writer
+CELERY_TASK_ROUTES = {
+    'apps.documents.tasks.send_contract_records': {'queue': 'blockchain'},
+}
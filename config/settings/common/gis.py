@@ -1,3 +1,11 @@
 # Settings for GeoDjango
 
 LOCATION_SRID = 4326
+
+# Proximity search of attorneys and paralegals
+# Size (in degrees) of grid cell, to which searched coordinates are snapped to
+# cache prefiltered results of repeated searches near the same place
+PROXIMITY_SEARCH_GRID_SIZE = 0.01
+# Time (in seconds) for which prefiltered results of proximity search are
+# cached
+PROXIMITY_SEARCH_CACHE_TIMEOUT = 60 * 5
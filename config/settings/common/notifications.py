@@ -1,3 +1,27 @@
 EMAIL_BACKEND = 'djcelery_email.backends.CeleryEmailBackend'
 CELERY_EMAIL_BACKEND = 'sgbackend.SendGridBackend'
 DEFAULT_FROM_EMAIL = 'JusLaw <no-reply@juslaw.com>'
+
+# Notifications dispatching
+# If enabled, notification dispatches are sent in batches: recipients' devices
+# are prefetched once per batch, emails are sent through one backend
+# connection and dispatches are marked as sent with one update query
+NOTIFICATIONS_BATCHED_FAN_OUT = True
+# Number of notification dispatches processed in one batch
+NOTIFICATIONS_BATCH_SIZE = 100
+# Max number of registration ids in one FCM multicast request
+NOTIFICATIONS_FCM_MULTICAST_SIZE = 500
+# How long users' notifications preferences are kept in cache (they are
+# invalidated on `NotificationSetting` change)
+NOTIFICATIONS_PREFERENCES_CACHE_TIMEOUT = 60 * 60 * 24
+# Coalescing windows(in seconds) of notifications by runtime_tag. Bursts of
+# such notifications(for the same object, like comments in one post) are
+# buffered in redis and sent as one digest notification after window is over
+NOTIFICATIONS_COALESCING_WINDOWS = {
+    'new_post': 5 * 60,
+    'new_message': 2 * 60,
+    'new_billing_item': 10 * 60,
+    'document_uploaded_to_matter': 10 * 60,
+}
+# Alias of redis cache, which is used to buffer coalesced notifications
+NOTIFICATIONS_COALESCING_REDIS_ALIAS = 'default'
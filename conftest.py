@@ -22,6 +22,8 @@ def pytest_sessionstart():
     Disable stripe.
     Disable firebase.
     Disable fcm notifications.
+    Disable notifications coalescing.
+    Send blockchain records to local stub provider.
     Reset docusign settings.
 
     We set up settings, since important settings that we would set up in
@@ -44,6 +46,10 @@ def pytest_sessionstart():
     settings.STRIPE_ENABLED = False
     settings.FIREBASE_ENABLED = False
     settings.FCM_FIREBASE_ENABLED = False
+    settings.NOTIFICATIONS_COALESCING_WINDOWS = {}
+    settings.ETH_PROVIDER = 'apps.utils.eth.LocalStubProvider'
+    settings.ETH_PRIVATE_KEY = '0x' + '1' * 64
+    settings.ETH_CONTRACT_ADDRESS = '0x' + '0' * 39 + '1'
     settings.DOCUSIGN.update({
         'TOKEN_EXPIRATION': 3600,
         'PRIVATE_RSA_KEY': None,
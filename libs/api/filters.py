@@ -0,0 +1,106 @@
+import typing
+
+from django.db.models import F
+from django.db.models.expressions import BaseExpression, OrderBy
+
+from rest_framework.filters import OrderingFilter
+
+__all__ = (
+    'AnnotatedOrderingFilter',
+    'get_column_ordering',
+    'get_ordering_expression',
+)
+
+
+def get_ordering_expression(
+    field: str, expression: BaseExpression = None
+) -> OrderBy:
+    """Get ordering for `ordering` param, in which empty values are smallest.
+
+    Empty values go first on ascending ordering and last on descending one,
+    the same way as python's sorting by `(value is not None, value)` key.
+
+    Combined querysets(`union()`) can't be ordered by expressions, use
+    `get_column_ordering` for them.
+
+    Arguments:
+        field: ordering param, like `title` or `-title`
+        expression: expression to order by, if not set field is used
+
+    """
+    if expression is None:
+        expression = F(field.lstrip('-'))
+    if field.startswith('-'):
+        return expression.desc(nulls_last=True)
+    return expression.asc(nulls_first=True)
+
+
+def get_column_ordering(field: str, column: str) -> str:
+    """Get ordering by column for `ordering` param of combined queryset.
+
+    Combined querysets(`union()`) can be ordered only by names of their
+    columns, so columns used for ordering shouldn't contain empty values.
+
+    Arguments:
+        field: ordering param, like `title` or `-title`
+        column: name of column to order by
+
+    """
+    if field.startswith('-'):
+        return f'-{column}'
+    return column
+
+
+class AnnotatedOrderingFilter(OrderingFilter):
+    """Ordering filter, which supports ordering by computed fields.
+
+    View can define `ordering_annotations` - map of ordering params to
+    expressions, which calculate field's value in db, or to callables, which
+    take request and return such expression. Only requested fields are
+    annotated (with `ordering_` prefix), so ordering happens in SQL before
+    pagination instead of sorting serialized page.
+
+    Example:
+
+        class InvoiceViewSet(BaseViewSet):
+            ordering_fields = ('id', 'title', 'total_amount')
+            ordering_annotations = {
+                'total_amount': Sum('billing_items__total_amount'),
+                'is_paid': lambda request: Exists(...),
+            }
+
+    """
+    annotation_prefix = 'ordering_'
+
+    def get_ordering_annotations(self, view) -> typing.Dict[str, typing.Any]:
+        """Get view's map of ordering params to expressions."""
+        return getattr(view, 'ordering_annotations', None) or {}
+
+    def get_valid_fields(self, queryset, view, context=None):
+        """Consider computed fields as valid ones."""
+        valid_fields = super().get_valid_fields(queryset, view, context or {})
+        return valid_fields + [
+            (name, name) for name in self.get_ordering_annotations(view)
+        ]
+
+    def filter_queryset(self, request, queryset, view):
+        """Annotate requested computed fields and order queryset by them."""
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+
+        ordering_annotations = self.get_ordering_annotations(view)
+        annotations = {}
+        order_by = []
+        for field in ordering:
+            name = field.lstrip('-')
+            if name not in ordering_annotations:
+                order_by.append(field)
+                continue
+            alias = f'{self.annotation_prefix}{name}'
+            expression = ordering_annotations[name]
+            if callable(expression):
+                expression = expression(request)
+            annotations[alias] = expression
+            order_by.append(get_ordering_expression(field, F(alias)))
+        return queryset.annotate(**annotations).order_by(*order_by)
@@ -1,9 +1,25 @@
+import base64
+import json
+import typing
 from collections import OrderedDict
+from datetime import date
 
-from rest_framework.pagination import LimitOffsetPagination
+from django.db.models import Q, QuerySet
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    LimitOffsetPagination,
+    _positive_int,
+)
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-__all__ = ('PageLimitOffsetPagination')
+__all__ = (
+    'PageLimitOffsetPagination',
+    'UnionKeysetPagination',
+    'get_keyset_filter',
+)
 
 
 class PageLimitOffsetPagination(LimitOffsetPagination):
@@ -24,3 +40,138 @@ class PageLimitOffsetPagination(LimitOffsetPagination):
             ('previous', self.get_previous_link()),
             ('results', data),
         ]))
+
+
+def get_keyset_filter(
+    ordering: typing.Sequence[typing.Tuple[str, bool]],
+    values: typing.Sequence[typing.Any],
+) -> Q:
+    """Get filter of rows, which go after row with `values` in ordering.
+
+    Arguments:
+        ordering: pairs of (column, is descending), which identify row
+        values: values of ordering columns of last seen row
+
+    Example:
+        >>> get_keyset_filter([('title', False), ('id', True)], ['a', 5])
+        > Q(title__gt='a') | Q(title='a', id__lt=5)
+
+    """
+    keyset_filter = Q()
+    equal = {}
+    for (column, descending), value in zip(ordering, values):
+        lookup = 'lt' if descending else 'gt'
+        keyset_filter |= Q(**equal, **{f'{column}__{lookup}': value})
+        equal[column] = value
+    return keyset_filter
+
+
+def _encode_cursor_value(value: typing.Any) -> str:
+    """Encode cursor's value, which isn't supported by json.
+
+    Unlike `DjangoJSONEncoder` microseconds of datetimes are kept, so rows
+    aren't skipped on pages' edges.
+
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Value of type `{type(value).__name__}` is not allowed')
+
+
+class UnionKeysetPagination(BasePagination):
+    """Keyset pagination for SQL UNION of querysets.
+
+    Union can't be filtered, so condition of next page is applied to each
+    queryset of union and page is fetched by one query ordered by columns,
+    which identify row. Cursor contains values of these columns of page's
+    last row.
+
+    """
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = 20
+    max_limit = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_union(
+        self,
+        querysets: typing.Sequence[QuerySet],
+        ordering: typing.Sequence[typing.Tuple[str, bool]],
+        request,
+    ) -> list:
+        """Get page of union of `values` querysets with the same columns.
+
+        Arguments:
+            querysets: querysets which are combined by union
+            ordering: pairs of (column, is descending), columns should
+                identify row and shouldn't be nullable
+            request: request with cursor and limit params
+
+        """
+        self.request = request
+        self.ordering = ordering
+        self.limit = self.get_limit(request)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            keyset_filter = get_keyset_filter(ordering, cursor)
+            querysets = [
+                queryset.filter(keyset_filter) for queryset in querysets
+            ]
+        union = querysets[0].union(*querysets[1:], all=True)
+        # Union can be ordered only by names of its columns
+        order_by = [
+            f'-{column}' if descending else column
+            for column, descending in ordering
+        ]
+        rows = list(union.order_by(*order_by)[:self.limit + 1])
+        self.has_next = len(rows) > self.limit
+        self.page = rows[:self.limit]
+        return self.page
+
+    def get_limit(self, request) -> int:
+        """Get page size from request."""
+        try:
+            return _positive_int(
+                request.query_params[self.limit_query_param],
+                strict=True,
+                cutoff=self.max_limit,
+            )
+        except (KeyError, ValueError):
+            return self.default_limit
+
+    def decode_cursor(self, request) -> typing.Optional[list]:
+        """Get values of last row of previous page from request."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def encode_cursor(self, row: dict) -> str:
+        """Get cursor of page, which goes after row."""
+        values = [row[column] for column, _ in self.ordering]
+        return base64.urlsafe_b64encode(
+            json.dumps(values, default=_encode_cursor_value).encode()
+        ).decode()
+
+    def get_next_link(self) -> typing.Optional[str]:
+        """Get url of next page."""
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('page_count', len(data)),
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
@@ -113,19 +113,19 @@ class EmailNotification:
             files=files
         )
 
-    def send(self) -> bool:
-        """Send email.
+    def get_message(self, connection=None) -> EmailMultiAlternatives:
+        """Build email message without sending it.
 
-        Returns:
-            True: if it succeeded
-            False: if it failed
-        """
+        Arguments:
+            connection: Email backend connection, which will be used to send
+                message. If not set, message will open it's own connection.
 
+        """
         email_args = self.prepare_mail_args()
         html_message = email_args.pop('html_message')
         files = email_args.pop('files')
 
-        mail = EmailMultiAlternatives(**email_args)
+        mail = EmailMultiAlternatives(connection=connection, **email_args)
         mail.attach_alternative(html_message, 'text/html')
 
         # Attach files
@@ -135,6 +135,20 @@ class EmailNotification:
                 content=file.content,
                 mimetype=file.mimetype,
             )
+        return mail
+
+    def send(self, connection=None) -> bool:
+        """Send email.
+
+        Arguments:
+            connection: Email backend connection to reuse(for example when
+                sending emails in batches).
+
+        Returns:
+            True: if it succeeded
+            False: if it failed
+        """
+        mail = self.get_message(connection=connection)
 
         # Send email
         try:
@@ -146,7 +160,7 @@ class EmailNotification:
                 return False
         except HTTPError as error:
             logger.error(
-                f'Error while sending email to {email_args["to"]}: {error}'
+                f'Error while sending email to {mail.to}: {error}'
             )
             self.on_email_send_failed(error)
             return False
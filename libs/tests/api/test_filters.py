@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from libs.api.filters import (
+    AnnotatedOrderingFilter,
+    get_column_ordering,
+    get_ordering_expression,
+)
+
+
+class UsersView:
+    """View with ordering by computed field."""
+    ordering_fields = ('email',)
+    ordering_annotations = {
+        'chats_count': lambda request: Count('chats'),
+    }
+
+
+def get_request(ordering: str) -> Request:
+    """Get request with `ordering` param."""
+    return Request(APIRequestFactory().get('/', {'ordering': ordering}))
+
+
+def test_get_ordering_expression():
+    """Test that empty values are the smallest ones."""
+    ascending = get_ordering_expression('title')
+    descending = get_ordering_expression('-title')
+
+    assert not ascending.descending and ascending.nulls_first
+    assert descending.descending and descending.nulls_last
+
+
+def test_get_column_ordering():
+    """Test that combined querysets are ordered by columns' names."""
+    assert get_column_ordering('title', 'row_title') == 'row_title'
+    assert get_column_ordering('-title', 'row_title') == '-row_title'
+
+
+def test_annotated_ordering_filter():
+    """Test that only requested computed fields are annotated."""
+    queryset = get_user_model().objects.all()
+
+    ordered = AnnotatedOrderingFilter().filter_queryset(
+        get_request('-chats_count,email'), queryset, UsersView()
+    )
+
+    assert list(ordered.query.annotations) == ['ordering_chats_count']
+    chats_count, email = ordered.query.order_by
+    assert chats_count.descending
+    assert email == 'email'
+
+
+def test_annotated_ordering_filter_invalid_field():
+    """Test that unknown fields are ignored."""
+    queryset = get_user_model().objects.all()
+
+    ordered = AnnotatedOrderingFilter().filter_queryset(
+        get_request('password'), queryset, UsersView()
+    )
+
+    assert not ordered.query.annotations
+    assert not ordered.query.order_by
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.db.models import CharField, F, Q, Value
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from libs.api.pagination import (
+    UnionKeysetPagination,
+    _encode_cursor_value,
+    get_keyset_filter,
+)
+
+
+def test_get_keyset_filter():
+    """Test that rows after last seen one are filtered by all columns."""
+    keyset_filter = get_keyset_filter(
+        [('title', False), ('id', True)], ['a', 5]
+    )
+
+    assert keyset_filter == Q(title__gt='a') | Q(title='a', id__lt=5)
+
+
+def test_encode_cursor_value():
+    """Test that microseconds of datetimes are kept in cursor."""
+    value = datetime(2020, 1, 1, 10, 30, 15, 123456)
+
+    assert _encode_cursor_value(value) == '2020-01-01T10:30:15.123456'
+
+
+def test_paginate_union():
+    """Test that pages of union are fetched from db by cursor."""
+    user_model = get_user_model()
+    users = [
+        user_model.objects.create(
+            email=f'union-pagination-{index}@example.com',
+            first_name='Union',
+            last_name='Pagination',
+            is_active=bool(index),
+        )
+        for index in range(3)
+    ]
+    querysets = [
+        user_model.objects.filter(pk__in=[user.pk for user in users]).filter(
+            is_active=is_active
+        ).annotate(
+            row_type=Value(str(is_active), output_field=CharField()),
+            row_id=F('pk'),
+        ).values('row_type', 'row_id')
+        for is_active in (True, False)
+    ]
+    ordering = [('row_type', False), ('row_id', True)]
+    paginator = UnionKeysetPagination()
+    paginator.default_limit = 2
+
+    first_page = paginator.paginate_union(
+        querysets, ordering, Request(APIRequestFactory().get('/'))
+    )
+    next_link = paginator.get_next_link()
+    second_page = paginator.paginate_union(
+        querysets, ordering, Request(APIRequestFactory().get(next_link))
+    )
+
+    expected = sorted(
+        ({'row_type': str(user.is_active), 'row_id': user.pk}
+         for user in users),
+        key=lambda row: (row['row_type'], -row['row_id']),
+    )
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
+    assert paginator.get_next_link() is None
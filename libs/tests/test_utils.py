@@ -0,0 +1,8 @@
+from ..utils import chunked
+
+
+def test_chunked():
+    """Test ``chunked`` function, should split iterable to lists with the
+    same size, except the last one"""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
@@ -0,0 +1,129 @@
+import typing
+from collections import namedtuple
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Aggregate, QuerySet
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+import arrow
+
+__all__ = (
+    'TimeSeriesPoint',
+    'get_time_series',
+    'get_cached_time_series',
+    'invalidate_cached_time_series',
+)
+
+TimeSeriesPoint = namedtuple('TimeSeriesPoint', ['date', 'value'])
+
+# Version of user's cached time series, changing it invalidates all of them
+CACHE_VERSION_KEY = 'time_series:version:{user_id}'
+CACHE_KEY = 'time_series:{name}:{user_id}:{version}:{start}:{end}:{frame}'
+
+
+def get_time_series(
+    queryset: QuerySet,
+    date_field: str,
+    aggregate: Aggregate,
+    start: datetime,
+    end: datetime,
+    time_frame: str = 'month',
+    default: typing.Any = 0,
+) -> typing.List[TimeSeriesPoint]:
+    """Calculate aggregate of queryset for period divided by time frame.
+
+    All buckets are calculated with single `GROUP BY date_trunc` query, empty
+    buckets are filled with `default`. Buckets are dates of
+    `arrow.Arrow.range` from `start` to `end` in current timezone and each of
+    them covers whole time frame (from floor to ceil) of its date.
+
+    Arguments:
+        queryset: qs of aggregated instances
+        date_field: date or datetime field, by which instances are bucketed
+        aggregate: aggregate expression, like `Sum('count')`
+        start: start of period
+        end: end of period
+        time_frame: `year`, `quarter`, `month`, `week` or `day`
+        default: value of empty buckets
+
+    """
+    current_timezone = timezone.get_current_timezone()
+    start = arrow.get(start).to(current_timezone)
+    end = arrow.get(end).to(current_timezone)
+    dates = list(arrow.Arrow.range(time_frame, start, end))
+    if not dates:
+        return []
+
+    values = queryset.filter(**{
+        f'{date_field}__gte': dates[0].floor(time_frame).datetime,
+        f'{date_field}__lte': dates[-1].ceil(time_frame).datetime,
+    }).annotate(
+        bucket=Trunc(date_field, time_frame)
+    ).order_by().values('bucket').annotate(
+        value=aggregate
+    ).values_list('bucket', 'value')
+    buckets = {
+        _get_bucket_date(bucket): value for bucket, value in values
+    }
+
+    time_series = []
+    for range_date in dates:
+        value = buckets.get(range_date.floor(time_frame).date())
+        time_series.append(TimeSeriesPoint(
+            date=range_date.datetime,
+            value=default if value is None else value,
+        ))
+    return time_series
+
+
+def _get_bucket_date(bucket: typing.Union[date, datetime]) -> date:
+    """Get date of bucket returned by `Trunc`."""
+    if isinstance(bucket, datetime):
+        return timezone.localtime(bucket).date()
+    return bucket
+
+
+def get_cached_time_series(
+    name: str,
+    user_id: int,
+    start: datetime,
+    end: datetime,
+    time_frame: str,
+    calculate: typing.Callable[[], typing.Any],
+) -> typing.Any:
+    """Get time series result for user from cache or calculate and cache it.
+
+    Results are cached per (name, user, period, time frame) for
+    `TIME_SERIES_CACHE_TIMEOUT` seconds and are dropped earlier by
+    `invalidate_cached_time_series`.
+
+    """
+    version = cache.get(CACHE_VERSION_KEY.format(user_id=user_id), 0)
+    key = CACHE_KEY.format(
+        name=name,
+        user_id=user_id,
+        version=version,
+        start=arrow.get(start).isoformat(),
+        end=arrow.get(end).isoformat(),
+        frame=time_frame,
+    )
+    result = cache.get(key)
+    if result is None:
+        result = calculate()
+        cache.set(key, result, settings.TIME_SERIES_CACHE_TIMEOUT)
+    return result
+
+
+def invalidate_cached_time_series(*users_ids: int):
+    """Drop cached time series of users.
+
+    Version of user's cached results is changed, so old ones are not used
+    anymore and expire by timeout.
+
+    """
+    for user_id in set(users_ids):
+        key = CACHE_VERSION_KEY.format(user_id=user_id)
+        cache.set(key, cache.get(key, 0) + 1, None)
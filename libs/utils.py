@@ -4,10 +4,11 @@ import os
 import re
 import uuid
 from datetime import datetime
+from itertools import islice
 from shutil import make_archive
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from time import mktime
-from typing import Any, Type
+from typing import Any, Iterable, Iterator, List, Type
 
 from django.utils.safestring import mark_safe
 
@@ -260,6 +261,21 @@ def invalidate_cached_property(instance: Any, property_name: str):
         pass
 
 
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """Split iterable into lists with at most `size` items.
+
+    Example:
+        >>> list(chunked(range(5), 2))
+        > [[0, 1], [2, 3], [4]]
+
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
 def get_latest_version(changelog_filepath: str) -> str:
     """Get latest version from changelog file.
 
@@ -23,9 +23,15 @@ def beat(context):
 def worker(context):
     """Start celery worker."""
     if is_local_python:
-        context.run('celery worker --app config.celery:app -l info')
+        context.run(
+            'celery worker --app config.celery:app -l info '
+            '-Q celery,blockchain'
+        )
     else:
-        docker.up_containers(context, containers=['celery_worker'])
+        docker.up_containers(
+            context,
+            containers=['celery_worker', 'celery_blockchain_worker'],
+        )
 
 
 @task()